@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark turns of games with many cats and mice (occupancy index) as agents and board grow.
+Run from project root:
+    PYTHONPATH=src python3 scripts/bench_agents.py [--configs 300x300:100:900] [--turns N]
+Each config is ROWSxCOLS:CATS:MICE; reports create_game time and apply_move latency.
+"""
+import argparse
+import random
+import sys
+import time
+
+from catgame.game.turn import apply_move
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.placement.placement import create_game
+
+DEFAULT_CONFIGS = "100x100:10:90,300x300:100:900,1000x1000:100:900,1000x1000:500:500"
+
+
+def _config(text: str) -> tuple[int, int, int, int]:
+    size, cats, mice = text.split(":")
+    rows, _, cols = size.lower().partition("x")
+    return int(rows), int(cols), int(cats), int(mice)
+
+
+def _ms(secs: float) -> str:
+    return f"{secs * 1e3:9.3f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="apply_move latency with many agents")
+    parser.add_argument(
+        "--configs", default=DEFAULT_CONFIGS,
+        help=f"Comma-separated ROWSxCOLS:CATS:MICE (default {DEFAULT_CONFIGS})",
+    )
+    parser.add_argument("--turns", type=int, default=200, help="Turns measured per config")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mouse-ai", choices=MOUSE_AI_MODES, default="manhattan", help="Mouse distance measure"
+    )
+    args = parser.parse_args()
+
+    print(f"{'config':>22} {'gen ms':>9} {'turn mean':>9} {'p50':>9} {'p99':>9} {'max':>9}  caught")
+    for rows, cols, cats, mice in (_config(c) for c in args.configs.split(",")):
+        start = time.perf_counter()
+        state = create_game(args.seed, args.mouse_ai, rows, cols, cats, mice)
+        gen = time.perf_counter() - start
+        rng = random.Random(args.seed)
+        times: list[float] = []
+        for _ in range(args.turns):
+            direction = rng.choice(("up", "down", "left", "right"))
+            start = time.perf_counter()
+            result = apply_move(state, direction)
+            times.append(time.perf_counter() - start)
+            state = result.state
+            if state.status != "playing":
+                break
+        times.sort()
+        print(
+            f"{rows:>5}x{cols:<5}:{cats:>5}:{mice:<5} {_ms(gen)} {_ms(sum(times) / len(times))}"
+            f" {_ms(times[len(times) // 2])}"
+            f" {_ms(times[min(len(times) - 1, int(len(times) * 0.99))])}"
+            f" {_ms(times[-1])}  {state.occupancy.caught}/{mice}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Benchmark batch_apply_moves against looping the scalar apply_move.
+Run from project root: PYTHONPATH=src python3 scripts/bench_batch.py [--games N] [--steps K]
+Checks the final states agree. Expect roughly x10-15 at 10k games, not x100.
+"""
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+
+from catgame.game.batch import DIRECTIONS, BatchGameState, batch_apply_moves
+from catgame.game.turn import apply_move
+from catgame.placement.placement import create_game
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="NumPy batch stepping benchmark")
+    parser.add_argument("--games", type=int, default=10_000, help="Games advanced in lockstep")
+    parser.add_argument("--steps", type=int, default=20, help="Turns per game")
+    parser.add_argument(
+        "--scalar-games", type=int, default=1_000, help="Games for the scalar loop (extrapolated)"
+    )
+    args = parser.parse_args()
+
+    states = [create_game(seed) for seed in range(args.games)]
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 4, size=(args.steps, args.games))
+
+    batch = BatchGameState.from_states(states)
+    start = time.perf_counter()
+    for step in range(args.steps):
+        batch = batch_apply_moves(batch, codes[step]).state
+    batch_secs = time.perf_counter() - start
+
+    n_scalar = min(args.scalar_games, args.games)
+    scalar = states[:n_scalar]
+    start = time.perf_counter()
+    for step in range(args.steps):
+        scalar = [
+            apply_move(s, DIRECTIONS[c]).state for s, c in zip(scalar, codes[step, :n_scalar])
+        ]
+    scalar_secs = time.perf_counter() - start
+
+    turns = args.games * args.steps
+    batch_rate = turns / batch_secs
+    scalar_rate = n_scalar * args.steps / scalar_secs
+    print(f"batch   {args.games} games x {args.steps} steps: {batch_secs:.3f} s  "
+          f"({batch_rate:,.0f} turns/s)")
+    print(f"scalar  {n_scalar} games x {args.steps} steps: {scalar_secs:.3f} s  "
+          f"({scalar_rate:,.0f} turns/s)")
+    print(f"speedup x{batch_rate / scalar_rate:.0f}")
+
+    for i in random.Random(1).sample(range(n_scalar), min(50, n_scalar)):
+        b, s = batch.to_state(i), scalar[i]
+        if (b.cat.position, b.mouse.position, b.grid.bits, b.status) != (
+            s.cat.position, s.mouse.position, s.grid.bits, s.status
+        ):
+            print(f"MISMATCH in game {i}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark game generation and turn latency as the board grows (up to 1000x1000 and beyond).
+Run from project root:
+    PYTHONPATH=src python3 scripts/bench_board_size.py [--sizes 20x30,1000x1000] [--turns N]
+Reports create_game time, apply_move latency and peak RSS per board size.
+"""
+import argparse
+import random
+import resource
+import sys
+import time
+
+from catgame.game.turn import apply_move
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.placement.placement import create_game
+from catgame.sim.policies import greedy_policy
+
+DEFAULT_SIZES = "20x30,100x100,300x300,1000x1000"
+
+
+def _size(text: str) -> tuple[int, int]:
+    rows, _, cols = text.lower().partition("x")
+    return int(rows), int(cols)
+
+
+def _pct(sorted_values: list[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _ms(secs: float) -> str:
+    return f"{secs * 1e3:9.3f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="create_game and apply_move latency by board size")
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES,
+        help=f"Comma-separated ROWSxCOLS (default {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--seeds", type=int, default=3, help="Games generated (and played) per size"
+    )
+    parser.add_argument("--turns", type=int, default=200, help="Turns measured per game")
+    parser.add_argument(
+        "--mouse-ai", choices=MOUSE_AI_MODES, default="manhattan", help="Mouse distance measure"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'board':>11} {'gen ms':>9} {'turn mean':>9} {'p50':>9} {'p99':>9} {'max':>9}"
+        f" {'reshuffle p99':>13}  peak RSS"
+    )
+    for rows, cols in (_size(s) for s in args.sizes.split(",")):
+        gens: list[float] = []
+        turns: list[float] = []
+        reshuffles: list[float] = []
+        for seed in range(args.seeds):
+            start = time.perf_counter()
+            state = create_game(seed, args.mouse_ai, rows, cols)
+            gens.append(time.perf_counter() - start)
+            rng = random.Random(seed)
+            for _ in range(args.turns):
+                direction = greedy_policy(state, rng)
+                if direction is None:
+                    break
+                start = time.perf_counter()
+                result = apply_move(state, direction)
+                elapsed = time.perf_counter() - start
+                turns.append(elapsed)
+                if result.state.grid is not state.grid:
+                    reshuffles.append(elapsed)
+                state = result.state
+                if state.status != "playing":
+                    break
+        turns.sort()
+        reshuffles.sort()
+        rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(
+            f"{rows:>5}x{cols:<5} {_ms(sorted(gens)[len(gens) // 2])}"
+            f" {_ms(sum(turns) / len(turns))}"
+            f" {_ms(_pct(turns, 0.5))} {_ms(_pct(turns, 0.99))} {_ms(turns[-1])}"
+            f" {_ms(_pct(reshuffles, 0.99)) if reshuffles else '        -':>13}  {rss_mb:6.0f} MB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
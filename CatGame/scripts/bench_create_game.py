@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark create_game latency per seed: p50 / p99 / max, against the old rejection sampler.
+Run from project root:
+    PYTHONPATH=src python3 scripts/bench_create_game.py [--seeds N] [--reference-seeds M]
+Compares against the old rejection sampler; --check verifies every game.
+"""
+import argparse
+import random
+import sys
+import time
+
+from catgame.models import COLS, ROWS, Position
+from catgame.models.bitboard import Geometry, geometry
+from catgame.placement.placement import create_game
+
+
+def _has_move(geo: Geometry, pos: Position, blocked: int, other: Position) -> bool:
+    """pos has a neighbor that is neither blocked nor other."""
+    return geo.neighbor_mask[geo.index(pos)] & ~(blocked | geo.bit(other)) != 0
+
+
+def _joined(geo: Geometry, a: Position, b: Position, blocked: int) -> bool:
+    return geo.connected(geo.index(a), geo.index(b), blocked)
+
+
+def _create_game_rejection(seed: int) -> tuple[int, Position, Position]:
+    """Reference: the rejection-sampling layout generator (returns blocked bits, cat, mouse)."""
+    rng = random.Random(seed)
+    geo = geometry(ROWS, COLS)
+    for _ in range(5000):
+        n_cells = ROWS * COLS
+        n_obstacles = rng.randint(max(1, n_cells // 10), max(2, n_cells // 5))
+        obstacle_set: set[Position] = set()
+        while len(obstacle_set) < n_obstacles:
+            obstacle_set.add(Position.at(rng.randint(0, ROWS - 1), rng.randint(0, COLS - 1)))
+        blocked = geo.bits_of(obstacle_set)
+        empty = geo.positions_of(geo.full & ~blocked)
+        rng.shuffle(empty)
+        if len(empty) < 2:
+            continue
+        cat_pos, mouse_pos = empty[0], empty[1]
+        if not _has_move(geo, cat_pos, blocked, mouse_pos):
+            continue
+        if not _has_move(geo, mouse_pos, blocked, cat_pos):
+            continue
+        if not _joined(geo, cat_pos, mouse_pos, blocked):
+            continue
+        return blocked, cat_pos, mouse_pos
+    raise RuntimeError("Could not generate playable layout within max_attempts")
+
+
+def _latencies(fn, seeds: range) -> list[int]:
+    out = []
+    clock = time.perf_counter_ns
+    for seed in seeds:
+        start = clock()
+        fn(seed)
+        out.append(clock() - start)
+    out.sort()
+    return out
+
+
+def _report(label: str, ns: list[int]) -> None:
+    def pct(p: float) -> float:
+        return ns[min(len(ns) - 1, int(p * len(ns)))] / 1e3
+
+    mean = sum(ns) / len(ns) / 1e3
+    print(
+        f"{label:<10} n={len(ns):<7} p50 {pct(0.50):8.1f} us   p99 {pct(0.99):8.1f} us   "
+        f"max {ns[-1] / 1e3:8.1f} us   mean {mean:8.1f} us"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="create_game latency distribution")
+    parser.add_argument("--seeds", type=int, default=100_000, help="Seeds for create_game")
+    parser.add_argument(
+        "--reference-seeds", type=int, default=10_000,
+        help="Seeds for the rejection reference (0 = skip)",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Verify playability of every generated game"
+    )
+    args = parser.parse_args()
+
+    _report("create", _latencies(create_game, range(args.seeds)))
+    if args.reference_seeds:
+        _report("rejection", _latencies(_create_game_rejection, range(args.reference_seeds)))
+    if args.check:
+        for seed in range(args.seeds):
+            state = create_game(seed)
+            blocked, cat, mouse = state.grid.bits, state.cat.position, state.mouse.position
+            geo = state.grid.geometry
+            assert cat != mouse
+            assert not state.grid.is_blocked(cat) and not state.grid.is_blocked(mouse)
+            assert _has_move(geo, cat, blocked, mouse) and _has_move(geo, mouse, blocked, cat)
+            assert _joined(geo, cat, mouse, blocked), seed
+        print(f"check      {args.seeds} games playable")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark environment throughput in env steps per second.
+Run from project root:
+    PYTHONPATH=src python3 scripts/bench_env.py [--envs N] [--steps N] [--workers 1,2,4]
+Compares the CLI over pipes, one CatEnv, and VectorEnv per worker count.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from catgame.env import CatEnv, VectorEnv
+
+
+def _cli(steps: int) -> float:
+    """A bot in lockstep with the CLI: send a move, wait for and parse the reply."""
+    rng = random.Random(0)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "catgame.cli", "--seed", "0", "--json=delta"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, env=env,
+    )
+    json.loads(proc.stdout.readline())
+    start = time.perf_counter()
+    for _ in range(steps):
+        # An invalid move only answers on stderr, so each move is followed by `state`:
+        # a delta line (if the move was valid), then the keyframe that ends the step
+        proc.stdin.write(rng.choice(("up", "down", "left", "right")) + "\nstate\n")
+        proc.stdin.flush()
+        obj = json.loads(proc.stdout.readline())
+        if obj["type"] == "delta":
+            obj = json.loads(proc.stdout.readline())
+        if obj["status"] == "won":
+            proc.stdin.write("new\n")
+            proc.stdin.flush()
+            proc.stdout.readline()
+    secs = time.perf_counter() - start
+    proc.communicate("quit\n")
+    return steps / secs
+
+
+def _single(steps: int) -> float:
+    env = CatEnv()
+    env.reset(0)
+    rng = random.Random(0)
+    seed = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, terminated, truncated, _ = env.step(rng.randrange(4))
+        if terminated or truncated:
+            seed += 1
+            env.reset(seed)
+    return steps / (time.perf_counter() - start)
+
+
+def _vector(n: int, steps: int, workers: int) -> float:
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 4, (steps, n), dtype=np.int8)
+    with VectorEnv(n, workers=workers) as vec:
+        vec.reset(0)
+        start = time.perf_counter()
+        for row in actions:
+            vec.step(row)
+        secs = time.perf_counter() - start
+    return n * steps / secs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Environment steps per second")
+    parser.add_argument("--envs", type=int, default=64, help="Envs per VectorEnv")
+    parser.add_argument(
+        "--steps", type=int, default=300, help="Vector steps (single env and CLI: envs * steps / 4)"
+    )
+    parser.add_argument(
+        "--workers", default="1,2,4", help="Comma-separated worker counts for VectorEnv"
+    )
+    args = parser.parse_args()
+
+    single_steps = args.envs * args.steps // 4
+    print(f"cpus {os.cpu_count()}")
+    print(f"{'cli pipe (lockstep)':>24} {_cli(min(single_steps, 5000)):12.0f} steps/s")
+    print(f"{'CatEnv':>24} {_single(single_steps):12.0f} steps/s")
+    for workers in (int(w) for w in args.workers.split(",")):
+        label = f"VectorEnv({args.envs}) w={workers}"
+        print(f"{label:>24} {_vector(args.envs, args.steps, workers):12.0f} steps/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
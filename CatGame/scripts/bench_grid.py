@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark grid occupancy: frozenset[Position] reference vs the bitboard-backed Grid.
+Run from project root: PYTHONPATH=src python3 scripts/bench_grid.py [--turns N]
+Compares move generation and placement BFS, then prints headless turns/second.
+"""
+import argparse
+import sys
+import time
+from collections import deque
+
+from catgame.game.moves import DIRECTION_DELTA, get_valid_moves
+from catgame.game.turn import apply_move
+from catgame.models import COLS, ROWS, Position
+from catgame.placement.placement import create_game
+
+
+def _valid_moves_set(current: Position, obstacles: frozenset, other: Position | None) -> list:
+    """Reference: the frozenset-based move generation the bitboard replaced."""
+    out = []
+    for dr, dc in DIRECTION_DELTA.values():
+        r, c = current.row + dr, current.col + dc
+        if not (0 <= r < ROWS and 0 <= c < COLS):
+            continue
+        pos = Position(r, c)
+        if pos in obstacles or pos == other:
+            continue
+        out.append(pos)
+    return out
+
+
+def _path_exists_set(start: Position, goal: Position, obstacles: frozenset) -> bool:
+    """Reference: the frozenset-based BFS the bitboard flood fill replaced."""
+    if start == goal:
+        return True
+    seen = {start}
+    q = deque([start])
+    while q:
+        p = q.popleft()
+        for dr, dc in DIRECTION_DELTA.values():
+            r, c = p.row + dr, p.col + dc
+            if not (0 <= r < ROWS and 0 <= c < COLS):
+                continue
+            n = Position(r, c)
+            if n == goal:
+                return True
+            if n not in obstacles and n not in seen:
+                seen.add(n)
+                q.append(n)
+    return False
+
+
+def _time_per_call(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def _direction(fr: Position, to: Position) -> str:
+    if to.row < fr.row:
+        return "up"
+    if to.row > fr.row:
+        return "down"
+    if to.col < fr.col:
+        return "left"
+    return "right"
+
+
+def simulate(turns: int) -> tuple[int, int, float]:
+    """Play greedy-cat games back to back until `turns` turns; return (turns, games, seconds)."""
+    played = 0
+    games = 0
+    seed = 0
+    start = time.perf_counter()
+    while played < turns:
+        state = create_game(seed)
+        seed += 1
+        games += 1
+        for _ in range(2000):
+            if state.status != "playing" or played >= turns:
+                break
+            cat = state.cat.position
+            mouse = state.mouse.position
+            moves = get_valid_moves(state, "cat")
+            if not moves:
+                break  # cat boxed in by a reshuffle
+            best = min(moves, key=lambda p: (p.manhattan_distance(mouse), p.row, p.col))
+            state = apply_move(state, _direction(cat, best)).state
+            played += 1
+    return played, games, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bitboard Grid benchmark")
+    parser.add_argument(
+        "--turns", type=int, default=1_000_000, help="Turns in the headless simulation"
+    )
+    parser.add_argument("--calls", type=int, default=20_000, help="Calls per micro-benchmark")
+    args = parser.parse_args()
+
+    state = create_game(7)
+    grid = state.grid
+    cat, mouse = state.cat.position, state.mouse.position
+
+    set_moves = _time_per_call(lambda: _valid_moves_set(mouse, grid.obstacles, cat), args.calls)
+    bit_moves = _time_per_call(lambda: get_valid_moves(state, "mouse"), args.calls)
+    print(f"get_valid_moves   frozenset {set_moves * 1e6:8.2f} us"
+          f"   bitboard {bit_moves * 1e6:8.2f} us   x{set_moves / bit_moves:.1f}")
+
+    corner = Position(ROWS - 1, COLS - 1)
+    far = corner if not grid.is_blocked(corner) else mouse
+    calls = max(1, args.calls // 20)
+    set_bfs = _time_per_call(lambda: _path_exists_set(Position(0, 0), far, grid.obstacles), calls)
+    geo = grid.geometry
+    bit_bfs = _time_per_call(lambda: geo.connected(0, geo.index(far), grid.bits), calls)
+    print(f"path BFS          frozenset {set_bfs * 1e6:8.2f} us   bitboard {bit_bfs * 1e6:8.2f} us"
+          f"   x{set_bfs / bit_bfs:.1f}")
+
+    played, games, secs = simulate(args.turns)
+    print(f"simulation        {played} turns / {games} games in {secs:.2f} s"
+          f"   ({played / secs:,.0f} turns/s, {secs / played * 1e6:.1f} us/turn)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark pygame frame time: primitive drawing vs the sprite atlas (full and dirty frames).
+Run from project root: PYTHONPATH=src python3 scripts/bench_render.py [--frames N] [--cell-size PX]
+Renders a recorded game off-screen: primitives, atlas, and dirty-cell frames.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from catgame.game.turn import apply_move
+from catgame.gui import pygame_ui
+from catgame.models import COLS, ROWS
+from catgame.placement.placement import create_game
+
+
+def _game(turns: int) -> list:
+    """States of random-move games, restarted on a win, until there are turns + 1 of them."""
+    rng = random.Random(0)
+    seed = 0
+    state = create_game(seed)
+    states = [state]
+    while len(states) <= turns:
+        result = apply_move(state, rng.choice(["up", "down", "left", "right"]))
+        if not result.success:
+            continue
+        state = result.state
+        if state.status == "won":
+            seed += 1
+            state = create_game(seed)
+        states.append(state)
+    return states
+
+
+def _time(label: str, frames: int, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    ms = (time.perf_counter() - start) / frames * 1e3
+    print(f"{label:<10} {ms:8.3f} ms/frame")
+    return ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="pygame frame time with and without the sprite atlas"
+    )
+    parser.add_argument("--frames", type=int, default=300, help="Frames (turns) to render")
+    parser.add_argument(
+        "--cell-size", type=int, default=pygame_ui.CELL_SIZE, help="Cell size in pixels"
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+    cell_size = args.cell_size
+    surface = pygame.Surface((COLS * cell_size + 1, ROWS * cell_size + 1))
+    states = _game(args.frames)
+
+    start = time.perf_counter()
+    atlas = pygame_ui.SpriteAtlas(cell_size)
+    print(f"{'build':<10} {(time.perf_counter() - start) * 1e3:8.3f} ms (once per cell size)")
+
+    def uncached() -> None:
+        for state in states[1:]:
+            surface.fill(pygame_ui.COLOR_EMPTY)
+            pygame_ui._draw_grid_uncached(surface, state, cell_size)
+
+    def cached() -> None:
+        for state in states[1:]:
+            pygame_ui._draw_grid(surface, state, atlas)
+
+    def dirty() -> None:
+        pygame_ui._draw_grid(surface, states[0], atlas)
+        for prev, state in zip(states, states[1:]):
+            pygame_ui._draw_dirty(surface, prev, state, atlas)
+
+    base = _time("uncached", args.frames, uncached)
+    full = _time("atlas", args.frames, cached)
+    inc = _time("dirty", args.frames, dirty)
+    print(f"speedup    atlas {base / full:.1f}x, dirty {base / inc:.1f}x")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark replay records: size per game, seek latency, bulk header scans.
+Run from project root:
+    PYTHONPATH=src python3 scripts/bench_replay.py [--games N] [--moves N] [--archive N]
+Reports bytes per game, seek latency and header scan rate.
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from catgame.cli.stream import JsonStream
+from catgame.game.turn import apply_move
+from catgame.placement.placement import create_game
+from catgame.replay.log import DEFAULT_INTERVAL, Recorder, Replay, iter_replays
+
+
+def _record(seed: int, moves: int, interval: int) -> tuple[bytes, int]:
+    """One random game as a replay record, and the size of its JSON state stream."""
+    state = create_game(seed)
+    recorder = Recorder(state, interval)
+    rng = random.Random(seed)
+    out = io.StringIO()
+    stream = JsonStream()
+    with redirect_stdout(out):
+        stream.keyframe(state)
+        for _ in range(moves):
+            direction = rng.choice(("up", "down", "left", "right"))
+            result = apply_move(state, direction)
+            if not result.success:
+                continue
+            state = result.state
+            recorder.record(direction, state)
+            stream.update(state)
+            if state.status == "won":
+                break
+    return recorder.to_bytes(), len(out.getvalue().encode())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay record size, seek and bulk scan")
+    parser.add_argument("--games", type=int, default=20, help="Games recorded")
+    parser.add_argument("--moves", type=int, default=300, help="Move attempts per game")
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL, help="Keyframe interval")
+    parser.add_argument(
+        "--archive", type=int, default=1_000_000, help="Records in the bulk scan archive"
+    )
+    args = parser.parse_args()
+
+    records = []
+    json_bytes = 0
+    for seed in range(args.games):
+        data, size = _record(seed, args.moves, args.interval)
+        records.append(data)
+        json_bytes += size
+    replays = [Replay(data) for data in records]
+    turns = sum(r.turns for r in replays)
+    raw = sum(map(len, records))
+    print(f"games {args.games}, moves {turns} ({turns / args.games:.0f} per game)")
+    print(f"replay  {raw / args.games:10.0f} B/game  {raw * 8 / turns:6.2f} bits/move")
+    print(f"json    {json_bytes / args.games:10.0f} B/game  ({json_bytes / raw:.0f}x larger)")
+
+    for replay in replays:
+        replay.start()  # both paths share the cached turn-0 state
+    start = time.perf_counter()
+    for replay in replays:
+        replay.seek(replay.turns)
+    seek = (time.perf_counter() - start) / args.games
+    start = time.perf_counter()
+    for replay in replays:
+        for _ in replay.states():
+            pass
+    full = (time.perf_counter() - start) / args.games
+    print(
+        f"seek to end {seek * 1e3:8.2f} ms   replay from 0 {full * 1e3:8.2f} ms"
+        f"   ({full / seek:.0f}x)"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "archive.rpl")
+        with open(path, "wb") as f:
+            blob = b"".join(records)
+            for _ in range(args.archive // args.games):
+                f.write(blob)
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        count = won = moves = 0
+        for replay in iter_replays([path]):
+            count += 1
+            won += replay.status == "won"
+            moves += replay.turns
+        secs = time.perf_counter() - start
+    print(
+        f"scan {count} records ({size / 1e6:.0f} MB) in {secs:.2f} s:"
+        f" {count / secs / 1e6:.2f} M records/s, {won} won, {moves} moves"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark --script batch mode against the line-oriented command loop.
+Run from project root:
+    PYTHONPATH=src python3 scripts/bench_script.py [--games N] [--moves N] [--json MODE]
+Compares run_loop with run_script and checks both end every game alike.
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+
+from catgame.cli.commands import run_loop, run_script
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _time(fn, scripts: list[str], keep_last: bool) -> tuple[float, list[str]]:
+    """Seconds for fn over every script (fed as stdin), and with keep_last the last output
+    line of each, from an untimed second run.
+    """
+    last = []
+    elapsed = 0.0
+    with open(os.devnull, "w") as null, redirect_stderr(null):
+        for text in scripts:
+            sys.stdin = io.StringIO(text)
+            buf = io.StringIO()
+            start = time.perf_counter()
+            with redirect_stdout(null):
+                fn()
+            elapsed += time.perf_counter() - start
+            if keep_last:
+                sys.stdin = io.StringIO(text)
+                with redirect_stdout(buf):
+                    fn()
+                last.append(buf.getvalue().splitlines()[-1])
+    sys.stdin = sys.__stdin__
+    return elapsed, last
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="--script batch mode vs line-by-line play")
+    parser.add_argument("--games", type=int, default=200, help="Move sequences played")
+    parser.add_argument("--moves", type=int, default=200, help="Commands per sequence")
+    parser.add_argument(
+        "--json", default="full", choices=("full", "delta", "text"), help="Output format"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    scripts = [
+        "\n".join(rng.choice(DIRECTIONS) for _ in range(args.moves)) + "\n"
+        for _ in range(args.games)
+    ]
+    use_json = args.json != "text"
+    mode = args.json if use_json else "full"
+    seed = 7
+
+    def loop() -> None:
+        run_loop(seed, use_json=use_json, json_mode=mode)
+
+    def script(every: int = 0, events: bool = False):
+        return lambda: run_script(
+            "-", seed, use_json=use_json, json_mode=mode, every=every, events=events
+        )
+
+    # The loop only ends on a full JSON line in full mode; compare final states there
+    compare = use_json and mode == "full"
+    base, base_last = _time(loop, scripts, compare)
+    print(f"{args.games} sequences x {args.moves} commands, output {args.json}")
+    print(f"run_loop            {base:7.3f} s  {args.games / base:8.0f} sequences/s")
+    runs = (
+        ("--script", script()),
+        ("--script --every 10", script(10)),
+        ("--script --events", script(events=True)),
+    )
+    for label, fn in runs:
+        secs, last = _time(fn, scripts, compare and label == "--script")
+        print(
+            f"{label:<19} {secs:7.3f} s  {args.games / secs:8.0f} sequences/s  x{base / secs:.1f}"
+        )
+        if compare and label == "--script" and last != base_last:
+            print("MISMATCH: final states differ", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
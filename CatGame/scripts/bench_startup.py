@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark CLI cold start: time to the first JSON state line, and what gets imported.
+Run from project root: PYTHONPATH=src python3 scripts/bench_startup.py [--runs N] [--budget-ms MS]
+Exits 1 if the median start is over --budget-ms or a mode-only module was imported.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+FORBIDDEN = (
+    "curses", "termios", "tty", "pygame",
+    "catgame.cli.curses_ui", "catgame.gui.pygame_ui", "catgame.par.index", "catgame.replay.log",
+)
+
+
+def _env() -> dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    return env
+
+
+def _first_line(cmd: list[str], env: dict[str, str]) -> float:
+    """Seconds from spawning cmd to its first stdout line; then ends it with "quit"."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env
+    )
+    proc.stdout.readline()
+    elapsed = time.perf_counter() - start
+    proc.communicate(b"quit\n")
+    return elapsed
+
+
+def _imports(cmd: list[str], env: dict[str, str]) -> list[tuple[str, int, int]]:
+    """(module, self us, cumulative us) for every import of one run under -X importtime."""
+    proc = subprocess.run(
+        [cmd[0], "-X", "importtime", *cmd[1:]],
+        input=b"quit\n", capture_output=True, env=env, check=True,
+    )
+    rows = []
+    for line in proc.stderr.decode().splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, total, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(own), int(total)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CLI cold start to first JSON state")
+    parser.add_argument("--runs", type=int, default=30, help="Timed process starts per command")
+    parser.add_argument("--seed", type=int, default=1, help="Game seed")
+    parser.add_argument(
+        "--budget-ms", type=float, default=60.0,
+        help="Fail if the median start exceeds a bare interpreter's by more than this",
+    )
+    parser.add_argument("--top", type=int, default=12, help="Slowest imports listed")
+    args = parser.parse_args()
+
+    env = _env()
+    cmd = [sys.executable, "-m", "catgame.cli", "--seed", str(args.seed), "--json"]
+    bare = [sys.executable, "-c", "print()"]
+    _first_line(cmd, env)  # warm-up: writes bytecode
+    cli_times, bare_times = [], []
+    for _ in range(args.runs):  # interleaved so load drift hits both alike
+        cli_times.append(_first_line(cmd, env))
+        bare_times.append(_first_line(bare, env))
+    cli_ms = statistics.median(cli_times) * 1e3
+    bare_ms = statistics.median(bare_times) * 1e3
+    print(f"bare interpreter  {bare_ms:7.1f} ms  (median of {args.runs})")
+    print(f"first JSON state  {cli_ms:7.1f} ms  (min {min(cli_times) * 1e3:.1f})")
+    print(f"over bare         {cli_ms - bare_ms:7.1f} ms  (budget {args.budget_ms:.0f})")
+
+    rows = _imports(cmd, env)
+    names = {name for name, _, _ in rows}
+    ours = sum(own for name, own, _ in rows if name.startswith("catgame"))
+    total = sum(own for _, own, _ in rows)
+    print(f"\nimports {len(rows)} modules, {total / 1e3:.1f} ms; catgame.* {ours / 1e3:.1f} ms")
+    for name, own, total in sorted(rows, key=lambda row: -row[1])[:args.top]:
+        print(f"  {own / 1e3:6.2f} ms self  {total / 1e3:6.2f} ms cumulative  {name}")
+
+    failed = False
+    loaded = [name for name in FORBIDDEN if name in names]
+    if loaded:
+        print(f"FAIL: --json mode imported {', '.join(loaded)}", file=sys.stderr)
+        failed = True
+    if cli_ms - bare_ms > args.budget_ms:
+        print(
+            f"FAIL: start is {cli_ms - bare_ms:.1f} ms over bare, budget {args.budget_ms:.0f} ms",
+            file=sys.stderr,
+        )
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark GameState.key against hashing the obstacle frozenset, across obstacle counts.
+Run from project root: PYTHONPATH=src python3 scripts/bench_state_key.py [--calls N]
+Compares against hashing the obstacle frozenset; the Zobrist columns should stay flat.
+"""
+import argparse
+import random
+import sys
+import time
+
+from catgame.models import Cat, GameState, Grid, Mouse
+from catgame.models.bitboard import geometry
+from catgame.models.zobrist import zobrist_hash, zobrist_keys
+from catgame.placement.placement import RESHUFFLE_MAX
+
+COUNTS = (0, 30, 60, 120, 240, 480)
+
+
+def _best_per_call(fn, calls: int, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Zobrist state key vs frozenset hashing by obstacle count"
+    )
+    parser.add_argument("--calls", type=int, default=20_000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    geo = geometry()
+    keys = zobrist_keys(geo.size)
+    rng = random.Random(0)
+    print(f"{'obstacles':>9}  {'move key':>10}  {'reshuffle key':>13}  {'frozenset hash':>14}")
+    for count in COUNTS:
+        cells = rng.sample(range(geo.size), count + 2)
+        bits = sum(1 << j for j in cells[2:])
+        grid = Grid.from_bits(bits)
+        cat, mouse = Cat(geo.positions[cells[0]]), Mouse(geo.positions[cells[1]])
+        parent = GameState(grid, cat, mouse, seed=0, status="playing")
+        parent.key
+        # One turn later: cat and mouse on neighboring cells, same grid
+        cat2 = Cat(geo.positions[geo.neighbors[cells[0]][0][1]])
+        mouse2 = Mouse(geo.positions[geo.neighbors[cells[1]][0][1]])
+
+        child = GameState(grid, cat2, mouse2, seed=0, status="playing")
+
+        def move_key() -> int:
+            child._key = None
+            child.inherit_key(parent)
+            return child.key
+
+        # Reshuffle: lift RESHUFFLE_MAX obstacles, drop them on free cells
+        moved = min(RESHUFFLE_MAX, count)
+        lifted = sum(1 << j for j in cells[2 : 2 + moved])
+        free = [j for j in range(geo.size) if not (bits >> j) & 1 and j not in cells[:2]]
+        dropped = sum(1 << j for j in free[:moved])
+        grid2 = grid.with_obstacles(bits & ~lifted | dropped)
+        delta = bits ^ grid2.bits
+
+        reshuffled = GameState(grid2, cat, mouse, seed=0, status="playing")
+
+        def reshuffle_key() -> int:
+            # What with_obstacles does for the grid hash, then the state key on top
+            grid2._zobrist = grid.zobrist ^ zobrist_hash(delta, keys)
+            reshuffled._key = None
+            reshuffled.inherit_key(parent)
+            return reshuffled.key
+
+        def frozenset_hash() -> int:
+            return hash((frozenset(geo.positions_of(bits)), cat.position, mouse.position))
+
+        t_move = _best_per_call(move_key, args.calls)
+        t_reshuffle = _best_per_call(reshuffle_key, args.calls)
+        t_set = _best_per_call(frozenset_hash, max(1, args.calls // 10))
+        print(
+            f"{count:>9}  {t_move * 1e6:>8.2f}us  {t_reshuffle * 1e6:>11.2f}us"
+            f"  {t_set * 1e6:>12.2f}us"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
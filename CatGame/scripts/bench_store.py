@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark the session store: checkpointing and restoring many sessions.
+Run from project root: PYTHONPATH=src python3 scripts/bench_store.py [--sessions N] [--moves N]
+Times put(), checkpoint, warm() restore and cold get(); reports bytes per session.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from catgame.game.turn import apply_move
+from catgame.placement.placement import create_game
+from catgame.server.store import TieredStore
+
+
+def _game(seed: int, moves: int):
+    state = create_game(seed)
+    rng = random.Random(seed)
+    for _ in range(moves):
+        state = apply_move(state, rng.choice(("up", "down", "left", "right"))).state
+        if state.status == "won":
+            break
+    return state
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Session store checkpoint and restore")
+    parser.add_argument("--sessions", type=int, default=100_000, help="Sessions stored")
+    parser.add_argument("--moves", type=int, default=50, help="Random moves per game")
+    parser.add_argument(
+        "--distinct", type=int, default=500, help="Distinct games among the sessions"
+    )
+    args = parser.parse_args()
+
+    games = [_game(seed, args.moves) for seed in range(args.distinct)]
+    ids = [f"{k:016x}" for k in range(args.sessions)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.db")
+        store = TieredStore(path, capacity=None, interval=3600)
+        start = time.perf_counter()
+        for k, sid in enumerate(ids):
+            store.put(sid, games[k % args.distinct])
+        put = time.perf_counter() - start
+        start = time.perf_counter()
+        store.checkpoint()
+        checkpoint = time.perf_counter() - start
+        store.close()
+        size = os.path.getsize(path) + sum(
+            os.path.getsize(path + ext) for ext in ("-wal", "-shm") if os.path.exists(path + ext)
+        )
+
+        store = TieredStore(path, capacity=None)
+        start = time.perf_counter()
+        restored = store.warm()
+        warm = time.perf_counter() - start
+        store.close()
+
+        store = TieredStore(path, capacity=None)
+        sample = random.Random(0).sample(ids, min(10_000, len(ids)))
+        start = time.perf_counter()
+        for sid in sample:
+            store.get(sid)
+        cold = (time.perf_counter() - start) / len(sample)
+        store.close()
+
+    n = args.sessions
+    print(f"sessions {n}, {size / n:.0f} bytes each on disk")
+    print(f"put          {put / n * 1e6:8.2f} us/session  ({put:.2f} s)")
+    print(
+        f"checkpoint   {checkpoint / n * 1e6:8.2f} us/session"
+        f"  ({checkpoint:.2f} s, one transaction)"
+    )
+    print(f"warm restore {warm / n * 1e6:8.2f} us/session  ({warm:.2f} s for {restored})")
+    print(f"cold get     {cold * 1e6:8.2f} us/session")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
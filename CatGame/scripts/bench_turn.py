@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Microbenchmark one apply_move turn: time per turn and allocations per turn.
+Run from project root: PYTHONPATH=src python3 scripts/bench_turn.py [--turns N] [--mouse-ai bfs]
+Allocations: model objects constructed and tracemalloc peak per turn.
+"""
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from catgame.game import turn as turn_module
+from catgame.game.turn import apply_move
+from catgame.models import Cat, GameState, Grid, Mouse, Position
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.placement.placement import create_game
+from catgame.sim.policies import bfs_policy
+
+
+def _positions_and_moves(turns: int, mouse_ai: str = "manhattan") -> list[tuple[GameState, str]]:
+    """(state, direction) pairs from BFS-chaser games, replayed identically by every measurement."""
+    rng = random.Random(0)
+    pairs: list[tuple[GameState, str]] = []
+    seed = 0
+    while len(pairs) < turns:
+        state = create_game(seed, mouse_ai)
+        seed += 1
+        while state.status == "playing" and len(pairs) < turns:
+            direction = bfs_policy(state, rng)
+            if direction is None:
+                break
+            pairs.append((state, direction))
+            state = apply_move(state, direction).state
+    return pairs
+
+
+def _count_constructions(pairs: list[tuple[GameState, str]]) -> Counter:
+    """Wrap model constructors with counters (left in place: run this measurement last)."""
+    counts: Counter = Counter()
+    for cls in (Position, Cat, Mouse, GameState, Grid, turn_module.ApplyResult):
+        original = cls.__new__
+
+        def counting_new(klass, *args, _name=cls.__name__, _original=original, **kwargs):
+            counts[_name] += 1
+            if _original is object.__new__:
+                return _original(klass)
+            return _original(klass, *args, **kwargs)
+
+        cls.__new__ = counting_new
+    for state, direction in pairs:
+        apply_move(state, direction)
+    return counts
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="apply_move per-turn time and allocations")
+    parser.add_argument("--turns", type=int, default=20_000, help="Turns to measure")
+    parser.add_argument(
+        "--mouse-ai", choices=MOUSE_AI_MODES, default="manhattan", help="Mouse distance measure"
+    )
+    args = parser.parse_args()
+
+    pairs = _positions_and_moves(args.turns, args.mouse_ai)
+
+    start = time.perf_counter()
+    for state, direction in pairs:
+        apply_move(state, direction)
+    secs = time.perf_counter() - start
+    print(f"time        {secs / len(pairs) * 1e6:8.2f} us/turn over {len(pairs)} turns")
+
+    tracemalloc.start()
+    peaks = []
+    for state, direction in pairs[: min(len(pairs), 5_000)]:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        apply_move(state, direction)
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    print(f"heap peak   {sum(peaks) / len(peaks):8.0f} B/turn (mean transient high-water)")
+    counts = _count_constructions(pairs)
+    per_turn = ", ".join(f"{name} {n / len(pairs):.2f}" for name, n in sorted(counts.items()))
+    print(f"objects     {sum(counts.values()) / len(pairs):8.2f} /turn  ({per_turn})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
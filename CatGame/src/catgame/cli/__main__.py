@@ -1,29 +1,155 @@
-"""CLI entrypoint: argparse --seed, --json, --gui; read commands from stdin."""
+"""CLI entrypoint: argparse --seed, --json, --gui, --script; read commands from stdin."""
 
 import argparse
 import random
 import sys
 
-from catgame.cli.commands import run_loop
+from catgame.models.position import COLS, ROWS
+
+# Each mode imports only what it uses: the validators below load the module that owns each
+# setting when the setting is parsed, and the run functions load with their mode
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def _seed(text: str) -> int:
+    from catgame.placement.placement import SEED_MAX, SEED_MIN
+    value = int(text)
+    if not SEED_MIN <= value <= SEED_MAX:
+        raise argparse.ArgumentTypeError(f"must be in {SEED_MIN}..{SEED_MAX}")
+    return value
+
+
+def _json_mode(text: str) -> str:
+    from catgame.cli.stream import JSON_MODES
+    if text not in JSON_MODES:
+        raise argparse.ArgumentTypeError(f"must be one of {', '.join(JSON_MODES)}")
+    return text
+
+
+def _mouse_ai(text: str) -> str:
+    from catgame.mouse_ai.ai import MOUSE_AI_MODES
+    if text not in MOUSE_AI_MODES:
+        raise argparse.ArgumentTypeError(f"must be one of {', '.join(MOUSE_AI_MODES)}")
+    return text
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Cat Chase Mouse game (20x30 grid)")
-    parser.add_argument("--seed", type=int, default=None, metavar="N", help="RNG seed for same map (omit for random map each run)")
-    parser.add_argument("--json", action="store_true", help="Output state as JSON (future)")
+    parser = argparse.ArgumentParser(
+        description=f"Cat Chase Mouse game ({ROWS}x{COLS} grid by default)"
+    )
+    parser.add_argument(
+        "--seed", type=_seed, default=None, metavar="N",
+        help="RNG seed for same map (omit for random map each run)",
+    )
+    parser.add_argument(
+        "--json", nargs="?", const="full", default=None, type=_json_mode, metavar="MODE",
+        help="Output state as JSON lines: full (default) or delta (keyframe, then per-move "
+        "changes)",
+    )
+    parser.add_argument(
+        "--compact", action="store_true",
+        help="With --json: cells as row*cols+col indices, no spaces",
+    )
     parser.add_argument("--keys", action="store_true", help="Use W/A/S/D and arrow keys (one key per move, no Enter)")
     parser.add_argument("--emoji", action="store_true", help="Use cat/mouse/brick emoji instead of C, M, #")
     parser.add_argument("--gui", action="store_true", help="Open Pygame GUI window (requires: pip install pygame)")
+    parser.add_argument(
+        "--mouse-ai", type=_mouse_ai, default="manhattan", metavar="MODE",
+        help="Mouse distance measure: manhattan (default) or bfs (paths around obstacles)",
+    )
+    parser.add_argument(
+        "--rows", type=_positive_int, default=ROWS, metavar="N",
+        help=f"Board height in cells (default {ROWS})",
+    )
+    parser.add_argument(
+        "--cols", type=_positive_int, default=COLS, metavar="N",
+        help=f"Board width in cells (default {COLS})",
+    )
+    parser.add_argument(
+        "--cats", type=_positive_int, default=1, metavar="N",
+        help="Cats, all moved by each command (default 1)",
+    )
+    parser.add_argument(
+        "--mice", type=_positive_int, default=1, metavar="N", help="Mice to catch (default 1)"
+    )
+    parser.add_argument(
+        "--record", default=None, metavar="FILE", help="Append each game played to a replay file"
+    )
+    parser.add_argument(
+        "--replay", default=None, metavar="FILE",
+        help="Print the games in a replay file instead of playing",
+    )
+    parser.add_argument(
+        "--game", type=int, default=None, metavar="N",
+        help="With --replay: only the Nth recorded game (0-based)",
+    )
+    parser.add_argument(
+        "--seek", type=int, default=None, metavar="T",
+        help="With --replay: only the state after T moves",
+    )
+    parser.add_argument(
+        "--script", default=None, metavar="FILE",
+        help="Play a whole command file (- for stdin) and print only the final state",
+    )
+    parser.add_argument(
+        "--every", type=_positive_int, default=0, metavar="N",
+        help="With --script: also print each game's first state and the state after every Nth move",
+    )
+    parser.add_argument(
+        "--events", action="store_true", help="With --script: print only wins and invalid moves"
+    )
     args = parser.parse_args()
+    if args.seek is not None and args.seek < 0:
+        parser.error("--seek must be >= 0")
+    if (args.every or args.events) and args.script is None:
+        parser.error("--every and --events need --script")
+    if args.every and args.events:
+        parser.error("--every and --events cannot be combined")
+    if args.script is not None and (args.replay or args.gui or args.keys):
+        parser.error("--script cannot be combined with --replay, --gui or --keys")
+
+    if args.replay:
+        from catgame.cli.commands import run_replay
+        sys.exit(run_replay(
+            args.replay, use_json=args.json is not None, use_emoji=args.emoji, game=args.game,
+            seek=args.seek, json_mode=args.json or "full", json_compact=args.compact,
+        ))
+    if args.rows * args.cols < 3:
+        parser.error("the board needs at least 3 cells")
+    if args.cats + 2 * args.mice > args.rows * args.cols:
+        parser.error("too many cats and mice for the board")
 
     seed = args.seed if args.seed is not None else random.randint(0, 2**31 - 1)
 
+    if args.script is not None:
+        from catgame.cli.commands import run_script
+        sys.exit(run_script(
+            args.script, seed, use_json=args.json is not None, use_emoji=args.emoji,
+            mouse_ai=args.mouse_ai, rows=args.rows, cols=args.cols, cats=args.cats, mice=args.mice,
+            every=args.every, events=args.events, record=args.record, json_mode=args.json or "full",
+            json_compact=args.compact,
+        ))
+
     if args.gui:
         from catgame.gui.pygame_ui import run_pygame_ui
-        run_pygame_ui(seed=seed)
+        run_pygame_ui(
+            seed=seed, mouse_ai=args.mouse_ai, rows=args.rows, cols=args.cols,
+            cats=args.cats, mice=args.mice,
+        )
         return
 
-    run_loop(seed=seed, use_json=args.json, use_keys=args.keys, use_emoji=args.emoji)
+    from catgame.cli.commands import run_loop
+    run_loop(
+        seed=seed, use_json=args.json is not None, use_keys=args.keys, use_emoji=args.emoji,
+        mouse_ai=args.mouse_ai, rows=args.rows, cols=args.cols, cats=args.cats, mice=args.mice,
+        record=args.record, json_mode=args.json or "full", json_compact=args.compact,
+    )
     sys.exit(0)
 
 
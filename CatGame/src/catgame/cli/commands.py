@@ -1,25 +1,23 @@
 """Command loop: parse up/down/left/right, call apply_move, print state or stderr feedback."""
 
-import json
-import logging
 import random
 import sys
-
-try:
-    import tty
-    import termios
-    _RAW_KEYS_AVAILABLE = True
-except ImportError:
-    _RAW_KEYS_AVAILABLE = False
+from typing import TYPE_CHECKING
 
 from catgame.cli.render import render_grid
-from catgame.cli.curses_ui import _CURSES_AVAILABLE, run_curses_ui
-from catgame.game.turn import apply_move
-from catgame.models import GameState
+from catgame.cli.stream import JsonStream
+from catgame.game.moves import KEY_TO_DIRECTION, key_to_direction
+from catgame.game.turn import INVALID_MESSAGE, apply_move
+from catgame.log import get_logger
+from catgame.models import COLS, ROWS, GameState
 from catgame.placement.placement import create_game
 
-logger = logging.getLogger(__name__)
-INVALID_MESSAGE = "Invalid move"
+# Each mode imports only what it uses: curses and termios for key input, the par index on a
+# win in text mode, the replay log for --record/--replay
+if TYPE_CHECKING:
+    from catgame.replay.log import ReplayWriter
+
+logger = get_logger(__name__)
 
 COMMANDS_HELP = """
 Commands:
@@ -33,29 +31,22 @@ Commands:
 Run with --keys to use W/A/S/D and arrow keys without pressing Enter (q=quit, n/r=new game).
 """
 
-# Map key / line input to direction (up, down, left, right)
-KEY_TO_DIRECTION = {
-    "up": "up", "w": "up",
-    "down": "down", "s": "down",
-    "left": "left", "a": "left",
-    "right": "right", "d": "right",
-    # Arrow key escape sequences (when read as a line)
-    "\x1b[A": "up", "\x1bOA": "up",   # Up
-    "\x1b[B": "down", "\x1bOB": "down",  # Down
-    "\x1b[D": "left", "\x1bOD": "left",  # Left
-    "\x1b[C": "right", "\x1bOC": "right",  # Right
-}
-
-
-def _key_to_direction(cmd: str) -> str | None:
-    """Return direction (up/down/left/right) or None if not a move key."""
-    key = cmd.strip()
-    return KEY_TO_DIRECTION.get(key) or KEY_TO_DIRECTION.get(key.lower())
+def _raw_keys_available() -> bool:
+    """True where single keys can be read from a raw terminal (termios and tty exist)."""
+    try:
+        import termios  # noqa: F401
+        import tty  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 def _read_key() -> str:
     """Read a single key (for raw mode). Handles arrow escape sequences."""
-    if not _RAW_KEYS_AVAILABLE:
+    try:
+        import termios
+        import tty
+    except ImportError:
         return ""
     fd = sys.stdin.fileno()
     old = termios.tcgetattr(fd)
@@ -74,38 +65,66 @@ def _read_key() -> str:
         termios.tcsetattr(fd, termios.TCSADRAIN, old)
 
 
-def _print_json_state(state: GameState) -> None:
-    obj = {
-        "status": state.status,
-        "message": state.message or "",
-        "grid_size": [20, 30],
-        "cat": [state.cat.position.row, state.cat.position.col],
-        "mouse": [state.mouse.position.row, state.mouse.position.col],
-        "obstacles": [[p.row, p.col] for p in state.grid.obstacles],
-        "seed": state.seed,
-    }
-    print(json.dumps(obj), flush=True)
+def run_loop(
+    seed: int,
+    use_json: bool = False,
+    use_keys: bool = False,
+    use_emoji: bool = False,
+    mouse_ai: str = "manhattan",
+    rows: int = ROWS,
+    cols: int = COLS,
+    cats: int = 1,
+    mice: int = 1,
+    record: str | None = None,
+    json_mode: str = "full",
+    json_compact: bool = False,
+) -> None:
+    """Play from stdin (or keys); with `record`, every game with moves is appended to that
+    replay file. With use_json, states print as JSON lines in json_mode (see cli.stream).
+    """
+    stream = JsonStream(json_mode, json_compact) if use_json else None
+    recorder = None
+    if record:
+        from catgame.replay.log import ReplayWriter
+        recorder = ReplayWriter(record)
+    try:
+        _play(seed, stream, use_keys, use_emoji, mouse_ai, rows, cols, cats, mice, recorder)
+    finally:
+        if recorder is not None:
+            recorder.close()
 
 
-def run_loop(seed: int, use_json: bool = False, use_keys: bool = False, use_emoji: bool = False) -> None:
+def _play(
+    seed: int, stream: JsonStream | None, use_keys: bool, use_emoji: bool, mouse_ai: str,
+    rows: int, cols: int, cats: int, mice: int, recorder: "ReplayWriter | None",
+) -> None:
+    use_json = stream is not None
+    interactive = use_keys and not use_json and sys.stdin.isatty()
+    if interactive:
+        from catgame.cli.curses_ui import _CURSES_AVAILABLE, run_curses_ui
     # Single-window UI (grid + status bar only) when --keys and TTY and curses available
-    if use_keys and _CURSES_AVAILABLE and sys.stdin.isatty() and not use_json:
+    if interactive and _CURSES_AVAILABLE:
         try:
-            run_curses_ui(seed, use_emoji=use_emoji)
+            run_curses_ui(
+                seed, use_emoji=use_emoji, mouse_ai=mouse_ai, rows=rows, cols=cols,
+                cats=cats, mice=mice, recorder=recorder,
+            )
             return
         except Exception as e:
             logger.debug("Curses UI failed, falling back to key mode: %s", e)
 
-    state = create_game(seed)
+    state = create_game(seed, mouse_ai, rows, cols, cats, mice)
+    if recorder is not None:
+        recorder.start(state)
     if use_json:
-        _print_json_state(state)
+        stream.keyframe(state)
     else:
         print(COMMANDS_HELP.strip())
         print()
         print(render_grid(state, use_emoji=use_emoji))
         print(f"Status: {state.status}", flush=True)
 
-    use_raw_keys = use_keys and _RAW_KEYS_AVAILABLE and sys.stdin.isatty()
+    use_raw_keys = use_keys and sys.stdin.isatty() and _raw_keys_available()
 
     while True:
         if use_raw_keys:
@@ -117,8 +136,12 @@ def run_loop(seed: int, use_json: bool = False, use_keys: bool = False, use_emoj
             if cmd in ("n", "r"):
                 new_seed = random.randint(0, 2**31 - 1)
                 logger.info("New game (seed=%s)", new_seed)
-                state = create_game(new_seed)
-                if not use_json:
+                state = create_game(new_seed, mouse_ai, rows, cols, cats, mice)
+                if recorder is not None:
+                    recorder.start(state)
+                if use_json:
+                    stream.keyframe(state)
+                else:
                     print(render_grid(state, use_emoji=use_emoji))
                     print(f"Status: {state.status}", flush=True)
                 continue
@@ -132,21 +155,23 @@ def run_loop(seed: int, use_json: bool = False, use_keys: bool = False, use_emoj
         if not use_raw_keys and cmd in ("new", "restart"):
             new_seed = random.randint(0, 2**31 - 1)
             logger.info("New game (seed=%s)", new_seed)
-            state = create_game(new_seed)
+            state = create_game(new_seed, mouse_ai, rows, cols, cats, mice)
+            if recorder is not None:
+                recorder.start(state)
             if use_json:
-                _print_json_state(state)
+                stream.keyframe(state)
             else:
                 print(render_grid(state, use_emoji=use_emoji))
                 print(f"Status: {state.status}", flush=True)
             continue
         if not use_raw_keys and cmd == "state":
             if use_json:
-                _print_json_state(state)
+                stream.keyframe(state)
             else:
                 print(render_grid(state, use_emoji=use_emoji))
                 print(f"Status: {state.status}", flush=True)
             continue
-        direction = _key_to_direction(cmd)
+        direction = key_to_direction(cmd)
         if direction is not None:
             if state.status == "won":
                 logger.debug("Move rejected: game already won")
@@ -155,16 +180,19 @@ def run_loop(seed: int, use_json: bool = False, use_keys: bool = False, use_emoj
             result = apply_move(state, direction)
             if result.success:
                 state = result.state
+                if recorder is not None:
+                    recorder.move(direction, state)
                 logger.info("Move %s applied; status=%s", direction, state.status)
                 if use_json:
-                    _print_json_state(state)
+                    stream.update(state)
                 else:
                     print(render_grid(state, use_emoji=use_emoji))
                     print(f"Status: {state.status}", flush=True)
                 if state.status == "won":
                     logger.info("Game won: %s", state.message)
                     if not use_json:
-                        print(state.message, flush=True)
+                        from catgame.par.index import par_suffix
+                        print(state.message + par_suffix(state), flush=True)
             else:
                 logger.debug("Invalid move: %s", result.message)
                 print(result.message or INVALID_MESSAGE, file=sys.stderr, flush=True)
@@ -172,3 +200,172 @@ def run_loop(seed: int, use_json: bool = False, use_keys: bool = False, use_emoj
         if use_raw_keys and not direction:
             continue  # Ignore unknown key in key mode
         print(INVALID_MESSAGE, file=sys.stderr, flush=True)
+
+
+# Lines a script run buffers before writing them out in one go
+_SCRIPT_FLUSH_LINES = 4096
+
+
+def run_script(
+    path: str,
+    seed: int,
+    use_json: bool = False,
+    use_emoji: bool = False,
+    mouse_ai: str = "manhattan",
+    rows: int = ROWS,
+    cols: int = COLS,
+    cats: int = 1,
+    mice: int = 1,
+    every: int = 0,
+    events: bool = False,
+    record: str | None = None,
+    json_mode: str = "full",
+    json_compact: bool = False,
+) -> int:
+    """Play a whole command file ("-" for stdin), printing only the final state (with `every`
+    also every Nth state; with `events` only wins and invalid moves). Returns the exit status.
+    """
+    try:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+    except OSError as e:
+        print(f"Cannot read script file: {e}", file=sys.stderr)
+        return 1
+
+    out: list[str] = []
+    write = sys.stdout.write
+
+    def sink(line: str) -> None:
+        out.append(line)
+        if len(out) >= _SCRIPT_FLUSH_LINES:
+            write("\n".join(out) + "\n")
+            out.clear()
+
+    stream = JsonStream(json_mode, json_compact, sink) if use_json else None
+
+    def emit(state: GameState, start: bool = False) -> None:
+        if stream is not None and start:
+            stream.keyframe(state)
+        elif stream is not None:
+            stream.update(state)
+        else:
+            sink(render_grid(state, use_emoji=use_emoji))
+            sink(f"Status: {state.status}")
+
+    def event(number: int, kind: str, message: str, state: GameState) -> None:
+        if stream is not None:
+            obj = {"event": kind, "line": number, "message": message}
+            if kind == "won":
+                obj["turn"] = state.turn
+            stream.notice(obj)
+        else:
+            if kind == "won":
+                from catgame.par.index import par_suffix
+                message += par_suffix(state)
+            sink(f"{number}: {message}")
+
+    recorder = None
+    if record:
+        from catgame.replay.log import ReplayWriter
+        recorder = ReplayWriter(record)
+    try:
+        state = create_game(seed, mouse_ai, rows, cols, cats, mice)
+        if recorder is not None:
+            recorder.start(state)
+        states = every and not events
+        if states:
+            emit(state, start=True)
+        emitted = state
+        direction_of = KEY_TO_DIRECTION.get
+        move = apply_move
+        for number, line in enumerate(text.splitlines(), 1):
+            cmd = line.strip()
+            if not cmd:
+                continue
+            direction = direction_of(cmd) or direction_of(cmd.lower())
+            if direction is not None:
+                if state.status == "won":
+                    if events:
+                        event(number, "invalid", INVALID_MESSAGE, state)
+                    continue
+                result = move(state, direction)
+                if not result.success:
+                    if events:
+                        event(number, "invalid", result.message or INVALID_MESSAGE, state)
+                    continue
+                state = result.state
+                if recorder is not None:
+                    recorder.move(direction, state)
+                if events:
+                    if state.status == "won":
+                        event(number, "won", state.message, state)
+                elif every and state.turn % every == 0:
+                    emit(state)
+                    emitted = state
+                continue
+            cmd = cmd.lower()
+            if cmd in ("quit", "exit"):
+                break
+            if cmd in ("new", "restart"):
+                if states and emitted is not state:
+                    emit(state)
+                state = create_game(random.randint(0, 2**31 - 1), mouse_ai, rows, cols, cats, mice)
+                if recorder is not None:
+                    recorder.start(state)
+                if states:
+                    emit(state, start=True)
+                emitted = state
+            elif cmd != "state" and events:
+                event(number, "invalid", INVALID_MESSAGE, state)
+        if not events and (not every or emitted is not state):
+            emit(state)
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if out:
+            write("\n".join(out) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def run_replay(
+    path: str, use_json: bool = False, use_emoji: bool = False, game: int | None = None,
+    seek: int | None = None, json_mode: str = "full", json_compact: bool = False,
+) -> int:
+    """Print the games recorded in a replay file (or only record `game`, 0-based): every state,
+    or with `seek` only the state after that many moves. Returns the exit status.
+    """
+    from catgame.replay.log import load_replays
+
+    stream = JsonStream(json_mode, json_compact) if use_json else None
+    try:
+        replays = load_replays(path)
+    except OSError as e:
+        print(f"Cannot read replay file: {e}", file=sys.stderr)
+        return 1
+    if game is not None:
+        if not 0 <= game < len(replays):
+            print(f"No game {game} in {path} ({len(replays)} recorded)", file=sys.stderr)
+            return 1
+        replays = [replays[game]]
+    for replay in replays:
+        if not use_json:
+            print(f"Seed {replay.seed}: {replay.turns} moves, {replay.status}", flush=True)
+        states = [replay.seek(min(seek, replay.turns))] if seek is not None else replay.states()
+        state = None
+        for state in states:
+            if stream is not None:
+                if state.turn == 0 or seek is not None:
+                    stream.keyframe(state)
+                else:
+                    stream.update(state)
+            else:
+                print(render_grid(state, use_emoji=use_emoji))
+                print(f"Status: {state.status}", flush=True)
+        if state is not None and state.status == "won" and not use_json:
+            from catgame.par.index import par_suffix
+            print(state.message + par_suffix(state), flush=True)
+    return 0
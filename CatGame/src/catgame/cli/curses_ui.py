@@ -3,10 +3,12 @@
 import random
 import sys
 
-from catgame.cli.render import render_grid
-from catgame.models import ROWS
+from catgame.cli.render import dirty_cells, render_cell
+from catgame.models import ROWS, COLS
 from catgame.game.turn import apply_move
+from catgame.par.index import par_suffix
 from catgame.placement.placement import create_game
+from catgame.replay.log import ReplayWriter
 
 try:
     import curses
@@ -22,7 +24,11 @@ KEY_TO_DIR = {"w": "up", "W": "up", "s": "down", "S": "down", "a": "left", "A":
 _PAIR_GRID_BG = 1
 
 
-def _run_curses(stdscr, initial_seed: int, use_emoji: bool = False) -> None:
+def _run_curses(
+    stdscr, initial_seed: int, use_emoji: bool = False, mouse_ai: str = "manhattan",
+    rows: int = ROWS, cols: int = COLS, cats: int = 1, mice: int = 1,
+    recorder: ReplayWriter | None = None,
+) -> None:
     curses.curs_set(0)
     # Match frame background to empty cells so the grid area and empty spaces look the same
     grid_attr = 0
@@ -41,28 +47,47 @@ def _run_curses(stdscr, initial_seed: int, use_emoji: bool = False) -> None:
     stdscr.refresh()
 
     seed = initial_seed
-    state = create_game(seed)
+    state = create_game(seed, mouse_ai, rows, cols, cats, mice)
+    if recorder is not None:
+        recorder.start(state)
     status_msg = ""
+    cell_width = 2 if use_emoji else 1
+    # What is on screen now: None forces a full repaint (first frame, terminal resize)
+    shown_state = None
+    shown_bar = None
 
     def redraw() -> None:
-        stdscr.clear()
-        grid_text = render_grid(state, use_emoji=use_emoji)
-        for i, line in enumerate(grid_text.split("\n")):
-            try:
-                stdscr.addstr(i, 0, line, grid_attr)
-            except curses.error:
-                pass
-        # Status bar at bottom (row ROWS): errors or win message; else short hint
+        """Repaint only cells that changed since the last frame, and the bar if its text changed."""
+        nonlocal shown_state, shown_bar
+        if shown_state is None:
+            stdscr.erase()
+        width = stdscr.getmaxyx()[1]
+        # Status bar at bottom (row `rows`): errors or win message; else short hint
         if status_msg:
-            bar = status_msg[: stdscr.getmaxx() - 1]
+            bar = status_msg[: width - 1]
         elif state.status == "won":
             bar = "You won! N = new game  Q = quit"
         else:
             bar = "WASD / Arrows: move   N: new   Q: quit"
-        try:
-            stdscr.addstr(ROWS, 0, bar.ljust(stdscr.getmaxx() - 1)[: stdscr.getmaxx() - 1], curses.A_REVERSE)
-        except curses.error:
-            pass
+            if state.occupancy is not None:
+                bar += f"   Mice left: {len(state.occupancy.mice)}"
+        dirty = dirty_cells(shown_state, state)
+        if not dirty and bar == shown_bar:
+            return
+        for index in dirty:
+            row, col = divmod(index, cols)
+            try:
+                text = render_cell(state, index, use_emoji)
+                stdscr.addstr(row, col * cell_width, text, grid_attr)
+            except curses.error:
+                pass
+        if bar != shown_bar:
+            try:
+                stdscr.addstr(rows, 0, bar.ljust(width - 1)[: width - 1], curses.A_REVERSE)
+            except curses.error:
+                pass
+        shown_state = state
+        shown_bar = bar
         stdscr.refresh()
 
     redraw()
@@ -71,9 +96,16 @@ def _run_curses(stdscr, initial_seed: int, use_emoji: bool = False) -> None:
         key = stdscr.getch()
         if key == ord("q") or key == ord("Q"):
             break
+        if key == curses.KEY_RESIZE:
+            shown_state = None
+            shown_bar = None
+            redraw()
+            continue
         if key == ord("n") or key == ord("r") or key == ord("N") or key == ord("R"):
             seed = random.randint(0, 2**31 - 1)
-            state = create_game(seed)
+            state = create_game(seed, mouse_ai, rows, cols, cats, mice)
+            if recorder is not None:
+                recorder.start(state)
             status_msg = ""
             redraw()
             continue
@@ -99,19 +131,26 @@ def _run_curses(stdscr, initial_seed: int, use_emoji: bool = False) -> None:
         result = apply_move(state, direction)
         if result.success:
             state = result.state
-            status_msg = state.message if state.status == "won" else ""
+            if recorder is not None:
+                recorder.move(direction, state)
+            status_msg = state.message + par_suffix(state) if state.status == "won" else ""
         else:
             status_msg = result.message or "Invalid move"
         redraw()
 
 
-def run_curses_ui(seed: int, use_emoji: bool = False) -> None:
-    """Run the game in a single curses window (grid + status bar only)."""
+def run_curses_ui(
+    seed: int, use_emoji: bool = False, mouse_ai: str = "manhattan", rows: int = ROWS,
+    cols: int = COLS, cats: int = 1, mice: int = 1, recorder: ReplayWriter | None = None,
+) -> None:
+    """Run the game in a single curses window (grid + status bar only) on a rows x cols board
+    with `cats` cats and `mice` mice; games are recorded to `recorder` if given.
+    """
     if not _CURSES_AVAILABLE:
         raise RuntimeError("curses not available")
     if not sys.stdin.isatty():
         raise RuntimeError("curses UI requires a TTY")
     try:
-        curses.wrapper(_run_curses, seed, use_emoji)
+        curses.wrapper(_run_curses, seed, use_emoji, mouse_ai, rows, cols, cats, mice, recorder)
     except KeyboardInterrupt:
         pass
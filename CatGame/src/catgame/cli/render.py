@@ -1,6 +1,12 @@
-"""Render game state as text grid. Supports plain text (C, M, #) or emoji clipart (cat, mouse, obstacle)."""
+"""Render game state as text grid. Supports plain text (C, M, #) or emoji clipart (cat, mouse,
+obstacle).
+dirty_cells/render_cell let a UI repaint only the cells that changed between two states.
+Games with several cats and mice draw every agent, read from the state's occupancy index.
+"""
 
-from catgame.models import GameState, Position, ROWS, COLS
+from catgame.models import GameState
+from catgame.models.bitboard import set_bits
+from catgame.models.occupancy import CAT, MOUSE
 
 # Plain: one character per cell, works everywhere. Empty = unicode block.
 TEXT_CAT = "C"
@@ -16,28 +22,85 @@ EMOJI_OBSTACLE = "\N{brick}"         # 🧱 (2 cols)
 EMOJI_EMPTY = " \N{full block}"      # " █" (1+1 cols) so cell matches emoji width
 
 
-def render_grid(state: GameState, use_emoji: bool = False) -> str:
-    """Return a text grid (ROWS x COLS). use_emoji=True uses cat/mouse/brick emoji with fixed cell width."""
-    grid = state.grid
-    cat_pos = state.cat.position
-    mouse_pos = state.mouse.position
-    cat_s, mouse_s, obst_s, empty_s = (
+def _symbols(use_emoji: bool) -> tuple[str, str, str, str]:
+    return (
         (EMOJI_CAT, EMOJI_MOUSE, EMOJI_OBSTACLE, EMOJI_EMPTY)
         if use_emoji
         else (TEXT_CAT, TEXT_MOUSE, TEXT_OBSTACLE, TEXT_EMPTY)
     )
-    lines: list[str] = []
-    for r in range(ROWS):
-        row_chars: list[str] = []
-        for c in range(COLS):
-            pos = Position(r, c)
-            if pos == cat_pos:
-                row_chars.append(cat_s)
-            elif pos == mouse_pos:
-                row_chars.append(mouse_s)
-            elif pos in grid.obstacles:
-                row_chars.append(obst_s)
-            else:
-                row_chars.append(empty_s)
-        lines.append("".join(row_chars))
-    return "\n".join(lines)
+
+
+def agent_cells(state: GameState) -> dict[int, int]:
+    """Cell index -> CAT or MOUSE for every agent on the board (a caught mouse's cell is the
+    cat's).
+    """
+    if state.occupancy is not None:
+        return state.occupancy.cells
+    cols = state.grid.geometry.cols
+    cat_pos, mouse_pos = state.cat.position, state.mouse.position
+    return {mouse_pos.row * cols + mouse_pos.col: MOUSE, cat_pos.row * cols + cat_pos.col: CAT}
+
+
+def dirty_cells(prev: GameState | None, state: GameState) -> list[int]:
+    """Cell indices (row * cols + col, ascending) whose contents differ between prev and state.
+    prev=None (first frame) means every cell is dirty.
+    """
+    geo = state.grid.geometry
+    if prev is None or prev.grid.geometry is not geo:
+        return list(range(geo.size))
+    if prev is state:
+        return []
+    cols = geo.cols
+    changed = set(set_bits(prev.grid.bits ^ state.grid.bits))
+    if prev.occupancy is not None or state.occupancy is not None:
+        before, after = agent_cells(prev), agent_cells(state)
+        changed.update(j for j, kind in before.items() if after.get(j) != kind)
+        changed.update(j for j, kind in after.items() if before.get(j) != kind)
+        return sorted(changed)
+    moved = ((prev.cat.position, state.cat.position), (prev.mouse.position, state.mouse.position))
+    for before, after in moved:
+        if before != after:
+            changed.update((before.row * cols + before.col, after.row * cols + after.col))
+    return sorted(changed)
+
+
+def render_cell(state: GameState, index: int, use_emoji: bool = False) -> str:
+    """Text of one cell (same symbols and precedence as render_grid: cat, mouse, obstacle,
+    empty).
+    """
+    cat_s, mouse_s, obst_s, empty_s = _symbols(use_emoji)
+    if state.occupancy is not None:
+        kind = state.occupancy.cells.get(index)
+        if kind is not None:
+            return cat_s if kind == CAT else mouse_s
+        return obst_s if (state.grid.bits >> index) & 1 else empty_s
+    cols = state.grid.geometry.cols
+    cat_pos = state.cat.position
+    if index == cat_pos.row * cols + cat_pos.col:
+        return cat_s
+    mouse_pos = state.mouse.position
+    if index == mouse_pos.row * cols + mouse_pos.col:
+        return mouse_s
+    return obst_s if (state.grid.bits >> index) & 1 else empty_s
+
+
+def render_grid(state: GameState, use_emoji: bool = False) -> str:
+    """Return a text grid (the board's rows x cols). use_emoji=True uses cat/mouse/brick emoji
+    with fixed cell width.
+    """
+    grid = state.grid
+    rows, cols = grid.geometry.rows, grid.geometry.cols
+    cat_pos = state.cat.position
+    mouse_pos = state.mouse.position
+    cat_s, mouse_s, obst_s, empty_s = _symbols(use_emoji)
+    # One "0"/"1" flag per cell in row-major order, straight from the obstacle bitboard
+    flags = format(grid.bits, f"0{rows * cols}b")[::-1]
+    cells = [obst_s if f == "1" else empty_s for f in flags]
+    if state.occupancy is not None:
+        for index, kind in state.occupancy.cells.items():
+            cells[index] = cat_s if kind == CAT else mouse_s
+        return "\n".join("".join(cells[r * cols:(r + 1) * cols]) for r in range(rows))
+    cells[cat_pos.row * cols + cat_pos.col] = cat_s
+    if mouse_pos != cat_pos:
+        cells[mouse_pos.row * cols + mouse_pos.col] = mouse_s
+    return "\n".join("".join(cells[r * cols:(r + 1) * cols]) for r in range(rows))
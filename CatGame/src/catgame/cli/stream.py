@@ -0,0 +1,111 @@
+"""JSON output for --json: one object per line, either full states or a delta stream.
+Formats are described in the CLI contract; compact writes cells as row * cols + col.
+"""
+
+import json
+from collections.abc import Callable
+
+from catgame.models import GameState, Position
+from catgame.models.bitboard import set_bits
+
+JSON_MODES = ("full", "delta")
+
+
+class JsonStream:
+    """Prints states as JSON lines in one of JSON_MODES; remembers the last state printed so
+    the next line can be a delta against it.
+    """
+
+    def __init__(
+        self, mode: str = "full", compact: bool = False, sink: Callable[[str], None] | None = None
+    ) -> None:
+        if mode not in JSON_MODES:
+            raise ValueError(f"Unknown JSON mode {mode!r}")
+        self.delta = mode == "delta"
+        self.compact = compact
+        self.sink = sink or _print_line
+        self.seq = 0
+        self._last: GameState | None = None
+        # Encoded obstacle list of the last keyframe: obstacles only change on a reshuffle
+        self._obstacles: tuple[int, int, list] = (-1, 0, [])
+
+    def _cells(self, cols: int, cells) -> list:
+        if self.compact:
+            return list(cells)
+        # (row, col) tuples print as JSON arrays and, holding only ints, are not GC-tracked
+        return [divmod(j, cols) for j in cells]
+
+    def _cell(self, cols: int, position: Position):
+        return position.row * cols + position.col if self.compact else [position.row, position.col]
+
+    def _dumps(self, obj: dict) -> str:
+        return json.dumps(obj, separators=(",", ":")) if self.compact else json.dumps(obj)
+
+    def _emit(self, obj: dict) -> None:
+        self.sink(self._dumps(obj))
+        self.seq += 1
+
+    def notice(self, obj: dict) -> None:
+        """Print an object that is not a state line (so no seq)."""
+        self.sink(self._dumps(obj))
+
+    def error(self, message: str) -> None:
+        """Print an error object, as in the CLI contract."""
+        self.notice({"error": True, "message": message})
+
+    def _obstacle_cells(self, state: GameState) -> list:
+        bits, cols = state.grid.bits, state.grid.geometry.cols
+        if self._obstacles[:2] != (bits, cols):
+            self._obstacles = (bits, cols, self._cells(cols, set_bits(bits)))
+        return self._obstacles[2]
+
+    def keyframe(self, state: GameState) -> None:
+        """Print the whole state (in delta mode: a keyframe that later deltas build on)."""
+        cols = state.grid.geometry.cols
+        obj: dict = {"type": "keyframe", "seq": self.seq, "turn": state.turn} if self.delta else {}
+        obj.update({
+            "status": state.status,
+            "message": state.message or "",
+            "grid_size": [state.grid.height, state.grid.width],
+            "cat": self._cell(cols, state.cat.position),
+            "mouse": self._cell(cols, state.mouse.position),
+            "obstacles": self._obstacle_cells(state),
+            "seed": state.seed,
+        })
+        if state.occupancy is not None:
+            obj["cats"] = self._cells(cols, state.occupancy.cats)
+            obj["mice"] = self._cells(cols, state.occupancy.mice)
+        self._emit(obj)
+        self._last = state
+
+    def update(self, state: GameState) -> None:
+        """Print the state after a move: a delta against the last line in delta mode."""
+        last = self._last
+        if not self.delta or last is None:
+            self.keyframe(state)
+            return
+        cols = state.grid.geometry.cols
+        obj: dict = {"type": "delta", "seq": self.seq, "turn": state.turn}
+        if state.cat.position != last.cat.position:
+            obj["cat"] = self._cell(cols, state.cat.position)
+        if state.mouse.position != last.mouse.position:
+            obj["mouse"] = self._cell(cols, state.mouse.position)
+        if state.occupancy is not None and last.occupancy is not None:
+            if state.occupancy.cats != last.occupancy.cats:
+                obj["cats"] = self._cells(cols, state.occupancy.cats)
+            if state.occupancy.mice != last.occupancy.mice:
+                obj["mice"] = self._cells(cols, state.occupancy.mice)
+        new, old = state.grid.bits, last.grid.bits
+        if new != old:
+            obj["add"] = self._cells(cols, set_bits(new & ~old))
+            obj["remove"] = self._cells(cols, set_bits(old & ~new))
+        if state.status != last.status:
+            obj["status"] = state.status
+        if state.message:
+            obj["message"] = state.message
+        self._emit(obj)
+        self._last = state
+
+
+def _print_line(line: str) -> None:
+    print(line, flush=True)
@@ -0,0 +1,6 @@
+"""Gym-style environments for training cat agents (requires numpy)."""
+
+from catgame.env.core import DIRECTIONS, CatEnv
+from catgame.env.vector import VectorEnv
+
+__all__ = ["DIRECTIONS", "CatEnv", "VectorEnv"]
@@ -0,0 +1,123 @@
+"""Gym-style environment: one game per env, the cat as the agent, NumPy observations.
+step() updates the (3, rows, cols) observation in place; copy it to keep it past the next step.
+"""
+
+from catgame.game.moves import DIRECTION_DELTA
+from catgame.game.turn import apply_move
+from catgame.models import COLS, ROWS, GameState
+from catgame.models.bitboard import set_bits
+from catgame.placement.placement import create_game
+from catgame.sim.runner import DEFAULT_MAX_TURNS
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "The environment requires numpy. "
+        "Install with: pip install 'catgame[batch]' or pip install numpy"
+    ) from e
+
+DIRECTIONS = tuple(DIRECTION_DELTA)
+
+OBSTACLES = 0
+CATS = 1
+MICE = 2
+PLANES = 3
+
+
+def _agents(state: GameState) -> tuple[list[int], list[int], int]:
+    """Cat cells, mouse cells and mice caught so far."""
+    occupancy = state.occupancy
+    if occupancy is not None:
+        return list(occupancy.cats), list(occupancy.mice), occupancy.caught
+    geo = state.grid.geometry
+    caught = 1 if state.status == "won" else 0
+    return [geo.index(state.cat.position)], [geo.index(state.mouse.position)], caught
+
+
+class CatEnv:
+    """One game of `rows` x `cols` with `cats` cats and `mice` mice; actions are DIRECTIONS
+    indexes. `obs`, if given, is the (3, rows, cols) uint8 array to fill.
+    """
+
+    def __init__(
+        self,
+        rows: int = ROWS,
+        cols: int = COLS,
+        mouse_ai: str = "manhattan",
+        cats: int = 1,
+        mice: int = 1,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        obs: "np.ndarray | None" = None,
+    ) -> None:
+        if obs is None:
+            obs = np.zeros((PLANES, rows, cols), dtype=np.uint8)
+        elif (
+            obs.shape != (PLANES, rows, cols) or obs.dtype != np.uint8
+            or not obs.flags.c_contiguous
+        ):
+            raise ValueError(
+                f"obs must be a contiguous uint8 array of shape {(PLANES, rows, cols)}"
+            )
+        self.rows, self.cols = rows, cols
+        self.mouse_ai = mouse_ai
+        self.cats, self.mice = cats, mice
+        self.max_turns = max_turns
+        self.obs = obs
+        # Flat per-plane views: cell index j is [plane, j]
+        self._planes = obs.reshape(PLANES, rows * cols)
+        # Byte view of the same memory for single-cell writes (far cheaper than NumPy indexing)
+        self._bytes = memoryview(obs).cast("B")
+        self._size = rows * cols
+        self.state: GameState | None = None
+        self.steps = 0
+        self._cats: list[int] = []
+        self._mice: list[int] = []
+        self._caught = 0
+
+    def reset(self, seed: int) -> tuple["np.ndarray", dict]:
+        """Start the game for `seed` (the same game create_game(seed, ...) makes)."""
+        state = create_game(seed, self.mouse_ai, self.rows, self.cols, self.cats, self.mice)
+        planes = self._planes
+        planes[:] = 0
+        planes[OBSTACLES, set_bits(state.grid.bits)] = 1
+        self._cats, self._mice, self._caught = _agents(state)
+        planes[CATS, self._cats] = 1
+        planes[MICE, self._mice] = 1
+        self.state = state
+        self.steps = 0
+        return self.obs, {"seed": seed, "turn": 0}
+
+    def step(self, action: int | str) -> tuple["np.ndarray", float, bool, bool, dict]:
+        state = self.state
+        if state is None or state.status != "playing":
+            raise RuntimeError("Game is over or not started; call reset()")
+        direction = action if isinstance(action, str) else DIRECTIONS[action]
+        self.steps += 1
+        result = apply_move(state, direction)
+        reward = 0.0
+        if result.success:
+            new = result.state
+            cells = self._bytes
+            changed = new.grid.bits ^ state.grid.bits
+            if changed:
+                for j in set_bits(changed):
+                    cells[j] ^= 1
+            cats, mice, caught = _agents(new)
+            base = CATS * self._size
+            for j in self._cats:
+                cells[base + j] = 0
+            for j in cats:
+                cells[base + j] = 1
+            base = MICE * self._size
+            for j in self._mice:
+                cells[base + j] = 0
+            for j in mice:
+                cells[base + j] = 1
+            reward = float(caught - self._caught)
+            self._cats, self._mice, self._caught = cats, mice, caught
+            self.state = new
+        terminated = self.state.status == "won"
+        truncated = not terminated and self.steps >= self.max_turns
+        info = {"turn": self.state.turn, "invalid": not result.success}
+        return self.obs, reward, terminated, truncated, info
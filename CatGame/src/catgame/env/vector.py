@@ -0,0 +1,189 @@
+"""Many CatEnvs stepped together, in-process or across worker processes over shared memory.
+Envs reset themselves when their game ends; env i plays seeds seed + i, seed + i + n, ...
+"""
+
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from catgame.env.core import PLANES, CatEnv
+from catgame.models import COLS, ROWS
+from catgame.sim.runner import DEFAULT_MAX_TURNS
+
+
+class _Buffers:
+    """Array views over one flat buffer (rewards first, so the float32s are aligned)."""
+
+    def __init__(self, buf, n: int, rows: int, cols: int) -> None:
+        at = 0
+        self.rewards = np.ndarray((n,), dtype=np.float32, buffer=buf, offset=at)
+        at += 4 * n
+        self.obs = np.ndarray((n, PLANES, rows, cols), dtype=np.uint8, buffer=buf, offset=at)
+        at += n * PLANES * rows * cols
+        self.terminated = np.ndarray((n,), dtype=np.bool_, buffer=buf, offset=at)
+        self.truncated = np.ndarray((n,), dtype=np.bool_, buffer=buf, offset=at + n)
+        self.invalid = np.ndarray((n,), dtype=np.bool_, buffer=buf, offset=at + 2 * n)
+        self.actions = np.ndarray((n,), dtype=np.int8, buffer=buf, offset=at + 3 * n)
+
+    @staticmethod
+    def size(n: int, rows: int, cols: int) -> int:
+        return 4 * n + n * PLANES * rows * cols + 4 * n
+
+
+def _make_envs(buffers: _Buffers, lo: int, hi: int, options: dict) -> list[CatEnv]:
+    return [CatEnv(obs=buffers.obs[i], **options) for i in range(lo, hi)]
+
+
+def _reset_range(envs: list[CatEnv], lo: int, seeds: list[int], buffers: _Buffers) -> None:
+    for i, env in enumerate(envs, lo):
+        env.reset(seeds[i])
+    hi = lo + len(envs)
+    buffers.rewards[lo:hi] = 0
+    buffers.terminated[lo:hi] = False
+    buffers.truncated[lo:hi] = False
+    buffers.invalid[lo:hi] = False
+
+
+def _step_range(
+    envs: list[CatEnv], lo: int, seeds: list[int], stride: int, buffers: _Buffers
+) -> None:
+    actions = buffers.actions[lo:lo + len(envs)].tolist()
+    rewards, terminated = buffers.rewards, buffers.terminated
+    truncated, invalid = buffers.truncated, buffers.invalid
+    for i, (env, action) in enumerate(zip(envs, actions), lo):
+        _, reward, done, cut, info = env.step(action)
+        rewards[i] = reward
+        terminated[i] = done
+        truncated[i] = cut
+        invalid[i] = info["invalid"]
+        if done or cut:
+            seeds[i] += stride
+            env.reset(seeds[i])
+
+
+def _worker(conn, name: str, n: int, lo: int, hi: int, options: dict) -> None:
+    shm = shared_memory.SharedMemory(name=name)
+    buffers = _Buffers(shm.buf, n, options["rows"], options["cols"])
+    envs = _make_envs(buffers, lo, hi, options)
+    seeds: list[int] = []
+    try:
+        while True:
+            command, arg = conn.recv()
+            if command == "step":
+                _step_range(envs, lo, seeds, n, buffers)
+            elif command == "reset":
+                seeds = arg
+                _reset_range(envs, lo, seeds, buffers)
+            else:
+                break
+            conn.send(None)
+    finally:
+        # Views must go before the mapping closes
+        del envs, buffers
+        shm.close()
+
+
+class VectorEnv:
+    """n envs with shared settings (see CatEnv), over `workers` processes (None: CPU count).
+    Use as a context manager, or call close(), to stop workers and free the shared memory.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        rows: int = ROWS,
+        cols: int = COLS,
+        mouse_ai: str = "manhattan",
+        cats: int = 1,
+        mice: int = 1,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        workers: int | None = 1,
+    ) -> None:
+        if n < 1:
+            raise ValueError("n must be >= 1")
+        workers = min(n, workers or os.cpu_count() or 1)
+        options = {
+            "rows": rows, "cols": cols, "mouse_ai": mouse_ai, "cats": cats, "mice": mice,
+            "max_turns": max_turns,
+        }
+        self.n = n
+        self.workers = workers
+        self.seeds = list(range(n))
+        self._shm: shared_memory.SharedMemory | None = None
+        self._conns: list = []
+        self._procs: list = []
+        size = _Buffers.size(n, rows, cols)
+        if workers == 1:
+            self._buffers = _Buffers(bytearray(size), n, rows, cols)
+            self._envs = _make_envs(self._buffers, 0, n, options)
+        else:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._buffers = _Buffers(self._shm.buf, n, rows, cols)
+            self._envs = []
+            bounds = [n * k // workers for k in range(workers + 1)]
+            for lo, hi in zip(bounds, bounds[1:]):
+                parent, child = mp.Pipe()
+                proc = mp.Process(
+                    target=_worker, args=(child, self._shm.name, n, lo, hi, options), daemon=True
+                )
+                proc.start()
+                child.close()
+                self._conns.append(parent)
+                self._procs.append(proc)
+        self.obs = self._buffers.obs
+        self.rewards = self._buffers.rewards
+        self.terminated = self._buffers.terminated
+        self.truncated = self._buffers.truncated
+        self.invalid = self._buffers.invalid
+
+    def _call(self, command: str, arg=None) -> None:
+        for conn in self._conns:
+            conn.send((command, arg))
+        for conn in self._conns:
+            conn.recv()
+
+    def reset(self, seed: int = 0) -> "np.ndarray":
+        """Start env i on seed + i; returns obs (the shared buffer, updated in place)."""
+        self.seeds = [seed + i for i in range(self.n)]
+        if self._conns:
+            self._call("reset", self.seeds)
+        else:
+            _reset_range(self._envs, 0, self.seeds, self._buffers)
+        return self.obs
+
+    def step(self, actions) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", dict]:
+        """One action per env (DIRECTIONS indexes). Returns obs, rewards, terminated, truncated
+        and {"invalid": ...}: views of the shared buffer, overwritten by the next step.
+        """
+        self._buffers.actions[:] = actions
+        if self._conns:
+            self._call("step")
+        else:
+            _step_range(self._envs, 0, self.seeds, self.n, self._buffers)
+        return self.obs, self.rewards, self.terminated, self.truncated, {"invalid": self.invalid}
+
+    def close(self) -> None:
+        if self._conns:
+            for conn in self._conns:
+                conn.send(("close", None))
+                conn.close()
+            for proc in self._procs:
+                proc.join()
+            self._conns, self._procs = [], []
+        if self._shm is not None:
+            self.obs = self.rewards = self.terminated = self.truncated = self.invalid = None
+            self._buffers = None
+            try:
+                self._shm.close()
+            except BufferError:
+                pass  # The caller still holds views; the mapping goes when they do
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "VectorEnv":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
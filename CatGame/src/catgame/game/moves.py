@@ -1,6 +1,7 @@
 """Valid moves for cat or mouse: adjacent, in-bounds, not obstacle."""
 
-from catgame.models import GameState, Position, ROWS, COLS
+from catgame.models import GameState, Position
+from catgame.models.occupancy import CAT, MOUSE
 
 DIRECTION_DELTA = {
     "up": (-1, 0),
@@ -9,26 +10,49 @@ DIRECTION_DELTA = {
     "right": (0, 1),
 }
 
+# Map key / line input to direction (up, down, left, right)
+KEY_TO_DIRECTION = {
+    "up": "up", "w": "up",
+    "down": "down", "s": "down",
+    "left": "left", "a": "left",
+    "right": "right", "d": "right",
+    # Arrow key escape sequences (when read as a line)
+    "\x1b[A": "up", "\x1bOA": "up",   # Up
+    "\x1b[B": "down", "\x1bOB": "down",  # Down
+    "\x1b[D": "left", "\x1bOD": "left",  # Left
+    "\x1b[C": "right", "\x1bOC": "right",  # Right
+}
+
+
+def key_to_direction(cmd: str) -> str | None:
+    """Return direction (up/down/left/right) or None if not a move key."""
+    key = cmd.strip()
+    return KEY_TO_DIRECTION.get(key) or KEY_TO_DIRECTION.get(key.lower())
+
 
 def get_valid_moves(state: GameState, actor: str) -> list[Position]:
     """Return list of positions that are adjacent, in bounds, and not obstacles.
     For mouse, exclude current cat position.
+    With several agents, a cat may not step onto another cat, nor a mouse onto any agent.
     """
+    geo = state.grid.geometry
+    occupancy = state.occupancy
+    if occupancy is not None:
+        current = state.cat.position if actor == "cat" else state.mouse.position
+        blocking = (CAT,) if actor == "cat" else (CAT, MOUSE)
+        cells = occupancy.cells
+        blocked = state.grid.bits
+        positions = geo.positions
+        return [
+            positions[j] for bit, j in geo.neighbors[geo.index(current)]
+            if not blocked & bit and cells.get(j) not in blocking
+        ]
+    blocked = state.grid.bits
     if actor == "cat":
         current = state.cat.position
-        blocked_by_actor = set()
     else:
         current = state.mouse.position
-        blocked_by_actor = {state.cat.position}
-
-    obstacles = state.grid.obstacles
-    out: list[Position] = []
-    for name, (dr, dc) in DIRECTION_DELTA.items():
-        r, c = current.row + dr, current.col + dc
-        if not (0 <= r < ROWS and 0 <= c < COLS):
-            continue
-        pos = Position(r, c)
-        if pos in obstacles or pos in blocked_by_actor:
-            continue
-        out.append(pos)
-    return out
+        blocked |= geo.bit(state.cat.position)
+
+    positions = geo.positions
+    return [positions[j] for bit, j in geo.neighbors[geo.index(current)] if not blocked & bit]
@@ -1,17 +1,23 @@
 """Apply cat move: validate, move cat, then move mouse or win. Returns ApplyResult."""
 
-import logging
 from dataclasses import dataclass
 
-from catgame.game.moves import DIRECTION_DELTA, get_valid_moves
-
-logger = logging.getLogger(__name__)
-from catgame.models import Cat, GameState, Mouse, Position, ROWS, COLS
-from catgame.mouse_ai.ai import choose_mouse_move
+from catgame.game.moves import DIRECTION_DELTA
+from catgame.log import get_logger
+from catgame.models import Cat, GameState, Mouse
+from catgame.models.occupancy import CAT, MOUSE
+from catgame.mouse_ai.ai import choose_mouse_move_among, choose_mouse_move_at
+from catgame.mouse_ai.distance import nearest_field
 from catgame.placement.placement import maybe_reshuffle_obstacles
 
+logger = get_logger(__name__)
+
+INVALID_MESSAGE = "Invalid move"
+WIN_MESSAGE = "You caught the mouse!"
+WIN_ALL_MESSAGE = "You caught all the mice!"
 
-@dataclass
+
+@dataclass(slots=True)
 class ApplyResult:
     success: bool
     state: GameState
@@ -21,6 +27,18 @@ class ApplyResult:
 def apply_move(state: GameState, direction: str) -> ApplyResult:
     """Apply one turn: cat moves in direction (if valid), then mouse moves or game wins.
     Invalid move => unchanged state, success=False, message with feedback.
+    Pure: the result depends only on (state, direction); obstacle reshuffles draw from
+    the state's own (seed, turn) RNG.
+    """
+    result = move_pieces(state, direction)
+    if result.success and result.state.status == "playing":
+        result.state = maybe_reshuffle_obstacles(result.state)
+    return result
+
+
+def move_pieces(state: GameState, direction: str) -> ApplyResult:
+    """apply_move up to the obstacle reshuffle: cat moves, then the mouse flees or the game
+    is won. The turn counter advances; obstacles are left as they are.
     """
     if state.status != "playing":
         return ApplyResult(success=False, state=state, message="Game already ended.")
@@ -29,73 +47,138 @@ def apply_move(state: GameState, direction: str) -> ApplyResult:
         return ApplyResult(
             success=False,
             state=state,
-            message="Invalid move",
+            message=INVALID_MESSAGE,
         )
 
     dr, dc = DIRECTION_DELTA[direction]
+    if state.occupancy is not None:
+        return _move_agents(state, direction, dr, dc)
+    geo = state.grid.geometry
     new_row = state.cat.position.row + dr
     new_col = state.cat.position.col + dc
-    if not (0 <= new_row < ROWS and 0 <= new_col < COLS):
+    if not (0 <= new_row < geo.rows and 0 <= new_col < geo.cols):
         return ApplyResult(
             success=False,
             state=state,
-            message="Invalid move",
+            message=INVALID_MESSAGE,
         )
-    new_cat_pos = Position(new_row, new_col)
-    if new_cat_pos in state.grid.obstacles:
+    new_cat_pos = geo.positions[new_row * geo.cols + new_col]
+    if state.grid.is_blocked(new_cat_pos):
         logger.debug("Invalid move: cat would move into obstacle")
         return ApplyResult(
             success=False,
             state=state,
-            message="Invalid move",
+            message=INVALID_MESSAGE,
         )
 
     logger.info("Cat move %s to %s", direction, new_cat_pos)
-    # Valid cat move: cat lands on new_cat_pos; check win by catch
+    cat = Cat(new_cat_pos)
+    # Valid cat move: cat lands on new_cat_pos; check win by catch, then let the mouse flee
     if new_cat_pos == state.mouse.position:
+        logger.info("Game won: cat caught mouse")
+        mouse_new = None
+    else:
+        mouse_new = choose_mouse_move_at(
+            state.grid, new_cat_pos, state.mouse.position, state.mouse_ai
+        )
+        if mouse_new is None:
+            logger.info("Game won: mouse trapped")
+    if mouse_new is None:
         new_state = GameState(
             grid=state.grid,
-            cat=Cat(new_cat_pos),
+            cat=cat,
             mouse=state.mouse,
             seed=state.seed,
             status="won",
-            message="You caught the mouse!",
+            message=WIN_MESSAGE,
+            turn=state.turn + 1,
+            mouse_ai=state.mouse_ai,
         )
-        logger.info("Game won: cat caught mouse")
-        return ApplyResult(success=True, state=new_state, message=new_state.message)
+        new_state.inherit_key(state)
+        return ApplyResult(success=True, state=new_state, message=WIN_MESSAGE)
 
-    # Move mouse (state after cat moved)
-    state_after_cat = GameState(
+    new_state = GameState(
         grid=state.grid,
-        cat=Cat(new_cat_pos),
-        mouse=state.mouse,
+        cat=cat,
+        mouse=Mouse(mouse_new),
         seed=state.seed,
         status="playing",
         message="",
+        turn=state.turn + 1,
+        mouse_ai=state.mouse_ai,
     )
-    mouse_moves = get_valid_moves(state_after_cat, "mouse")
-    if not mouse_moves:
-        logger.info("Game won: mouse trapped")
-        new_state = GameState(
-            grid=state.grid,
-            cat=Cat(new_cat_pos),
-            mouse=state.mouse,
-            seed=state.seed,
-            status="won",
-            message="You caught the mouse!",
-        )
-        return ApplyResult(success=True, state=new_state, message=new_state.message)
+    new_state.inherit_key(state)
+    return ApplyResult(success=True, state=new_state, message="")
+
 
-    mouse_new = choose_mouse_move(state_after_cat)
-    assert mouse_new is not None
+def _move_agents(state: GameState, direction: str, dr: int, dc: int) -> ApplyResult:
+    """move_pieces for a game with several cats and mice (state.occupancy).
+    Every cat that can steps (a line of cats moves as one) and catches a mouse it lands on;
+    then each mouse flees in turn, and a boxed-in mouse is caught.
+    """
+    occupancy = state.occupancy
+    grid = state.grid
+    geo = grid.geometry
+    rows, cols = geo.rows, geo.cols
+    node = grid.connectivity.node
+    cells = dict(occupancy.cells)
+    cats = list(occupancy.cats)
+    caught_at: set[int] = set()
+    stepped = False
+    # Down and right: highest cell index first; up and left: lowest first
+    for i in sorted(range(len(cats)), key=cats.__getitem__, reverse=dr + dc > 0):
+        j = cats[i]
+        r, c = j // cols + dr, j % cols + dc
+        if not (0 <= r < rows and 0 <= c < cols):
+            continue
+        target = r * cols + c
+        occupant = cells.get(target)
+        if node[target] < 0 or occupant == CAT:
+            continue
+        if occupant == MOUSE:
+            caught_at.add(target)
+        del cells[j]
+        cells[target] = CAT
+        cats[i] = target
+        stepped = True
+    if not stepped:
+        return ApplyResult(success=False, state=state, message=INVALID_MESSAGE)
 
+    logger.info("Cats move %s", direction)
+    moved = occupancy.moved(tuple(cats), (), occupancy.caught, cells)
+    field = nearest_field(grid, geo.bits_of_indices(cats)) if state.mouse_ai == "bfs" else None
+    mice: list[int] = []
+    last = geo.index(state.mouse.position)
+    for j in occupancy.mice:
+        if j in caught_at:
+            last = j
+            continue
+        target = choose_mouse_move_among(grid, moved, j, field)
+        del cells[j]
+        if target is None:
+            caught_at.add(j)
+            last = j
+            continue
+        cells[target] = MOUSE
+        mice.append(target)
+    if caught_at:
+        logger.info("Caught %d mice, %d left", len(caught_at), len(mice))
+
+    positions = geo.positions
+    won = not mice
+    message = ""
+    if won:
+        message = WIN_ALL_MESSAGE if occupancy.caught + len(caught_at) > 1 else WIN_MESSAGE
     new_state = GameState(
-        grid=state.grid,
-        cat=Cat(new_cat_pos),
-        mouse=Mouse(mouse_new),
+        grid=grid,
+        cat=Cat(positions[cats[0]]),
+        mouse=Mouse(positions[last if won else mice[0]]),
         seed=state.seed,
-        status="playing",
-        message="",
+        status="won" if won else "playing",
+        message=message,
+        turn=state.turn + 1,
+        mouse_ai=state.mouse_ai,
+        occupancy=moved.moved(tuple(cats), tuple(mice), occupancy.caught + len(caught_at), cells),
     )
-    new_state = maybe_reshuffle_obstacles(new_state)
-    return ApplyResult(success=True, state=new_state, message="")
+    new_state.inherit_key(state)
+    return ApplyResult(success=True, state=new_state, message=message)
@@ -1,5 +1,11 @@
 """Pygame GUI for Cat Chase Mouse."""
 
-from catgame.gui.pygame_ui import run_pygame_ui
-
 __all__ = ["run_pygame_ui"]
+
+
+def __getattr__(name: str):
+    # Importing the package must not load pygame; that happens on first use of run_pygame_ui
+    if name == "run_pygame_ui":
+        from catgame.gui.pygame_ui import run_pygame_ui
+        return run_pygame_ui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
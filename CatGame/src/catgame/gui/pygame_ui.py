@@ -1,11 +1,19 @@
-"""Pygame GUI: 20x30 grid with drawn cat, mouse, and obstacles. WASD/arrows, N=new game, Q=quit, L=leaderboard."""
+"""Pygame GUI: 20x30 grid (by default) with drawn cat, mouse, and obstacles.
+WASD/arrows, N=new game, Q=quit, L=leaderboard.
+Sprites are pre-rendered per cell size (SpriteAtlas); the window is resizable.
+"""
 
 import random
 import sys
+from functools import lru_cache
 
+from catgame.cli.render import agent_cells, dirty_cells
 from catgame.game.turn import apply_move
-from catgame.leaderboard import add_score, get_top10
-from catgame.models import GameState, Position, ROWS, COLS
+from catgame.leaderboard import Leaderboard
+from catgame.models import GameState, ROWS, COLS
+from catgame.models.bitboard import set_bits
+from catgame.models.occupancy import CAT, MOUSE
+from catgame.par.index import par_suffix
 from catgame.placement.placement import create_game
 
 try:
@@ -18,6 +26,8 @@ CELL_SIZE = 28
 GRID_WIDTH = COLS * CELL_SIZE
 GRID_HEIGHT = ROWS * CELL_SIZE
 STATUS_HEIGHT = 36
+# Smallest cell the window can shrink to (resizable window; sprites are rebuilt per cell size)
+MIN_CELL_SIZE = 12
 WINDOW_WIDTH = GRID_WIDTH
 WINDOW_HEIGHT = GRID_HEIGHT + STATUS_HEIGHT
 
@@ -47,9 +57,9 @@ KEY_TO_DIR = {
 }
 
 
-def _cell_rect(row: int, col: int) -> "pygame.Rect":
+def _cell_rect(row: int, col: int, cell_size: int = CELL_SIZE) -> "pygame.Rect":
     """Rect for the inner cell (excluding grid line)."""
-    return pygame.Rect(col * CELL_SIZE + 1, row * CELL_SIZE + 1, CELL_SIZE - 1, CELL_SIZE - 1)
+    return pygame.Rect(col * cell_size + 1, row * cell_size + 1, cell_size - 1, cell_size - 1)
 
 
 def _draw_empty(surface: "pygame.Surface", rect: "pygame.Rect") -> None:
@@ -126,36 +136,176 @@ def _draw_mouse(surface: "pygame.Surface", rect: "pygame.Rect") -> None:
     pygame.draw.circle(surface, COLOR_MOUSE_FACE, (cx + r // 3, cy - r // 4), eye_r)
 
 
-def _draw_grid(surface: "pygame.Surface", state: GameState) -> None:
-    grid = state.grid
-    cat_pos = state.cat.position
-    mouse_pos = state.mouse.position
-
-    for r in range(ROWS):
-        for c in range(COLS):
-            pos = Position(r, c)
-            rect = _cell_rect(r, c)
+def _draw_grid_uncached(
+    surface: "pygame.Surface", state: GameState, cell_size: int = CELL_SIZE
+) -> None:
+    """Full board straight from pygame.draw primitives (reference for SpriteAtlas and
+    benchmarks).
+    """
+    rows, cols = state.grid.height, state.grid.width
+    agents = agent_cells(state)
+    for r in range(rows):
+        for c in range(cols):
+            rect = _cell_rect(r, c, cell_size)
             _draw_empty(surface, rect)
-            if pos == cat_pos:
+            kind = agents.get(r * cols + c)
+            if kind == CAT:
                 _draw_cat(surface, rect)
-            elif pos == mouse_pos:
+            elif kind == MOUSE:
                 _draw_mouse(surface, rect)
-            elif pos in grid.obstacles:
+            elif (state.grid.bits >> (r * cols + c)) & 1:
                 _draw_obstacle(surface, rect)
-
-    # Grid lines
-    for c in range(COLS + 1):
-        x = c * CELL_SIZE
-        pygame.draw.line(surface, COLOR_GRID_LINE, (x, 0), (x, GRID_HEIGHT))
-    for r in range(ROWS + 1):
-        y = r * CELL_SIZE
-        pygame.draw.line(surface, COLOR_GRID_LINE, (0, y), (GRID_WIDTH, y))
+    for c in range(cols + 1):
+        x = c * cell_size
+        pygame.draw.line(surface, COLOR_GRID_LINE, (x, 0), (x, rows * cell_size))
+    for r in range(rows + 1):
+        y = r * cell_size
+        pygame.draw.line(surface, COLOR_GRID_LINE, (0, y), (cols * cell_size, y))
+
+
+class SpriteAtlas:
+    """Cell sprites and the static board background, pre-rendered once for one cell size and
+    board size (rows x cols). A blit matches the primitive painters pixel for pixel.
+    """
+
+    def __init__(self, cell_size: int, rows: int = ROWS, cols: int = COLS) -> None:
+        self.cell_size = cell_size
+        self.rows = rows
+        self.cols = cols
+        self.grid_width = cols * cell_size
+        self.grid_height = rows * cell_size
+        self.background = pygame.Surface((self.grid_width + 1, self.grid_height + 1))
+        self.background.fill(COLOR_EMPTY)
+        for c in range(cols + 1):
+            x = c * cell_size
+            pygame.draw.line(self.background, COLOR_GRID_LINE, (x, 0), (x, self.grid_height))
+        for r in range(rows + 1):
+            y = r * cell_size
+            pygame.draw.line(self.background, COLOR_GRID_LINE, (0, y), (self.grid_width, y))
+        inner = cell_size - 1
+        self.obstacle = pygame.Surface((inner, inner))
+        _draw_obstacle(self.obstacle, self.obstacle.get_rect())
+        # Cat and mouse: transparent canvas with a one-cell margin, blitted at offset -pad
+        self.pad = cell_size
+        self.cat = self._actor_sprite(_draw_cat)
+        self.mouse = self._actor_sprite(_draw_mouse)
+
+    def _actor_sprite(self, paint) -> "pygame.Surface":
+        cell_size, pad = self.cell_size, self.pad
+        side = cell_size - 1 + 2 * pad
+        sprite = pygame.Surface((side, side), pygame.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        paint(sprite, pygame.Rect(pad, pad, cell_size - 1, cell_size - 1))
+        clear = (0, 0, 0, 0)
+        sprite.fill(clear, pygame.Rect(pad + cell_size - 1, pad, side, side))
+        sprite.fill(clear, pygame.Rect(0, pad + cell_size - 1, side, side))
+        # Grid lines sit one pixel before each cell's inner rect, every cell_size pixels
+        for k in range(-2, 3):
+            line = pad - 1 + k * cell_size
+            if 0 <= line < side:
+                sprite.fill(clear, pygame.Rect(line, 0, 1, side))
+                sprite.fill(clear, pygame.Rect(0, line, side, 1))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    def blit_cell(self, surface: "pygame.Surface", state: GameState, index: int) -> None:
+        """Sprite for whatever occupies cell index (cat, mouse, obstacle), over the background."""
+        r, c = divmod(index, self.cols)
+        x = c * self.cell_size + 1
+        y = r * self.cell_size + 1
+        kind = agent_cells(state).get(index)
+        if kind == CAT:
+            surface.blit(self.cat, (x - self.pad, y - self.pad))
+        elif kind == MOUSE:
+            surface.blit(self.mouse, (x - self.pad, y - self.pad))
+        elif (state.grid.bits >> index) & 1:
+            surface.blit(self.obstacle, (x, y))
+
+
+@lru_cache(maxsize=4)
+def sprite_atlas(cell_size: int = CELL_SIZE, rows: int = ROWS, cols: int = COLS) -> SpriteAtlas:
+    """Shared atlas per cell and board size (rebuilt only when either changes)."""
+    return SpriteAtlas(cell_size, rows, cols)
+
+
+def _cell_size_for(width: int, height: int, rows: int = ROWS, cols: int = COLS) -> int:
+    """Largest cell size (at least MIN_CELL_SIZE) whose rows x cols grid plus status bar fits
+    the window.
+    """
+    return max(MIN_CELL_SIZE, min(width // cols, (height - STATUS_HEIGHT) // rows))
+
+
+def _draw_grid(surface: "pygame.Surface", state: GameState, atlas: SpriteAtlas) -> None:
+    """Full board: background blit, then one blit per obstacle, then cats and mice in cell order."""
+    surface.blit(atlas.background, (0, 0))
+    for index in set_bits(state.grid.bits):
+        atlas.blit_cell(surface, state, index)
+    for index in sorted(_actor_cells(state)):
+        atlas.blit_cell(surface, state, index)
+
+
+def _actor_cells(state: GameState) -> set[int]:
+    return set(agent_cells(state))
+
+
+def _halo(index: int, rows: int = ROWS, cols: int = COLS) -> tuple[int, ...]:
+    """Cells an actor sprite at index may overhang: left, and the three above."""
+    r, c = divmod(index, cols)
+    return tuple(
+        nr * cols + nc
+        for nr, nc in ((r - 1, c - 1), (r - 1, c), (r - 1, c + 1), (r, c - 1))
+        if 0 <= nr < rows and 0 <= nc < cols
+    )
+
+
+def _draw_dirty(
+    surface: "pygame.Surface", prev: GameState, state: GameState, atlas: SpriteAtlas
+) -> list["pygame.Rect"]:
+    """Repaint only cells that changed since prev; return the screen rects touched.
+    Actor sprites overhang their halo (see _halo), so a moved actor's halo is repainted too, and
+    an actor is redrawn whenever part of its halo is. Cells are painted in row-major order.
+    """
+    rows, cols = atlas.rows, atlas.cols
+    cells = set(dirty_cells(prev, state))
+    for index in _actor_cells(prev) | _actor_cells(state):
+        if index in cells:
+            cells.update(_halo(index, rows, cols))
+    for index in _actor_cells(state):
+        if not cells.isdisjoint(_halo(index, rows, cols)):
+            cells.add(index)
+    cell_size = atlas.cell_size
+    rects: list[pygame.Rect] = []
+    for index in sorted(cells):
+        r, c = divmod(index, cols)
+        inner = _cell_rect(r, c, cell_size)
+        surface.blit(atlas.background, inner.topleft, inner)
+        atlas.blit_cell(surface, state, index)
+        rects.append(pygame.Rect(c * cell_size, r * cell_size, cell_size + 1, cell_size + 1))
+    return rects
 
 
 # Key repeat when holding a direction: initial delay (ms), then interval (ms)
 KEY_REPEAT_DELAY = 100
 KEY_REPEAT_INTERVAL = 50
 
+# Idle: the loop sleeps in event.wait; the timeout only bounds how long it stays blocked
+IDLE_WAIT_MS = 500
+# Only these events wake the loop (mouse motion, focus, text input etc. are dropped by SDL)
+_WAKE_EVENTS = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED
+)
+
+
+def _wait_events(timeout_ms: int = IDLE_WAIT_MS) -> list["pygame.event.Event"]:
+    """Block until an event arrives (or timeout_ms passes), then drain the queue.
+    Returns [] on timeout. Key repeat is generated by SDL, so held keys still arrive as KEYDOWNs.
+    """
+    first = pygame.event.wait(timeout_ms)
+    if first.type == pygame.NOEVENT:
+        return []
+    return [first, *pygame.event.get()]
+
 
 def _draw_overlay(surface: "pygame.Surface", font: "pygame.font.Font", lines: list[str], title: str) -> None:
     """Draw a centered overlay panel with title and lines of text."""
@@ -164,7 +314,8 @@ def _draw_overlay(surface: "pygame.Surface", font: "pygame.font.Font", lines: li
     max_w = max((font.size(line)[0] for line in lines), default=0)
     box_w = max(max_w, font.size(title)[0]) + pad * 2
     box_h = line_h * (1 + len(lines)) + pad * 2 + font.get_height()
-    box = pygame.Rect((WINDOW_WIDTH - box_w) // 2, (WINDOW_HEIGHT - box_h) // 2, box_w, box_h)
+    width, height = surface.get_size()
+    box = pygame.Rect((width - box_w) // 2, (height - box_h) // 2, box_w, box_h)
     overlay = pygame.Surface((box_w, box_h))
     overlay.fill(COLOR_STATUS_BG)
     pygame.draw.rect(overlay, COLOR_GRID_LINE, overlay.get_rect(), 2)
@@ -179,28 +330,79 @@ def _draw_overlay(surface: "pygame.Surface", font: "pygame.font.Font", lines: li
     surface.blit(overlay, box.topleft)
 
 
-def run_pygame_ui(seed: int = 0) -> None:
-    """Run the game in a Pygame window. WASD/arrows move, N=new game, Q=quit. Hold a key to keep moving."""
+def _draw_status(
+    surface: "pygame.Surface", font: "pygame.font.Font", text: str, color, move_count: int,
+    top: int = GRID_HEIGHT,
+) -> "pygame.Rect":
+    """Status bar below the grid: message on the left, move counter right-aligned. Returns the
+    bar rect.
+    """
+    width = surface.get_width()
+    status_rect = pygame.Rect(0, top, width, STATUS_HEIGHT)
+    pygame.draw.rect(surface, COLOR_STATUS_BG, status_rect)
+    surface.blit(font.render(text, True, color), (8, top + 8))
+    moves_surface = font.render(f"Moves: {move_count}", True, COLOR_STATUS_TEXT)
+    surface.blit(moves_surface, (width - moves_surface.get_width() - 8, top + 8))
+    return status_rect
+
+
+def _ranked(mouse_ai: str, rows: int, cols: int, cats: int, mice: int) -> bool:
+    """True if wins with these settings go on the leaderboard: one table, so only the default
+    game (board, one cat, one mouse, default mouse) is ranked and move counts stay comparable.
+    """
+    return (mouse_ai, rows, cols, cats, mice) == ("manhattan", ROWS, COLS, 1, 1)
+
+
+def run_pygame_ui(
+    seed: int = 0, mouse_ai: str = "manhattan", rows: int = ROWS, cols: int = COLS,
+    cats: int = 1, mice: int = 1,
+) -> None:
+    """Run the game in a Pygame window. WASD/arrows move, N=new game, Q=quit.
+    Hold a key to keep moving. Repaints only when input changes something.
+    """
     pygame.init()
     pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(_WAKE_EVENTS)
     pygame.display.set_caption("Cat Chase Mouse")
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    if (rows, cols) == (ROWS, COLS):
+        cell_size = CELL_SIZE
+    else:
+        cell_size = _cell_size_for(WINDOW_WIDTH, WINDOW_HEIGHT, rows, cols)
+    screen = pygame.display.set_mode(
+        (cols * cell_size, rows * cell_size + STATUS_HEIGHT), pygame.RESIZABLE
+    )
+    atlas = sprite_atlas(cell_size, rows, cols)
     status_font = pygame.font.Font(None, 24)
-    state = create_game(seed)
+    leaderboard = Leaderboard()
+    state = create_game(seed, mouse_ai, rows, cols, cats, mice)
     status_msg = ""
     move_count = 0
-    won_initials_done = False
+    ranked = _ranked(mouse_ai, rows, cols, cats, mice)
+    won_initials_done = not ranked
     initials_buffer = ""
     show_leaderboard_overlay = False
     leaderboard_close_on_any_key = False
 
-    clock = pygame.time.Clock()
+    # What is on screen now; shown_state=None forces a full repaint
+    shown_state: GameState | None = None
+    shown_status = None
+    shown_overlay = None
+
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in _wait_events():
             if event.type == pygame.QUIT:
                 running = False
                 break
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                shown_state = None
+                continue
+            if event.type == pygame.VIDEORESIZE:
+                screen = pygame.display.get_surface()
+                atlas = sprite_atlas(_cell_size_for(event.w, event.h, rows, cols), rows, cols)
+                shown_state = None
+                continue
             if event.type == pygame.KEYDOWN:
                 if show_leaderboard_overlay and leaderboard_close_on_any_key:
                     show_leaderboard_overlay = False
@@ -210,10 +412,10 @@ def run_pygame_ui(seed: int = 0) -> None:
                     break
                 if event.key in (pygame.K_n, pygame.K_r):
                     seed = random.randint(0, 2**31 - 1)
-                    state = create_game(seed)
+                    state = create_game(seed, mouse_ai, rows, cols, cats, mice)
                     status_msg = ""
                     move_count = 0
-                    won_initials_done = False
+                    won_initials_done = not ranked
                     initials_buffer = ""
                     show_leaderboard_overlay = False
                     continue
@@ -223,7 +425,7 @@ def run_pygame_ui(seed: int = 0) -> None:
                     elif event.key == pygame.K_BACKSPACE:
                         initials_buffer = initials_buffer[:-1]
                     if len(initials_buffer) == 4:
-                        add_score(initials_buffer, move_count)
+                        leaderboard.add_score(initials_buffer, move_count)
                         won_initials_done = True
                         show_leaderboard_overlay = True
                         leaderboard_close_on_any_key = False
@@ -240,48 +442,71 @@ def run_pygame_ui(seed: int = 0) -> None:
                     if result.success:
                         state = result.state
                         move_count += 1
-                        status_msg = state.message if state.status == "won" else ""
+                        won = state.status == "won"
+                        status_msg = state.message + par_suffix(state) if won else ""
                     else:
                         status_msg = result.message or "Invalid move"
 
-        screen.fill(COLOR_EMPTY)
-        _draw_grid(screen, state)
-
-        # Status bar
-        status_rect = pygame.Rect(0, GRID_HEIGHT, WINDOW_WIDTH, STATUS_HEIGHT)
-        pygame.draw.rect(screen, COLOR_STATUS_BG, status_rect)
+        # Overlay identity: while one is open (or it just closed) the whole window is repainted
+        if state.status == "won" and not won_initials_done:
+            overlay = ("initials", move_count, initials_buffer)
+        elif show_leaderboard_overlay:
+            # Cached view (one stat per wake): repaints when a score lands, here or in another
+            # process
+            overlay = ("top10", leaderboard_close_on_any_key, tuple(leaderboard.top10()))
+        else:
+            overlay = None
         if state.status == "won":
             text = status_msg or "You won!  N = New game   Q = Quit"
             color = COLOR_WIN
         else:
             text = status_msg or "WASD / Arrows: move   N: New game   L: Leaderboard   Q: Quit"
+            if state.occupancy is not None and not status_msg:
+                text = f"Mice left: {len(state.occupancy.mice)}   " + text
             color = COLOR_STATUS_TEXT
-        text_surface = status_font.render(text, True, color)
-        screen.blit(text_surface, (8, GRID_HEIGHT + 8))
-        # Move counter (right-aligned)
-        moves_text = f"Moves: {move_count}"
-        moves_surface = status_font.render(moves_text, True, COLOR_STATUS_TEXT)
-        screen.blit(moves_surface, (WINDOW_WIDTH - moves_surface.get_width() - 8, GRID_HEIGHT + 8))
-
-        # Overlays
-        if state.status == "won" and not won_initials_done:
-            initials_display = (initials_buffer + "____")[:4]
-            _draw_overlay(screen, status_font, [f"You won in {move_count} moves!", f"Enter 4 initials: {initials_display}"], "Record your score")
-        elif show_leaderboard_overlay:
-            top10 = get_top10()
-            lines = [f"{i}. {name}   {moves} moves" for i, (name, moves) in enumerate(top10, 1)]
-            if not lines:
-                lines = ["No scores yet."]
-            if leaderboard_close_on_any_key:
-                lines.append("")
-                lines.append("Press any key to close")
-            else:
-                lines.append("")
-                lines.append("N = New game   Q = Quit")
-            _draw_overlay(screen, status_font, lines, "TOP 10")
-
-        pygame.display.flip()
-        clock.tick(30)
-
+        status_key = (text, color, move_count)
+
+        full = shown_state is None or overlay is not None or shown_overlay is not None
+        if full and (
+            overlay != shown_overlay or state is not shown_state or status_key != shown_status
+        ):
+            screen.fill(COLOR_EMPTY)
+            _draw_grid(screen, state, atlas)
+            _draw_status(screen, status_font, text, color, move_count, atlas.grid_height)
+            if overlay is not None and overlay[0] == "initials":
+                initials_display = (initials_buffer + "____")[:4]
+                _draw_overlay(
+                    screen, status_font,
+                    [
+                        f"You won in {move_count} moves!{par_suffix(state)}",
+                        f"Enter 4 initials: {initials_display}",
+                    ],
+                    "Record your score",
+                )
+            elif overlay is not None:
+                lines = [
+                    f"{i}. {name}   {moves} moves" for i, (name, moves) in enumerate(overlay[2], 1)
+                ]
+                if not lines:
+                    lines = ["No scores yet."]
+                if leaderboard_close_on_any_key:
+                    lines.append("")
+                    lines.append("Press any key to close")
+                else:
+                    lines.append("")
+                    lines.append("N = New game   Q = Quit")
+                _draw_overlay(screen, status_font, lines, "TOP 10")
+            pygame.display.flip()
+        elif not full:
+            dirty_rects = _draw_dirty(screen, shown_state, state, atlas)
+            if status_key != shown_status:
+                dirty_rects.append(
+                    _draw_status(screen, status_font, text, color, move_count, atlas.grid_height)
+                )
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        shown_state, shown_status, shown_overlay = state, status_key, overlay
+
+    leaderboard.close()
     pygame.quit()
     sys.exit(0)
@@ -1,53 +1,233 @@
-"""Persistent top-10 leaderboard by moves (lower is better). Stored on disk across runs."""
+"""Persistent top-10 leaderboard by moves (lower is better). Stored on disk across runs.
+Writes are locked, merged and replaced atomically, so processes can share the file.
+"""
 
+import atexit
 import json
 import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks; writes stay atomic but unserialized
+    fcntl = None
+
 LEADERBOARD_SIZE = 10
+# Write-behind: the writer waits this long after a score arrives to batch any that follow
+FLUSH_DELAY = 0.05
 
 
 def _get_leaderboard_path() -> Path:
-    """Path to leaderboard JSON file. Uses XDG_DATA_HOME or ~/.local/share."""
+    """Path to leaderboard JSON file. Uses XDG_DATA_HOME or ~/.local/share (created on first
+    write).
+    """
     base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
-    dir_path = Path(base) / "catgame"
-    dir_path.mkdir(parents=True, exist_ok=True)
-    return dir_path / "leaderboard.json"
+    return Path(base) / "catgame" / "leaderboard.json"
 
 
-def load_leaderboard() -> list[dict]:
-    """Load leaderboard from disk. Returns list of {"name": str, "moves": int}, sorted by moves ascending."""
-    path = _get_leaderboard_path()
-    if not path.exists():
-        return []
+def _normalize_name(name: str) -> str:
+    name = (name + "    ")[:4].strip().upper()
+    return name or "????"
+
+
+def _sort_key(entry: dict) -> tuple:
+    return (entry.get("moves", 0), entry.get("name", ""))
+
+
+def _read_entries(path: Path) -> list[dict]:
+    """Entries on disk sorted by moves ascending ([] if missing or unreadable)."""
     try:
         with open(path, encoding="utf-8") as f:
             data = json.load(f)
     except (json.JSONDecodeError, OSError):
         return []
     entries = data if isinstance(data, list) else []
-    return sorted(entries, key=lambda e: (e.get("moves", 0), e.get("name", "")))
+    return sorted(entries, key=_sort_key)
+
+
+def _write_entries(path: Path, entries: list[dict]) -> None:
+    """Atomically replace path: write a temp file in the same directory, fsync, rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".leaderboard-", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _locked(path: Path):
+    """Exclusive inter-process lock on a sidecar file next to path."""
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a") as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+
+def _stat_key(path: Path) -> tuple | None:
+    """Identity of the file's current contents: rename gives each write a new inode."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _merge_into(path: Path, scores: list[tuple[str, int]]) -> tuple[list[dict], tuple | None]:
+    """Locked read-merge-write of new scores; returns the entries written and their stat key."""
+    with _locked(path):
+        entries = _read_entries(path)
+        entries.extend({"name": name, "moves": moves} for name, moves in scores)
+        entries.sort(key=_sort_key)
+        entries = entries[:LEADERBOARD_SIZE]
+        _write_entries(path, entries)
+        return entries, _stat_key(path)
+
+
+class Leaderboard:
+    """Cached, write-behind view of the leaderboard file (re-read when its stat changes).
+    flush() waits for pending writes; close() flushes and stops the writer thread.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = Path(path) if path is not None else _get_leaderboard_path()
+        self._stat_key: tuple | None = None
+        self._entries: list[dict] = []
+        self._pending: list[tuple[str, int]] = []
+        self._inflight: list[tuple[str, int]] = []
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._error: BaseException | None = None
+
+    def entries(self) -> list[dict]:
+        """Sorted entries: the file's (re-read only if it changed on disk) plus unwritten scores."""
+        key = _stat_key(self.path)
+        with self._cond:
+            if key != self._stat_key:
+                self._entries = _read_entries(self.path) if key is not None else []
+                self._stat_key = key
+            unwritten = self._inflight + self._pending
+            if not unwritten:
+                return self._entries
+            merged = self._entries + [{"name": n, "moves": m} for n, m in unwritten]
+        merged.sort(key=_sort_key)
+        return merged[:LEADERBOARD_SIZE]
+
+    def top10(self) -> list[tuple[str, int]]:
+        """Top entries as [(name, moves), ...], sorted by moves ascending."""
+        top = self.entries()[:LEADERBOARD_SIZE]
+        return [(e.get("name", "????"), e.get("moves", 0)) for e in top]
+
+    def add_score(self, name: str, moves: int) -> None:
+        """Queue a score (4-letter name, move count) for the background writer."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Leaderboard is closed")
+            self._pending.append((_normalize_name(name), moves))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._writer, name="leaderboard-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued score is on disk. False if timeout expired first.
+        Re-raises an error from the writer; its scores stay queued and are retried.
+        """
+        with self._cond:
+            done = self._cond.wait_for(
+                lambda: not self._pending and not self._inflight or self._error is not None, timeout
+            )
+            error, self._error = self._error, None
+            self._cond.notify_all()
+        if error is not None:
+            raise error
+        return done
+
+    def close(self) -> None:
+        """Flush pending scores and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+            self._thread = None
+        atexit.unregister(self.close)
+
+    def _writer(self) -> None:
+        while True:
+            with self._cond:
+                # After a failure, wait for flush() to report it before retrying
+                self._cond.wait_for(lambda: self._pending and self._error is None or self._closed)
+                if not self._pending or self._closed and self._error is not None:
+                    return
+                closing = self._closed
+            # Let a burst of scores accumulate, then write them in one locked merge
+            if not closing:
+                time.sleep(FLUSH_DELAY)
+            with self._cond:
+                self._inflight, self._pending = self._pending, []
+            entries, key, error = None, None, None
+            try:
+                entries, key = _merge_into(self.path, self._inflight)
+            except Exception as e:  # surfaced by the next flush()
+                error = e
+            with self._cond:
+                if error is not None:
+                    # Put the scores back (ahead of newer ones) for the next attempt
+                    self._pending = self._inflight + self._pending
+                    self._error = error
+                else:
+                    self._entries, self._stat_key = entries, key
+                self._inflight = []
+                self._cond.notify_all()
+
+
+def load_leaderboard() -> list[dict]:
+    """Load leaderboard from disk. Returns list of {"name": str, "moves": int}, sorted by moves
+    ascending.
+    """
+    return _read_entries(_get_leaderboard_path())
 
 
 def save_leaderboard(entries: list[dict]) -> None:
-    """Save leaderboard to disk. Expects list of {"name": str, "moves": int} (any order)."""
+    """Save leaderboard to disk (atomically). Expects list of {"name": str, "moves": int} (any
+    order).
+    """
     path = _get_leaderboard_path()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2)
+    with _locked(path):
+        _write_entries(path, entries)
 
 
 def add_score(name: str, moves: int) -> None:
-    """Add a score (4-letter name, move count). Keeps only top LEADERBOARD_SIZE (lowest moves)."""
-    name = (name + "    ")[:4].strip().upper()
-    if not name:
-        name = "????"
-    entries = load_leaderboard()
-    entries.append({"name": name, "moves": moves})
-    entries.sort(key=lambda e: (e["moves"], e["name"]))
-    save_leaderboard(entries[:LEADERBOARD_SIZE])
+    """Add a score (4-letter name, move count). Keeps only top LEADERBOARD_SIZE (lowest moves).
+    Synchronous; use Leaderboard.add_score to write behind.
+    """
+    _merge_into(_get_leaderboard_path(), [(_normalize_name(name), moves)])
 
 
 def get_top10() -> list[tuple[str, int]]:
     """Return top 10 entries as [(name, moves), ...], sorted by moves ascending."""
-    entries = load_leaderboard()
-    return [(e.get("name", "????"), e.get("moves", 0)) for e in entries[:LEADERBOARD_SIZE]]
+    return Leaderboard().top10()
@@ -0,0 +1,40 @@
+"""Loggers that do not import logging until something else has.
+Until then logging is unconfigured, so debug and info records would be dropped anyway.
+"""
+
+import sys
+
+
+class LazyLogger:
+    """Stand-in for logging.getLogger(name) offering debug(), info() and warning()."""
+
+    __slots__ = ("name", "_logger")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._logger = None
+
+    def _resolve(self):
+        logging = sys.modules.get("logging")
+        if logging is not None:
+            self._logger = logging.getLogger(self.name)
+        return self._logger
+
+    def debug(self, msg: str, *args: object) -> None:
+        logger = self._logger or self._resolve()
+        if logger is not None:
+            logger.debug(msg, *args, stacklevel=2)
+
+    def info(self, msg: str, *args: object) -> None:
+        logger = self._logger or self._resolve()
+        if logger is not None:
+            logger.info(msg, *args, stacklevel=2)
+
+    def warning(self, msg: str, *args: object) -> None:
+        import logging
+        self._logger = logging.getLogger(self.name)
+        self._logger.warning(msg, *args, stacklevel=2)
+
+
+def get_logger(name: str) -> LazyLogger:
+    return LazyLogger(name)
@@ -0,0 +1,257 @@
+"""Bitboard occupancy: one bit per cell (index = row * cols + col) packed into a Python int.
+Per-board-size masks and neighbor tables are precomputed once (computed on access past
+TABLE_MAX_CELLS).
+"""
+
+import re
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+
+from catgame.models.position import CELLS, COLS, ROWS, Position
+
+# Neighbor order matches catgame.game.moves.DIRECTION_DELTA: up, down, left, right
+_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Largest board (in cells) whose per-cell tables are built up front
+TABLE_MAX_CELLS = 1 << 12
+
+_RUN = re.compile("1+")
+_ONE = re.compile("1")
+
+
+def set_bits(bits: int) -> list[int]:
+    """Indices of the set bits of `bits`, ascending."""
+    if bits.bit_length() <= TABLE_MAX_CELLS or bits.bit_count() <= 64:
+        out: list[int] = []
+        while bits:
+            low = bits & -bits
+            out.append(low.bit_length() - 1)
+            bits ^= low
+        return out
+    return [m.start() for m in _ONE.finditer(format(bits, "b")[::-1])]
+
+
+class LazyTable:
+    """Read-only per-cell sequence whose entries are computed on access (j in range(size)).
+    cache=True keeps entries once built, for small values such as Positions.
+    """
+
+    __slots__ = ("_build", "_size", "_cache")
+
+    def __init__(self, build: Callable[[int], object], size: int, cache: bool = False) -> None:
+        self._build = build
+        self._size = size
+        self._cache: dict[int, object] | None = {} if cache else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, j: int):
+        cache = self._cache
+        if cache is None:
+            return self._build(j)
+        value = cache.get(j)
+        if value is None:
+            value = cache[j] = self._build(j)
+        return value
+
+
+class Geometry:
+    """Precomputed masks and neighbor tables for a rows x cols board."""
+
+    __slots__ = (
+        "rows", "cols", "size", "full", "not_first_col", "not_last_col",
+        "positions", "neighbor_mask", "neighbors",
+    )
+
+    def __init__(self, rows: int, cols: int) -> None:
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Board must be at least 1x1, got {rows}x{cols}")
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.full = (1 << self.size) - 1
+        # Bit r * cols of every row (most significant row first in the digit string)
+        first_col = int(("0" * (cols - 1) + "1") * rows, 2)
+        self.not_first_col = self.full & ~first_col
+        self.not_last_col = self.full & ~(first_col << (cols - 1))
+        # Per cell: its Position; neighbor_mask (bitboard of in-bounds neighbors); neighbors,
+        # ((bit, index), ...) of in-bounds neighbors in _DELTAS order
+        if (rows, cols) == (ROWS, COLS):
+            self.positions = CELLS
+        elif self.size <= TABLE_MAX_CELLS:
+            self.positions = tuple(Position(r, c) for r in range(rows) for c in range(cols))
+        else:
+            self.positions = LazyTable(self._position, self.size, cache=True)
+        if self.size <= TABLE_MAX_CELLS:
+            self.neighbors = [self._neighbors(j) for j in range(self.size)]
+            self.neighbor_mask = [self._neighbor_mask(j) for j in range(self.size)]
+        else:
+            self.neighbors = LazyTable(self._neighbors, self.size)
+            self.neighbor_mask = LazyTable(self._neighbor_mask, self.size)
+
+    def _position(self, j: int) -> Position:
+        return Position(*divmod(j, self.cols))
+
+    def _neighbors(self, j: int) -> tuple[tuple[int, int], ...]:
+        r, c = divmod(j, self.cols)
+        return tuple(
+            (1 << (j + dr * self.cols + dc), j + dr * self.cols + dc)
+            for dr, dc in _DELTAS
+            if 0 <= r + dr < self.rows and 0 <= c + dc < self.cols
+        )
+
+    def _neighbor_mask(self, j: int) -> int:
+        mask = 0
+        for bit, _ in self._neighbors(j):
+            mask |= bit
+        return mask
+
+    def index(self, pos: Position) -> int:
+        return pos.row * self.cols + pos.col
+
+    def bit(self, pos: Position) -> int:
+        return 1 << (pos.row * self.cols + pos.col)
+
+    def bits_of(self, positions) -> int:
+        """Pack an iterable of Positions into a bitboard."""
+        cols = self.cols
+        return self.bits_of_indices(p.row * cols + p.col for p in positions)
+
+    def bits_of_indices(self, indices: Iterable[int]) -> int:
+        """Pack an iterable of cell indices into a bitboard."""
+        digits = bytearray(b"0") * self.size
+        for j in indices:
+            digits[j] = 49  # "1"
+        digits.reverse()
+        return int(digits, 2) if digits else 0
+
+    def positions_of(self, bits: int) -> list[Position]:
+        """Unpack a bitboard into Positions, in row-major order."""
+        positions = self.positions
+        return [positions[j] for j in set_bits(bits)]
+
+    def touching(self, bits: int) -> int:
+        """Cells 4-adjacent to some cell of `bits`."""
+        cols = self.cols
+        return (
+            (bits >> cols)
+            | ((bits << cols) & self.full)
+            | ((bits & self.not_first_col) >> 1)
+            | ((bits & self.not_last_col) << 1)
+        )
+
+    def dilate(self, bits: int) -> int:
+        """Cells in `bits` plus their 4-neighbors (clipped to the board)."""
+        cols = self.cols
+        return (
+            bits
+            | (bits >> cols)
+            | ((bits << cols) & self.full)
+            | ((bits & self.not_first_col) >> 1)
+            | ((bits & self.not_last_col) << 1)
+        )
+
+    def flood(self, start: int, free: int) -> int:
+        """Cells of `free` 4-connected to the `start` bits (start itself included)."""
+        reach = start
+        while True:
+            grown = self.dilate(reach) & (free | start)
+            if grown == reach:
+                return reach
+            reach = grown
+
+    def components(self, free: int) -> list[int]:
+        """4-connected components of `free` as bitboards, ordered by lowest cell index."""
+        out: list[int] = []
+        while free:
+            comp = self.flood(free & -free, free)
+            out.append(comp)
+            free &= ~comp
+        return out
+
+    def label(self, free: int) -> tuple[list[int], list[int]]:
+        """4-connected components of `free` as (label per cell, -1 outside `free`; cell count
+        per label), in components() order. Linear in the board, unlike components().
+        """
+        rows, cols = self.rows, self.cols
+        flags = format(free, f"0{self.size}b")[::-1]
+        finditer = _RUN.finditer
+        # Run k spans cells run_start[k]..run_end[k]-1; parent[k] < k unless k is a root, so
+        # each component's root is its first run in row-major order
+        parent: list[int] = []
+        run_start: list[int] = []
+        run_end: list[int] = []
+        above_lo: list[int] = []  # previous row's runs: first col, end col, run id
+        above_hi: list[int] = []
+        above_id: list[int] = []
+        for r in range(rows):
+            base = r * cols
+            row_lo: list[int] = []
+            row_hi: list[int] = []
+            row_id: list[int] = []
+            i = 0
+            n_above = len(above_hi)
+            for match in finditer(flags, base, base + cols):
+                start, end = match.span()
+                lo, hi = start - base, end - base
+                while i < n_above and above_hi[i] <= lo:
+                    i += 1
+                k = len(parent)
+                root = k
+                # Union with every run above that shares a column
+                t = i
+                while t < n_above and above_lo[t] < hi:
+                    a = above_id[t]
+                    while parent[a] != a:
+                        parent[a] = parent[parent[a]]
+                        a = parent[a]
+                    if a < root:
+                        if root != k:
+                            parent[root] = a
+                        root = a
+                    elif a > root:
+                        parent[a] = root
+                    t += 1
+                parent.append(root)
+                row_lo.append(lo)
+                row_hi.append(hi)
+                row_id.append(k)
+                run_start.append(start)
+                run_end.append(end)
+            above_lo, above_hi, above_id = row_lo, row_hi, row_id
+        node = [-1] * self.size
+        sizes: list[int] = []
+        labels = [-1] * len(parent)
+        for k in range(len(parent)):
+            a = parent[k]
+            while parent[a] != a:
+                a = parent[a]
+            parent[k] = a
+            lab = labels[a]
+            if lab < 0:
+                lab = labels[a] = len(sizes)
+                sizes.append(0)
+            start, end = run_start[k], run_end[k]
+            node[start:end] = [lab] * (end - start)
+            sizes[lab] += end - start
+        return node, sizes
+
+    def connected(self, start: int, goal: int, blocked: int) -> bool:
+        """True if the cells at indices start and goal are joined by a path avoiding `blocked`."""
+        goal_bit = 1 << goal
+        free = self.full & ~blocked | goal_bit
+        reach = 1 << start
+        while True:
+            grown = self.dilate(reach) & free
+            if grown & goal_bit:
+                return True
+            if grown == reach:
+                return reach & goal_bit != 0
+            reach = grown
+
+
+@lru_cache(maxsize=None)
+def geometry(rows: int = ROWS, cols: int = COLS) -> Geometry:
+    """Shared Geometry for a board size (built once per size)."""
+    return Geometry(rows, cols)
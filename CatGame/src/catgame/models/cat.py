@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from catgame.models.position import Position
 
 
-@dataclass
+@dataclass(slots=True)
 class Cat:
     """Cat has a position on the grid."""
 
@@ -0,0 +1,190 @@
+"""Incremental connectivity of the free (non-obstacle) cells, kept alongside a Grid.
+Union-find with a cell -> node indirection, so a blocked cell can split its component.
+"""
+
+from array import array
+
+from catgame.models.bitboard import Geometry, set_bits
+
+# Ring around a cell in circular order; consecutive entries are 4-adjacent to each other.
+# Even positions are the cell's own 4-neighbors.
+_RING = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def _ring(geo: Geometry, j: int) -> list[int]:
+    """The 8 ring cell indices around cell j (-1 when off the board)."""
+    rows, cols = geo.rows, geo.cols
+    r, c = divmod(j, cols)
+    return [
+        (r + dr) * cols + c + dc if 0 <= r + dr < rows and 0 <= c + dc < cols else -1
+        for dr, dc in _RING
+    ]
+
+
+class Connectivity:
+    """Which free cells reach each other. node[j] is cell j's union-find node (-1 if blocked).
+    Updated in place; with_blocked() returns an updated copy.
+    """
+
+    __slots__ = ("geometry", "free", "node", "parent", "size")
+
+    def __init__(
+        self, geometry: Geometry, free: int, node: array, parent: list[int], size: list[int]
+    ) -> None:
+        self.geometry = geometry
+        self.free = free
+        self.node = node
+        self.parent = parent
+        self.size = size
+
+    @classmethod
+    def from_bits(
+        cls, geo: Geometry, blocked: int, labels: tuple[list[int], list[int]] | None = None
+    ) -> "Connectivity":
+        """Index with one node per free component (labels: geo.label of the free cells, if
+        the caller already has them).
+        """
+        free = geo.full & ~blocked
+        node, size = labels if labels is not None else geo.label(free)
+        return cls(geo, free, array("i", node), list(range(len(size))), size)
+
+    def copy(self) -> "Connectivity":
+        return Connectivity(
+            self.geometry, self.free, self.node[:], self.parent.copy(), self.size.copy()
+        )
+
+    def with_blocked(self, blocked: int) -> "Connectivity":
+        """Copy updated to the obstacle bitboard `blocked`: frees first, then blocks."""
+        conn = self.copy()
+        free = self.geometry.full & ~blocked
+        opened, closed = free & ~self.free, self.free & ~free
+        # Node ids only grow (splits and frees); relabel from scratch once they get sparse
+        if len(conn.parent) + (opened | closed).bit_count() > 4 * self.geometry.size:
+            return Connectivity.from_bits(self.geometry, blocked)
+        while opened:
+            low = opened & -opened
+            conn.unblock(low.bit_length() - 1)
+            opened ^= low
+        while closed:
+            low = closed & -closed
+            conn.block(low.bit_length() - 1)
+            closed ^= low
+        return conn
+
+    def _find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def _new_node(self, size: int) -> int:
+        k = len(self.parent)
+        self.parent.append(k)
+        self.size.append(size)
+        return k
+
+    def connected(self, a: int, b: int) -> bool:
+        """True if free cells a and b (cell indices) are joined by free cells."""
+        na, nb = self.node[a], self.node[b]
+        if na < 0 or nb < 0:
+            return False
+        return self._find(na) == self._find(nb)
+
+    def component(self, j: int) -> int:
+        """Id of cell j's component (-1 if blocked): equal ids mean connected cells. Ids are
+        only comparable until the next update.
+        """
+        n = self.node[j]
+        return self._find(n) if n >= 0 else -1
+
+    def component_size(self, j: int) -> int:
+        """Free cells in j's component (0 if j is blocked)."""
+        n = self.node[j]
+        return self.size[self._find(n)] if n >= 0 else 0
+
+    def unblock(self, j: int) -> None:
+        """Cell j becomes free: new node, union with each free 4-neighbor (union by size)."""
+        if (self.free >> j) & 1:
+            return
+        self.free |= 1 << j
+        root = self._new_node(1)
+        self.node[j] = root
+        parent, size, node = self.parent, self.size, self.node
+        for bit, nj in self.geometry.neighbors[j]:
+            if not self.free & bit:
+                continue
+            other = self._find(node[nj])
+            if other == root:
+                continue
+            if size[root] < size[other]:
+                root, other = other, root
+            parent[other] = root
+            size[root] += size[other]
+
+    def block(self, j: int) -> None:
+        """Cell j becomes an obstacle; splits its component if j was a cut cell."""
+        if not (self.free >> j) & 1:
+            return
+        geo = self.geometry
+        self.free &= ~(1 << j)
+        root = self._find(self.node[j])
+        self.size[root] -= 1
+        self.node[j] = -1
+        free = self.free
+        cells = _ring(geo, j)
+        ring = [c >= 0 and (free >> c) & 1 == 1 for c in cells]
+        if all(ring):
+            return
+        # Label free runs of the ring, starting just after a blocked position; keep one
+        # 4-neighbor per run that has any
+        start = ring.index(False)
+        run, runs, prev = -1, set(), False
+        reps: list[int] = []
+        for step in range(1, 9):
+            pos = (start + step) % 8
+            if ring[pos] and not prev:
+                run += 1
+            prev = ring[pos]
+            if ring[pos] and pos % 2 == 0 and run not in runs:
+                runs.add(run)
+                reps.append(cells[pos])
+        if len(reps) <= 1:
+            return
+        # Free neighbors are only joined (if at all) the long way round. Grow all sides one
+        # step at a time: sides that meet merge; a side that stops growing is a piece cut off.
+        # Work is bounded by the shorter detour or the smaller piece, not the board.
+        dilate = geo.dilate
+        sides = [1 << rep for rep in reps]
+        pieces: list[int] = []
+        while True:
+            merged: list[int] = []
+            for side in sides:
+                for i, other in enumerate(merged):
+                    if other & side:
+                        side |= other
+                        merged[i] = 0
+                merged = [m for m in merged if m]
+                merged.append(side)
+            if len(merged) + len(pieces) <= 1:
+                return
+            sides = []
+            for side in merged:
+                grown = dilate(side) & free
+                if grown == side:
+                    pieces.append(side)
+                else:
+                    sides.append(grown)
+            if len(sides) <= 1:
+                break
+        # Split: the side still growing (else the largest piece) keeps the old node
+        if not sides:
+            pieces.sort(key=int.bit_count)
+            pieces.pop()
+        node = self.node
+        for piece in pieces:
+            count = piece.bit_count()
+            self.size[root] -= count
+            k = self._new_node(count)
+            for j in set_bits(piece):
+                node[j] = k
@@ -1,15 +1,23 @@
-"""Full game snapshot: grid, cat, mouse, seed, status, message."""
+"""Full game snapshot: grid, cat, mouse, seed, status, message, turn, mouse_ai, occupancy."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from catgame.models.cat import Cat
 from catgame.models.grid import Grid
 from catgame.models.mouse import Mouse
+from catgame.models.occupancy import Occupancy
+from catgame.models.zobrist import WON_KEY, piece_keys
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
-    """Current positions, obstacle layout, status (playing | won), optional message."""
+    """Current positions, obstacle layout, status (playing | won), optional message.
+    turn counts applied cat moves; with seed it determines all in-game randomness.
+    mouse_ai names how the mouse measures distance from the cat ("manhattan" | "bfs").
+    key is a 64-bit Zobrist hash of (obstacles, cat, mouse, won); see inherit_key.
+    occupancy holds every agent in games with several cats or mice (None: one of each);
+    cat and mouse are then the first cat and the first mouse left.
+    """
 
     grid: Grid
     cat: Cat
@@ -17,3 +25,45 @@ class GameState:
     seed: int
     status: str  # "playing" | "won"
     message: str = ""
+    turn: int = 0
+    mouse_ai: str = "manhattan"
+    occupancy: Occupancy | None = None
+    _key: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _piece_key(self) -> int:
+        """Cat, mouse and status terms of the key (everything but the grid's hash).
+        O(agents) with an occupancy index.
+        """
+        geo = self.grid.geometry
+        cat_keys, mouse_keys = piece_keys(geo.size)
+        if self.occupancy is not None:
+            key = 0
+            for j in self.occupancy.cats:
+                key ^= cat_keys[j]
+            for j in self.occupancy.mice:
+                key ^= mouse_keys[j]
+        else:
+            cat, mouse = self.cat.position, self.mouse.position
+            cols = geo.cols
+            key = cat_keys[cat.row * cols + cat.col] ^ mouse_keys[mouse.row * cols + mouse.col]
+        return key ^ WON_KEY if self.status == "won" else key
+
+    @property
+    def key(self) -> int:
+        """Zobrist key: equal positions have equal keys. O(1) once the grid's hash is known
+        (grids derived with with_obstacles carry theirs over).
+        """
+        if self._key is None:
+            self._key = self.grid.zobrist ^ self._piece_key()
+        return self._key
+
+    def inherit_key(self, parent: "GameState") -> None:
+        """Derive this state's key from parent's by XORing out what changed, if parent's key
+        is already known (otherwise it stays lazy).
+        """
+        if parent._key is None:
+            return
+        key = parent._key ^ parent._piece_key() ^ self._piece_key()
+        if self.grid is not parent.grid:
+            key ^= parent.grid.zobrist ^ self.grid.zobrist
+        self._key = key
@@ -1,21 +1,81 @@
 """Grid with obstacles. Obstacles block movement."""
 
-from catgame.models.position import Position, ROWS, COLS
+from catgame.models.bitboard import Geometry, geometry
+from catgame.models.connectivity import Connectivity
+from catgame.models.position import COLS, ROWS, Position
+from catgame.models.zobrist import zobrist_hash, zobrist_keys
 
 
 class Grid:
-    """Playable area. width=COLS, height=ROWS; obstacles is set of Position."""
+    """Playable area of height=rows, width=cols (default ROWS x COLS); obstacles is set of Position.
+    Occupancy is also kept as a bitboard (`bits`, bit row * cols + col) for fast lookups.
+    """
 
-    def __init__(self, obstacles: set[Position]) -> None:
-        self.width = COLS
-        self.height = ROWS
+    __slots__ = ("width", "height", "geometry", "bits", "_obstacles", "_connectivity", "_zobrist")
+
+    def __init__(self, obstacles: set[Position], rows: int = ROWS, cols: int = COLS) -> None:
+        self.width = cols
+        self.height = rows
         for p in obstacles:
-            if not (0 <= p.row < ROWS and 0 <= p.col < COLS):
+            if not (0 <= p.row < rows and 0 <= p.col < cols):
                 raise ValueError(f"Obstacle out of bounds: {p}")
-        self.obstacles = frozenset(obstacles)
+        self._obstacles = frozenset(obstacles)
+        self.geometry: Geometry = geometry(rows, cols)
+        self.bits = self.geometry.bits_of(self._obstacles)
+        self._connectivity = None
+        self._zobrist = None
+
+    @classmethod
+    def from_bits(
+        cls, bits: int, connectivity: Connectivity | None = None, rows: int = ROWS, cols: int = COLS
+    ) -> "Grid":
+        """Build a rows x cols grid from an obstacle bitboard (bits outside the board are
+        rejected). connectivity, if given, must describe the same bits.
+        """
+        geo = geometry(rows, cols)
+        if bits < 0 or bits > geo.full:
+            raise ValueError("Obstacle bitboard has cells out of bounds")
+        grid = cls.__new__(cls)
+        grid.width = cols
+        grid.height = rows
+        grid.geometry = geo
+        grid.bits = bits
+        grid._obstacles = None
+        grid._connectivity = connectivity
+        grid._zobrist = None
+        return grid
+
+    @property
+    def connectivity(self) -> Connectivity:
+        if self._connectivity is None:
+            self._connectivity = Connectivity.from_bits(self.geometry, self.bits)
+        return self._connectivity
+
+    @property
+    def zobrist(self) -> int:
+        """Zobrist hash of the obstacle layout (equal layouts hash equal)."""
+        if self._zobrist is None:
+            self._zobrist = zobrist_hash(self.bits, zobrist_keys(self.geometry.size))
+        return self._zobrist
+
+    def with_obstacles(self, bits: int) -> "Grid":
+        """Grid with obstacle bitboard `bits`; its connectivity and zobrist hash (if this grid's
+        is known) are this grid's, updated only for the cells that changed.
+        """
+        geo = self.geometry
+        grid = Grid.from_bits(bits, self.connectivity.with_blocked(bits), geo.rows, geo.cols)
+        if self._zobrist is not None:
+            grid._zobrist = self._zobrist ^ zobrist_hash(self.bits ^ bits, zobrist_keys(geo.size))
+        return grid
+
+    @property
+    def obstacles(self) -> frozenset[Position]:
+        if self._obstacles is None:
+            self._obstacles = frozenset(self.geometry.positions_of(self.bits))
+        return self._obstacles
 
     def is_blocked(self, pos: Position) -> bool:
-        return pos in self.obstacles
+        return (self.bits >> (pos.row * self.width + pos.col)) & 1 == 1
 
     def in_bounds(self, pos: Position) -> bool:
-        return 0 <= pos.row < self.width and 0 <= pos.col < self.height
+        return 0 <= pos.row < self.height and 0 <= pos.col < self.width
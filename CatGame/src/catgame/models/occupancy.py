@@ -0,0 +1,119 @@
+"""Spatial occupancy index for games with several cats and mice.
+Agents are cell indices (row * cols + col); cats are also bucketed into square blocks.
+"""
+
+from functools import lru_cache
+from math import isqrt
+
+from catgame.models.bitboard import Geometry
+
+CAT = 1
+MOUSE = 2
+
+
+class Occupancy:
+    """Cats and remaining mice of one game state, indexed by cell. Treated as immutable:
+    moved() builds the index for the next state. caught counts mice caught so far.
+    """
+
+    __slots__ = ("geometry", "cats", "mice", "caught", "cells", "block", "_buckets")
+
+    def __init__(
+        self, geometry: Geometry, cats: tuple[int, ...], mice: tuple[int, ...], caught: int = 0,
+        cells: dict[int, int] | None = None,
+    ) -> None:
+        if not cats:
+            raise ValueError("A game needs at least one cat")
+        self.geometry = geometry
+        self.cats = cats
+        self.mice = mice
+        self.caught = caught
+        if cells is None:
+            cells = dict.fromkeys(cats, CAT)
+            if len(cells) != len(cats):
+                raise ValueError("Two cats on one cell")
+            for j in mice:
+                if j in cells:
+                    raise ValueError(f"Cell {j} is occupied twice")
+                cells[j] = MOUSE
+        self.cells = cells
+        # About one cat per block; the block count stays linear in the cats
+        self.block = max(1, isqrt(geometry.size // len(cats)))
+        self._buckets: dict[int, list[tuple[int, int]]] | None = None
+
+    def moved(
+        self, cats: tuple[int, ...], mice: tuple[int, ...], caught: int, cells: dict[int, int]
+    ) -> "Occupancy":
+        """Index for the agents after a turn (cells must already match cats and mice)."""
+        return Occupancy(self.geometry, cats, mice, caught, cells)
+
+    def _cat_buckets(self) -> dict[int, list[tuple[int, int]]]:
+        """Cats by block, keyed block_row * stride + block_col (see _stride)."""
+        if self._buckets is None:
+            cols, block = self.geometry.cols, self.block
+            stride = self._stride()
+            buckets: dict[int, list[tuple[int, int]]] = {}
+            for j in self.cats:
+                r, c = divmod(j, cols)
+                buckets.setdefault(r // block * stride + c // block, []).append((r, c))
+            self._buckets = buckets
+        return self._buckets
+
+    def _stride(self) -> int:
+        """Key stride wide enough that blocks off either side of the board (as far as any ring
+        reaches) never alias a real block, so ring lookups need no bounds checks.
+        """
+        geo = self.geometry
+        return 3 * (max(geo.rows, geo.cols) // self.block + 1)
+
+    def cats_near(self, row: int, col: int, slack: int = 0) -> list[tuple[int, int]]:
+        """(row, col) of a few cats that include the nearest cat (Manhattan) to every cell
+        within `slack` steps of (row, col). Searches rings of blocks outward from (row, col).
+        """
+        geo = self.geometry
+        block = self.block
+        stride = self._stride()
+        get = self._cat_buckets().get
+        br, bc = row // block, col // block
+        base = br * stride + bc
+        last_r, last_c = (geo.rows - 1) // block, (geo.cols - 1) // block
+        # Steps from (row, col) out of its own block: ring d starts (d - 1) * block beyond that
+        margin = min(
+            row - br * block, (br + 1) * block - 1 - row,
+            col - bc * block, (bc + 1) * block - 1 - col,
+        )
+        # Cats seen so far and their distances, gathered a ring at a time
+        found: list[tuple[int, int]] = []
+        dists: list[int] = []
+        best = geo.rows + geo.cols
+        for d in range(max(br, last_r - br, bc, last_c - bc) + 1):
+            if d and best + 2 * slack <= (d - 1) * block + margin:
+                break
+            seen = len(found)
+            for offset in _ring(d, stride):
+                cats = get(base + offset)
+                if cats is not None:
+                    found += cats
+            if len(found) > seen:
+                ring = [abs(cr - row) + abs(cc - col) for cr, cc in found[seen:]]
+                dists += ring
+                best = min(best, min(ring))
+        # A cat more than 2 * slack steps behind the nearest cannot be nearest to any of those cells
+        limit = best + 2 * slack
+        return [cat for cat, dist in zip(found, dists) if dist <= limit]
+
+    def nearest_cat(self, row: int, col: int) -> int:
+        """Manhattan distance from (row, col) to the nearest cat."""
+        return min(abs(cr - row) + abs(cc - col) for cr, cc in self.cats_near(row, col))
+
+
+@lru_cache(maxsize=256)
+def _ring(d: int, stride: int) -> tuple[int, ...]:
+    """Key offsets of the blocks at Chebyshev distance d (block keys are row * stride + col)."""
+    if d == 0:
+        return (0,)
+    return tuple(
+        dr * stride + dc
+        for dr in range(-d, d + 1)
+        for dc in (range(-d, d + 1) if abs(dr) == d else (-d, d))
+    )
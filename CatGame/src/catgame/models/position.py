@@ -1,24 +1,71 @@
-"""Cell position on the grid. Row in 0..ROWS-1, col in 0..COLS-1."""
+"""Cell position on the grid. Row in 0..rows-1, col in 0..cols-1 of the game's board
+(ROWS x COLS unless the game was created with another size).
+"""
 
 from dataclasses import dataclass
 
+# Default board size
 ROWS = 20
 COLS = 30
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
-    """A cell location on the grid. row in [0, ROWS-1], col in [0, COLS-1]."""
+    """A cell location on the grid: row and col are >= 0 (Grid.in_bounds checks the rest)."""
 
     row: int
     col: int
 
     def __post_init__(self) -> None:
-        if not (0 <= self.row < ROWS and 0 <= self.col < COLS):
+        if self.row < 0 or self.col < 0:
             raise ValueError(f"Position out of bounds: ({self.row}, {self.col})")
 
+    @staticmethod
+    def at(row: int, col: int) -> "Position":
+        """Canonical instance for (row, col) on the default board: no allocation, no validation.
+        Other board sizes intern through their Geometry (geometry(rows, cols).positions).
+        """
+        return CELLS[row * COLS + col]
+
+    # Explicit so dataclass keeps them: identity short-circuit and an int hash (no tuples)
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not Position:
+            return NotImplemented
+        return self.row == other.row and self.col == other.col
+
+    def __hash__(self) -> int:
+        return (self.row << 16) ^ self.col
+
     def __add__(self, other: "Position") -> "Position":
         return Position(self.row + other.row, self.col + other.col)
 
     def manhattan_distance(self, other: "Position") -> int:
         return abs(self.row - other.row) + abs(self.col - other.col)
+
+    def adjacent(self) -> tuple["Position", ...]:
+        """4-neighbors on the default board (up, down, left, right) as canonical instances."""
+        return ADJACENT[self.row * COLS + self.col]
+
+
+def _cell(row: int, col: int) -> Position:
+    p = object.__new__(Position)
+    object.__setattr__(p, "row", row)
+    object.__setattr__(p, "col", col)
+    return p
+
+
+# Intern table: CELLS[row * COLS + col] is the canonical Position of every cell
+CELLS: tuple[Position, ...] = tuple(_cell(r, c) for r in range(ROWS) for c in range(COLS))
+
+# ADJACENT[row * COLS + col]: canonical in-bounds 4-neighbors in up, down, left, right order
+ADJACENT: tuple[tuple[Position, ...], ...] = tuple(
+    tuple(
+        CELLS[(r + dr) * COLS + c + dc]
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+        if 0 <= r + dr < ROWS and 0 <= c + dc < COLS
+    )
+    for r in range(ROWS)
+    for c in range(COLS)
+)
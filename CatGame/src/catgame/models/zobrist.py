@@ -0,0 +1,42 @@
+"""Zobrist hashing: a fixed random 64-bit key per (piece, cell), XORed over the occupied cells."""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+from catgame.models.bitboard import TABLE_MAX_CELLS, LazyTable, set_bits
+from catgame.placement.rng import GOLDEN_GAMMA, MASK64, mix64
+
+# Fixed so hashes are stable across runs and processes
+_ZOBRIST_SEED = 0x5A0B_C0DE_CA7_5EED
+
+OBSTACLE = 0
+CAT = 1
+MOUSE = 2
+
+# XORed into the key of a finished game, so "won" never collides with the same position in play
+WON_KEY = mix64(_ZOBRIST_SEED ^ MASK64)
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size: int, piece: int = OBSTACLE) -> Sequence[int]:
+    """Per-cell keys of one piece kind on a board of `size` cells (SplitMix64 stream).
+    A tuple up to TABLE_MAX_CELLS; past that the same keys are computed on access.
+    """
+    base = mix64(_ZOBRIST_SEED + piece)
+    if size > TABLE_MAX_CELLS:
+        return LazyTable(lambda j: mix64((base + (j + 1) * GOLDEN_GAMMA) & MASK64), size)
+    return tuple(mix64((base + (j + 1) * GOLDEN_GAMMA) & MASK64) for j in range(size))
+
+
+@lru_cache(maxsize=None)
+def piece_keys(size: int) -> tuple[Sequence[int], Sequence[int]]:
+    """(cat keys, mouse keys) for a board of `size` cells."""
+    return zobrist_keys(size, CAT), zobrist_keys(size, MOUSE)
+
+
+def zobrist_hash(bits: int, keys: Sequence[int]) -> int:
+    """XOR of the keys of every cell set in the bitboard `bits`."""
+    h = 0
+    for j in set_bits(bits):
+        h ^= keys[j]
+    return h
@@ -1,32 +1,112 @@
-"""Mouse move: maximize distance from cat and escape options; deterministic tie-break. None if no valid move."""
+"""Mouse move: maximize distance from cat and escape options; deterministic tie-break. None if
+no valid move. Distance is Manhattan ("manhattan") or the cat's path around obstacles ("bfs").
+"""
 
-from catgame.game.moves import get_valid_moves
-from catgame.models import GameState, Mouse, Position
+from catgame.models import GameState, Grid, Position
+from catgame.models.occupancy import Occupancy
+from catgame.mouse_ai.distance import DistanceField, distance_field
+
+MOUSE_AI_MODES = ("manhattan", "bfs")
 
 
 def choose_mouse_move(state: GameState) -> Position | None:
     """Return the best move for the mouse.
     Prefers: 1) farther from cat (Manhattan), 2) more valid moves next turn (avoid corners).
     Tie-break: row then col order. Returns None if no valid move (caller treats as win).
+    Distance is measured as state.mouse_ai says (see MOUSE_AI_MODES).
+    """
+    return choose_mouse_move_at(
+        state.grid, state.cat.position, state.mouse.position, state.mouse_ai
+    )
+
+
+def choose_mouse_move_at(
+    grid: Grid, cat_pos: Position, mouse_pos: Position, mode: str = "manhattan"
+) -> Position | None:
+    """choose_mouse_move without a GameState: escape options are neighbor-mask popcounts,
+    and the score is one int (no per-candidate states or tuples).
+    In "bfs" mode a cell the cat cannot reach at all counts as farther than any it can.
     """
-    moves = get_valid_moves(state, "mouse")
-    if not moves:
-        return None
-    cat_pos = state.cat.position
-
-    def score(p: Position) -> tuple[int, int, int, int]:
-        # 1) Maximize distance from cat
-        dist = p.manhattan_distance(cat_pos)
-        # 2) Prefer positions with more escape options next turn (avoid dead ends / corners)
-        next_state = GameState(
-            grid=state.grid,
-            cat=state.cat,
-            mouse=Mouse(p),
-            seed=state.seed,
-            status="playing",
-            message="",
+    geo = grid.geometry
+    cols = geo.cols
+    positions = geo.positions
+    neighbor_mask = geo.neighbor_mask
+    blocked = grid.bits | (1 << (cat_pos.row * cols + cat_pos.col))
+    free = geo.full & ~blocked
+    cat_row, cat_col = cat_pos.row, cat_pos.col
+    field = distance_field(grid, cat_row * cols + cat_col) if mode == "bfs" else None
+    best = None
+    best_key = -1
+    for bit, j in geo.neighbors[mouse_pos.row * cols + mouse_pos.col]:
+        if blocked & bit:
+            continue
+        p = positions[j]
+        if field is None:
+            dist = abs(p.row - cat_row) + abs(p.col - cat_col)
+        else:
+            dist = field.distance(j)
+            if dist is None:
+                dist = geo.size
+        options = (neighbor_mask[j] & free).bit_count()
+        # Same order as (dist, options, -row, -col): options <= 4,
+        # smaller index = smaller (row, col)
+        key = (dist * 5 + options) * geo.size + (geo.size - 1 - j)
+        if key > best_key:
+            best_key = key
+            best = p
+    return best
+
+
+def choose_mouse_move_among(
+    grid: Grid, occupancy: Occupancy, mouse: int, field: DistanceField | None = None
+) -> int | None:
+    """choose_mouse_move_at for the mouse on cell `mouse` in a game with several agents:
+    distance is to the nearest cat (field in "bfs" mode), and other agents block.
+    Returns the cell index to move to, or None if the mouse is boxed in.
+    """
+    geo = grid.geometry
+    rows, cols, size = geo.rows, geo.cols, geo.size
+    node = grid.connectivity.node
+    cells = occupancy.cells
+    row, col = divmod(mouse, cols)
+    near = occupancy.cats_near(row, col, 1) if field is None else None
+    best = None
+    best_key = -1
+    for j, r, c in _steps(mouse, row, col, rows, cols):
+        if node[j] < 0 or j in cells:
+            continue
+        if near is not None:
+            dist = min([abs(cr - r) + abs(cc - c) for cr, cc in near])
+        else:
+            dist = field.distance(j)
+            if dist is None:
+                dist = size
+        # Free neighbors; the mouse's own cell counts as free, it is about to leave it
+        options = (
+            (r > 0 and node[j - cols] >= 0 and (j - cols == mouse or j - cols not in cells))
+            + (
+                r + 1 < rows and node[j + cols] >= 0
+                and (j + cols == mouse or j + cols not in cells)
+            )
+            + (c > 0 and node[j - 1] >= 0 and (j - 1 == mouse or j - 1 not in cells))
+            + (c + 1 < cols and node[j + 1] >= 0 and (j + 1 == mouse or j + 1 not in cells))
         )
-        num_options = len(get_valid_moves(next_state, "mouse"))
-        return (dist, num_options, -p.row, -p.col)
+        key = (dist * 5 + options) * size + (size - 1 - j)
+        if key > best_key:
+            best_key = key
+            best = j
+    return best
+
 
-    return max(moves, key=score)
+def _steps(j: int, r: int, c: int, rows: int, cols: int) -> list[tuple[int, int, int]]:
+    """(index, row, col) of the in-bounds 4-neighbors of cell j at (r, c)."""
+    out = []
+    if r:
+        out.append((j - cols, r - 1, c))
+    if r + 1 < rows:
+        out.append((j + cols, r + 1, c))
+    if c:
+        out.append((j - 1, r, c - 1))
+    if c + 1 < cols:
+        out.append((j + 1, r, c + 1))
+    return out
@@ -0,0 +1,211 @@
+"""Obstacle-aware distances from the cat: BFS distance fields, cached and repaired in place.
+reach[d] is the bitboard of free cells within d steps; layers grow only as far as a query needs.
+"""
+
+from collections import OrderedDict
+
+from catgame.models import Grid
+from catgame.models.bitboard import Geometry
+
+FIELD_CACHE_SIZE = 256
+# Cap on the layers held across cached fields, in cells (a layer is a board-sized bitboard
+# and its bytes, so this is ~128 MiB); only binds on large boards, where one field can hold
+# thousands of layers
+FIELD_CACHE_CELLS = 1 << 29
+# Repair only layouts this close to the base field's (a reshuffle moves at most 6 cells);
+# past that a fresh field is cheaper than locating every change
+REPAIR_MAX_CHANGES = 12
+
+
+class DistanceField:
+    """Shortest 4-connected path lengths over the free cells `free` from cell `source`."""
+
+    __slots__ = ("geometry", "free", "source", "reach", "done", "_nbytes", "_free_bytes", "_layers")
+
+    def __init__(
+        self, geometry: Geometry, free: int, source: int, reach: list[int] | None = None,
+        layers: list[bytes] | None = None,
+    ) -> None:
+        self.geometry = geometry
+        self.free = free | (1 << source)
+        self.source = source
+        self.reach = reach if reach is not None else [1 << source]
+        self.done = False
+        self._nbytes = (geometry.size + 7) // 8
+        self._free_bytes = self.free.to_bytes(self._nbytes, "little")
+        # reach as bytes (layers: bytes of a prefix of reach the caller already has)
+        self._layers = layers if layers is not None else []
+        for grown in self.reach[len(self._layers):]:
+            self._layers.append(grown.to_bytes(self._nbytes, "little"))
+
+    def _grow(self) -> bool:
+        """Add one BFS layer; False once the source's component is exhausted."""
+        last = self.reach[-1]
+        grown = self.geometry.dilate(last) & self.free
+        if grown == last:
+            self.done = True
+            return False
+        self.reach.append(grown)
+        self._layers.append(grown.to_bytes(self._nbytes, "little"))
+        return True
+
+    def _first(self, mask: int) -> int | None:
+        """Smallest d with reach[d] & mask among the layers grown so far (None if none)."""
+        reach = self.reach
+        if not reach[-1] & mask:
+            return None
+        lo, hi = 0, len(reach) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if reach[mid] & mask:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def distance(self, j: int) -> int | None:
+        """Steps from the source to cell j, or None if j is blocked or cut off."""
+        byte, bit = j >> 3, 1 << (j & 7)
+        if not self._free_bytes[byte] & bit:
+            return None
+        layers = self._layers
+        while not layers[-1][byte] & bit:
+            if self.done or not self._grow():
+                return None
+        # Queries cluster around the mouse, near the outermost grown layer: look a few
+        # layers down from it before falling back to a binary search
+        d = len(layers) - 1
+        for _ in range(3):
+            if not (d and layers[d - 1][byte] & bit):
+                return d
+            d -= 1
+        lo, hi = 0, d
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if layers[mid][byte] & bit:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def repaired(self, free: int) -> "DistanceField":
+        """Field for the same source over new free cells `free`, keeping the layers below the
+        first one the change can affect.
+        """
+        free |= 1 << self.source
+        keep = len(self.reach)
+        neighbor_mask = self.geometry.neighbor_mask
+        closed = self.free & ~free
+        opened = free & ~self.free
+        while closed:
+            low = closed & -closed
+            closed ^= low
+            d = self._first(low)
+            if d is not None and d < keep:
+                keep = d
+        while opened:
+            low = opened & -opened
+            opened ^= low
+            d = self._first(neighbor_mask[low.bit_length() - 1])
+            if d is not None and d + 1 < keep:
+                keep = d + 1
+        field = DistanceField(
+            self.geometry, free, self.source, self.reach[:keep], self._layers[:keep]
+        )
+        # Only a layout that opened nothing keeps an exhausted component exhausted: an opened
+        # cell next to the last layer leaves keep == len(reach) but extends the component
+        if self.done and not free & ~self.free and keep == len(self.reach):
+            field.done = True
+        return field
+
+
+class DistanceCache:
+    """LRU of distance fields keyed by (grid.zobrist, source cell), bounded by maxsize and
+    max_cells (layer cells held; the newest field is always kept).
+    """
+
+    def __init__(self, maxsize: int = FIELD_CACHE_SIZE, max_cells: int = FIELD_CACHE_CELLS) -> None:
+        self.maxsize = maxsize
+        self.max_cells = max_cells
+        self._fields: OrderedDict[tuple[int, int], DistanceField] = OrderedDict()
+        # Layers counted against max_cells per cached field, and their total in cells
+        self._charged: dict[tuple[int, int], int] = {}
+        self._cells = 0
+        self._last: tuple[int, int] | None = None
+        # Newest field per source cell: the base to repair when the layout changes
+        self._latest: dict[int, DistanceField] = {}
+        self.hits = 0
+        self.repairs = 0
+        self.builds = 0
+
+    def field(self, grid: Grid, source: int) -> DistanceField:
+        """Distance field from cell `source` on `grid` (cached, repaired, or built)."""
+        free = grid.geometry.full & ~grid.bits
+        key = (grid.zobrist, source)
+        fields = self._fields
+        if self._last is not None:
+            self._charge(self._last)
+        self._last = key
+        field = fields.get(key)
+        # Comparing the free cells too makes a hash collision a miss, never a wrong answer
+        if field is not None and field.free == free | (1 << source):
+            fields.move_to_end(key)
+            self.hits += 1
+            return field
+        base = self._latest.get(source)
+        if (
+            base is not None
+            and base.geometry is grid.geometry
+            and ((base.free ^ free) & ~(1 << source)).bit_count() <= REPAIR_MAX_CHANGES
+        ):
+            field = base.repaired(free)
+            self.repairs += 1
+        else:
+            field = DistanceField(grid.geometry, free, source)
+            self.builds += 1
+        if key in fields:
+            self._uncharge(key)
+        fields[key] = field
+        fields.move_to_end(key)
+        self._charge(key)
+        while len(fields) > 1 and (len(fields) > self.maxsize or self._cells > self.max_cells):
+            old_key, old = fields.popitem(last=False)
+            self._uncharge(old_key, old)
+            if self._latest.get(old_key[1]) is old:
+                del self._latest[old_key[1]]
+        self._latest[source] = field
+        return field
+
+    def _charge(self, key: tuple[int, int]) -> None:
+        """Bring key's charge up to its field's current layer count."""
+        field = self._fields.get(key)
+        if field is not None:
+            layers = len(field.reach)
+            self._cells += (layers - self._charged.get(key, 0)) * field.geometry.size
+            self._charged[key] = layers
+
+    def _uncharge(self, key: tuple[int, int], field: DistanceField | None = None) -> None:
+        field = field if field is not None else self._fields[key]
+        self._cells -= self._charged.pop(key, 0) * field.geometry.size
+
+    def clear(self) -> None:
+        self._fields.clear()
+        self._charged.clear()
+        self._cells = 0
+        self._last = None
+        self._latest.clear()
+
+
+_cache = DistanceCache()
+
+
+def distance_field(grid: Grid, source: int) -> DistanceField:
+    """Distance field from cell `source` on `grid`, from the shared module cache."""
+    return _cache.field(grid, source)
+
+
+def nearest_field(grid: Grid, sources: int) -> DistanceField:
+    """Uncached field of distances to the nearest cell of the bitboard `sources` (several cats)."""
+    geo = grid.geometry
+    low = sources & -sources
+    return DistanceField(geo, geo.full & ~grid.bits, low.bit_length() - 1, [sources])
@@ -0,0 +1 @@
+# Par (moves-to-win) per seed: batch computation and on-disk index
@@ -0,0 +1,91 @@
+"""Par index entrypoint:
+python -m catgame.par build --seeds START:STOP [--workers N] | show --seed N.
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+from catgame.par.index import ParIndex, get_par_index_path
+from catgame.par.job import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DEPTH,
+    DEFAULT_MAX_TURNS,
+    DEFAULT_NODES,
+    build_index,
+)
+from catgame.sim.runner import seed_range
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Precompute and look up par (moves to win) per seed"
+    )
+    parser.add_argument(
+        "--index", default=None, metavar="FILE",
+        help="Index file (default: next to the leaderboard)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Compute par for a seed range and append it to the index")
+    build.add_argument(
+        "--seeds", type=seed_range, required=True, metavar="START:STOP",
+        help="Half-open seed range",
+    )
+    build.add_argument(
+        "--workers", type=int, default=None, metavar="N",
+        help="Worker processes (default: CPU count; 1 = in-process)",
+    )
+    build.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, metavar="N",
+        help="Seeds per work unit",
+    )
+    build.add_argument(
+        "--nodes", type=int, default=DEFAULT_NODES, metavar="N",
+        help="Positions searched trying to prove the optimum per seed",
+    )
+    build.add_argument(
+        "--depth", type=int, default=DEFAULT_DEPTH, metavar="N",
+        help="Solver lookahead when playing a seed out",
+    )
+    build.add_argument(
+        "--max-turns", type=int, default=DEFAULT_MAX_TURNS, metavar="N",
+        help="Give up on a seed after N moves",
+    )
+    show = sub.add_parser("show", help="Print par for seeds, or the indexed ranges")
+    show.add_argument(
+        "--seed", type=int, action="append", default=[], metavar="N",
+        help="Seed to look up (repeatable)",
+    )
+    args = parser.parse_args()
+
+    path = args.index or get_par_index_path()
+    if args.command == "build":
+        start, stop = args.seeds
+        added = build_index(
+            path, start, stop, workers=args.workers, chunk_size=args.chunk_size,
+            nodes=args.nodes, depth=args.depth, max_turns=args.max_turns,
+        )
+        print(f"{added} seeds added to {path}", file=sys.stderr)
+        sys.exit(0)
+
+    index = ParIndex(path)
+    if not args.seed:
+        kinds: Counter[str] = Counter()
+        for lo, hi in index.ranges():
+            print(f"{lo}:{hi}")
+            for seed in range(lo, hi):
+                par = index.get(seed)
+                kinds["unsolved" if par is None else "exact" if par.exact else "bound"] += 1
+        summary = ", ".join(f"{k}={v}" for k, v in sorted(kinds.items()))
+        print(f"{sum(kinds.values())} seeds ({summary})", file=sys.stderr)
+    for seed in args.seed:
+        if seed not in index:
+            print(f"{seed}\tnot indexed")
+        else:
+            par = index.get(seed)
+            print(f"{seed}\t{par.label() if par else 'unsolved'}")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
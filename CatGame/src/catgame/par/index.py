@@ -0,0 +1,208 @@
+"""On-disk par index: moves-to-win per seed, one uint16 per seed, read through mmap.
+The file is a magic followed by segments: (first seed, count) header, then `count` values.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from catgame.models import COLS, ROWS, GameState
+
+MAGIC = b"CATPAR1\0"
+_SEGMENT = struct.Struct("<QI4x")
+_VALUE = struct.Struct("<H")
+
+# Value encoding: exact par, or an upper bound (best line found) flagged by the top bit
+UNSOLVED = 0xFFFF
+BOUND_FLAG = 0x8000
+MAX_MOVES = 0x7FFE
+
+
+@dataclass(frozen=True, slots=True)
+class Par:
+    """Moves to win a seed: exact (proven optimal) or an upper bound (best line found)."""
+
+    moves: int
+    exact: bool
+
+    def label(self) -> str:
+        return f"par {self.moves}" if self.exact else f"par <={self.moves}"
+
+
+def encode(moves: int | None, exact: bool) -> int:
+    """uint16 for a result (None: no win found)."""
+    if moves is None or moves > MAX_MOVES:
+        return UNSOLVED
+    return moves if exact else moves | BOUND_FLAG
+
+
+def decode(value: int) -> Par | None:
+    if value == UNSOLVED:
+        return None
+    return Par(value & ~BOUND_FLAG, not value & BOUND_FLAG)
+
+
+def get_par_index_path() -> Path:
+    """Path to the par index next to the leaderboard (XDG_DATA_HOME or ~/.local/share)."""
+    base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return Path(base) / "catgame" / "par.idx"
+
+
+def _scan(buf) -> tuple[list[tuple[int, int, int]], int]:
+    """(first seed, count, data offset) per segment, and the offset where valid data ends."""
+    if len(buf) < len(MAGIC) or buf[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a par index file")
+    segments = []
+    offset = len(MAGIC)
+    while offset + _SEGMENT.size <= len(buf):
+        first, count = _SEGMENT.unpack_from(buf, offset)
+        data = offset + _SEGMENT.size
+        if count == 0 or data + 2 * count > len(buf):
+            break
+        segments.append((first, count, data))
+        offset = data + 2 * count
+    return segments, offset
+
+
+class ParIndex:
+    """Read-only view of a par index file (empty if the file does not exist).
+    Reopen to see ranges appended after opening.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = Path(path) if path is not None else get_par_index_path()
+        self._map: mmap.mmap | None = None
+        self._starts: list[int] = []
+        self._segments: list[tuple[int, int, int]] = []
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+        segments, _ = _scan(self._map)
+        segments.sort()
+        self._segments = segments
+        self._starts = [first for first, _, _ in segments]
+
+    def raw(self, seed: int) -> int | None:
+        """Stored uint16 for seed, or None if seed is not in the index."""
+        i = bisect_right(self._starts, seed) - 1
+        if i < 0:
+            return None
+        first, count, data = self._segments[i]
+        if seed - first >= count:
+            return None
+        return _VALUE.unpack_from(self._map, data + 2 * (seed - first))[0]
+
+    def get(self, seed: int) -> Par | None:
+        """Par for seed (None if not indexed or no win was found)."""
+        value = self.raw(seed)
+        return decode(value) if value is not None else None
+
+    def __contains__(self, seed: int) -> bool:
+        return self.raw(seed) is not None
+
+    def ranges(self) -> list[tuple[int, int]]:
+        """Indexed half-open seed ranges, sorted (adjacent segments are merged)."""
+        out: list[tuple[int, int]] = []
+        for first, count, _ in self._segments:
+            if out and out[-1][1] == first:
+                out[-1] = (out[-1][0], first + count)
+            else:
+                out.append((first, first + count))
+        return out
+
+    def missing(self, start: int, stop: int) -> list[tuple[int, int]]:
+        """Sub-ranges of [start, stop) not in the index yet."""
+        out: list[tuple[int, int]] = []
+        at = start
+        for first, end in self.ranges():
+            if end <= at:
+                continue
+            if first >= stop:
+                break
+            if first > at:
+                out.append((at, first))
+            at = max(at, end)
+        if at < stop:
+            out.append((at, stop))
+        return out
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def append_range(path: Path, first: int, values: list[int]) -> None:
+    """Append values for seeds first..first+len(values)-1 (one writer at a time).
+    Raises ValueError if any of those seeds is already indexed.
+    """
+    if not values:
+        return
+    if first < 0:
+        raise ValueError("Seeds in the par index must be >= 0")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = array("H", values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    with open(path, "a+b") as f:
+        f.seek(0)
+        buf = f.read()
+        if not buf:
+            f.write(MAGIC)
+            segments, end = [], len(MAGIC)
+        else:
+            segments, end = _scan(buf)
+        stop = first + len(values)
+        for s_first, s_count, _ in segments:
+            if s_first < stop and first < s_first + s_count:
+                raise ValueError(f"Seeds {max(first, s_first)}.. are already indexed")
+        f.truncate(end)
+        last = segments[-1] if segments else None
+        if last is not None and last[0] + last[1] == first and last[2] + 2 * last[1] == end:
+            # Values first, then the count that makes them visible
+            f.write(data.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+            with open(path, "r+b") as header:
+                header.seek(last[2] - _SEGMENT.size)
+                header.write(_SEGMENT.pack(last[0], last[1] + len(values)))
+        else:
+            f.write(_SEGMENT.pack(first, 0))
+            f.write(data.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+            with open(path, "r+b") as header:
+                header.seek(end)
+                header.write(_SEGMENT.pack(first, len(values)))
+
+
+@lru_cache(maxsize=1)
+def default_index() -> ParIndex:
+    """The par index at the default path, opened once per process."""
+    return ParIndex()
+
+
+def par_suffix(state: GameState) -> str:
+    """Par to append to state's win message (" (par 37)", " (par <=41)"), or "" if unknown.
+    Only default games (board, mouse AI, one cat and one mouse) are indexed.
+    """
+    geo = state.grid.geometry
+    if (
+        (geo.rows, geo.cols) != (ROWS, COLS)
+        or state.mouse_ai != "manhattan"
+        or state.occupancy is not None
+    ):
+        return ""
+    par = default_index().get(state.seed)
+    return f" ({par.label()})" if par is not None else ""
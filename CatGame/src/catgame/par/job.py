@@ -0,0 +1,132 @@
+"""Compute par for seed ranges over a process pool and append it to the par index.
+Par is the solver's proven optimum within a node budget, else the shortest win of a few playouts.
+"""
+
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from catgame.game.turn import apply_move
+from catgame.models import GameState
+from catgame.par.index import ParIndex, append_range, encode
+from catgame.placement.placement import create_game
+from catgame.sim.policies import POLICIES
+from catgame.solver import TranspositionTable, solve
+
+DEFAULT_NODES = 20_000
+DEFAULT_DEPTH = 3
+DEFAULT_MAX_TURNS = 2_000
+DEFAULT_CHUNK_SIZE = 64
+# Cheap playouts tried before the solver-guided one
+PLAYOUT_POLICIES = ("bfs", "greedy")
+
+
+def compute_par(
+    seed: int, nodes: int = DEFAULT_NODES, depth: int = DEFAULT_DEPTH,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> tuple[int | None, bool]:
+    """(moves, exact) for seed; moves is None if no win was found within max_turns."""
+    start = create_game(seed)
+    table = TranspositionTable()
+    first = solve(start, time_budget=None, mode="exact", table=table, max_nodes=nodes)
+    if first.par is not None:
+        return first.par, True
+    best = None
+    for policy in PLAYOUT_POLICIES:
+        moves = _playout(start, policy, max_turns if best is None else best - 1)
+        if moves is not None:
+            best = moves
+    moves = _solver_playout(start, table, depth, max_turns if best is None else best - 1)
+    if moves is not None:
+        best = moves
+    return best, False
+
+
+def _playout(state: GameState, policy: str, max_turns: int) -> int | None:
+    """Moves for the named sim policy to win from state, or None within max_turns."""
+    choose = POLICIES[policy]
+    rng = random.Random(f"{policy}:{state.seed}")
+    for moves in range(1, max_turns + 1):
+        direction = choose(state, rng)
+        if direction is None:
+            return None
+        state = apply_move(state, direction).state
+        if state.status == "won":
+            return moves
+    return None
+
+
+def _solver_playout(
+    state: GameState, table: TranspositionTable, depth: int, max_turns: int
+) -> int | None:
+    """Moves for the exact-mode solver (fixed depth) to win from state, or None."""
+    moves = 0
+    while moves < max_turns:
+        result = solve(state, time_budget=None, max_depth=depth, mode="exact", table=table)
+        if result.par is not None:
+            return moves + result.par if moves + result.par <= max_turns else None
+        if result.move is None:
+            return None
+        state = apply_move(state, result.move).state
+        moves += 1
+        if state.status == "won":
+            return moves
+    return None
+
+
+def _run_chunk(task: tuple[int, int, int, int, int]) -> tuple[int, list[int]]:
+    start, stop, nodes, depth, max_turns = task
+    return start, [
+        encode(*compute_par(seed, nodes, depth, max_turns)) for seed in range(start, stop)
+    ]
+
+
+def compute_range(
+    start: int,
+    stop: int,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    nodes: int = DEFAULT_NODES,
+    depth: int = DEFAULT_DEPTH,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> Iterator[tuple[int, list[int]]]:
+    """Yield (first seed, encoded values) chunks covering [start, stop), in seed order.
+    workers=1 runs in-process; otherwise chunks go to a process pool.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    tasks = (
+        (s, min(s + chunk_size, stop), nodes, depth, max_turns)
+        for s in range(start, stop, chunk_size)
+    )
+    if workers == 1:
+        for task in tasks:
+            yield _run_chunk(task)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: deque = deque()
+        for task in tasks:
+            in_flight.append(pool.submit(_run_chunk, task))
+            if len(in_flight) >= 4 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def build_index(path: Path, start: int, stop: int, **kwargs) -> int:
+    """Compute par for the seeds of [start, stop) not yet in the index at path and append
+    them chunk by chunk. Returns seeds added; kwargs go to compute_range.
+    """
+    index = ParIndex(path)
+    todo = index.missing(start, stop)
+    index.close()
+    added = 0
+    for lo, hi in todo:
+        for first, values in compute_range(lo, hi, **kwargs):
+            append_range(path, first, values)
+            added += len(values)
+    return added
@@ -1,99 +1,189 @@
 """Random placement with playability guarantee and seed for reproducibility."""
 
 import random
-from collections import deque
-
-from catgame.models import Cat, GameState, Grid, Mouse, Position, ROWS, COLS
-
-
-def _adjacent(pos: Position) -> list[Position]:
-    out: list[Position] = []
-    for r, c in [(pos.row - 1, pos.col), (pos.row + 1, pos.col), (pos.row, pos.col - 1), (pos.row, pos.col + 1)]:
-        if 0 <= r < ROWS and 0 <= c < COLS:
-            out.append(Position(r, c))
-    return out
-
-
-def _path_exists(
-    start: Position, goal: Position, obstacles: set[Position]
-) -> bool:
-    """BFS to see if there is a path from start to goal avoiding obstacles."""
-    if start == goal:
-        return True
-    seen = {start}
-    q: deque[Position] = deque([start])
-    while q:
-        p = q.popleft()
-        for n in _adjacent(p):
-            if n == goal:
-                return True
-            if n not in obstacles and n not in seen:
-                seen.add(n)
-                q.append(n)
-    return False
-
-
-def _has_valid_move(pos: Position, obstacles: set[Position], other: Position) -> bool:
-    for n in _adjacent(pos):
-        if n not in obstacles and n != other:
-            return True
-    return False
-
-
-def create_game(seed: int) -> GameState:
-    """Create a game with random placement. Same seed => same layout.
+from itertools import compress
+
+from catgame.models import COLS, ROWS, Cat, GameState, Grid, Mouse
+from catgame.models.bitboard import Geometry, geometry
+from catgame.models.connectivity import Connectivity
+from catgame.models.occupancy import Occupancy
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.placement.rng import TurnRng
+
+# Replay records and session snapshots store the seed as an int64
+SEED_MIN, SEED_MAX = -(2**63), 2**63 - 1
+
+
+def _nth_bit(bits: int, k: int) -> int:
+    """Index of the k-th (0-based, ascending) set bit: binary search on prefix popcounts."""
+    lo, hi = 0, bits.bit_length()
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if (bits & ((1 << mid) - 1)).bit_count() > k:
+            hi = mid
+        else:
+            lo = mid
+    return lo
+
+
+def _choose_bit(rng: random.Random, bits: int) -> int:
+    """Uniform random set bit of a non-empty bitboard (as an index)."""
+    return _nth_bit(bits, rng.randrange(bits.bit_count()))
+
+
+def create_game(
+    seed: int, mouse_ai: str = "manhattan", rows: int = ROWS, cols: int = COLS,
+    cats: int = 1, mice: int = 1,
+) -> GameState:
+    """Create a game with random placement on a rows x cols board. Same seed => same layout.
     Guarantees: both cat and mouse have at least one valid move; path exists between them.
     """
-    rng = random.Random(seed)
-    max_attempts = 5000
-    for _ in range(max_attempts):
-        # Place obstacles (about 10–20% of cells for more challenge)
-        n_cells = ROWS * COLS
-        n_obstacles = rng.randint(
-            max(1, n_cells // 10),
-            max(2, n_cells // 5),
+    if not SEED_MIN <= seed <= SEED_MAX:
+        raise ValueError(f"Seed must be in {SEED_MIN}..{SEED_MAX}, got {seed}")
+    if mouse_ai not in MOUSE_AI_MODES:
+        raise ValueError(
+            f"Unknown mouse AI: {mouse_ai!r} (choose from {', '.join(MOUSE_AI_MODES)})"
         )
-        obstacle_set: set[Position] = set()
-        while len(obstacle_set) < n_obstacles:
-            obstacle_set.add(
-                Position(rng.randint(0, ROWS - 1), rng.randint(0, COLS - 1))
-            )
-
-        # Place cat and mouse on empty cells
-        empty = [
-            Position(r, c)
-            for r in range(ROWS)
-            for c in range(COLS)
-            if Position(r, c) not in obstacle_set
-        ]
-        rng.shuffle(empty)
-        if len(empty) < 2:
-            continue
-        cat_pos = empty[0]
-        mouse_pos = empty[1]
-        if cat_pos == mouse_pos:
-            continue
-
-        if not _has_valid_move(cat_pos, obstacle_set, mouse_pos):
-            continue
-        if not _has_valid_move(mouse_pos, obstacle_set, cat_pos):
-            continue
-        if not _path_exists(cat_pos, mouse_pos, obstacle_set):
-            continue
+    if rows < 1 or cols < 1 or rows * cols < 3:
+        raise ValueError(f"Board must have at least 3 cells, got {rows}x{cols}")
+    if cats < 1 or mice < 1:
+        raise ValueError("A game needs at least one cat and one mouse")
+    rng = random.Random(seed)
+    geo = geometry(rows, cols)
+    # Place obstacles (about 10–20% of cells for more challenge)
+    n_cells = geo.size
+    n_obstacles = rng.randint(
+        max(1, n_cells // 10),
+        max(2, n_cells // 5),
+    )
+    order = rng.sample(range(n_cells), n_obstacles)
+    blocked = geo.bits_of_indices(order)
 
-        grid = Grid(obstacle_set)
-        cat = Cat(cat_pos)
-        mouse = Mouse(mouse_pos)
+    while True:
+        node, sizes = geo.label(geo.full & ~blocked)
+        if any(size >= 3 for size in sizes):
+            break
+        # Only on pathological layouts: lift obstacles (latest sampled first) until a component fits
+        blocked &= ~(1 << order.pop())
+    free = geo.full & ~blocked
+    if cats > 1 or mice > 1:
+        cat_cells, mouse_cells = _place_agents(rng, geo, node, sizes, cats, mice)
+        positions = geo.positions
         return GameState(
-            grid=grid,
-            cat=cat,
-            mouse=mouse,
+            grid=Grid.from_bits(
+                blocked, Connectivity.from_bits(geo, blocked, (node, sizes)), rows, cols
+            ),
+            cat=Cat(positions[cat_cells[0]]),
+            mouse=Mouse(positions[mouse_cells[0]]),
             seed=seed,
             status="playing",
             message="",
+            mouse_ai=mouse_ai,
+            occupancy=Occupancy(geo, cat_cells, mouse_cells),
         )
 
-    raise RuntimeError("Could not generate playable layout within max_attempts")
+    # Cells the cat may not start on: components under 3 cells, and star centers. A star
+    # (center plus 2-4 mutually non-adjacent leaves, so at most 5 cells) leaves the mouse
+    # nowhere to go if the cat takes the center: every leaf's only neighbor is the cat
+    small = {k for k, size in enumerate(sizes) if size <= 5}
+    members: dict[int, list[int]] = {}
+    if small:
+        for j in compress(range(n_cells), map(small.__contains__, node)):
+            members.setdefault(node[j], []).append(j)
+    excluded: list[int] = []
+    for k, cells in members.items():
+        if sizes[k] < 3:
+            excluded.extend(cells)
+            continue
+        for center in cells:
+            others = [j for j in cells if j != center]
+            if not any(_adjacent(a, b, cols) for a in others for b in others):
+                excluded.append(center)
+    eligible = free & ~geo.bits_of_indices(excluded)
+    cat_j = _choose_bit(rng, eligible)
+    cat_bit = 1 << cat_j
+    comp = _label_bits(geo, node, sizes, node[cat_j])
+    # Mouse: same component, not the cat's only free neighbor, and with a free neighbor
+    # other than the cat (exists: the component is 3+ cells and the cat is not a star center)
+    others = comp & ~cat_bit
+    candidates = others & geo.touching(others)
+    cat_free = geo.neighbor_mask[cat_j] & comp
+    if cat_free.bit_count() == 1:
+        candidates &= ~cat_free
+    mouse_j = _choose_bit(rng, candidates)
+
+    return GameState(
+        grid=Grid.from_bits(
+            blocked, Connectivity.from_bits(geo, blocked, (node, sizes)), rows, cols
+        ),
+        cat=Cat(geo.positions[cat_j]),
+        mouse=Mouse(geo.positions[mouse_j]),
+        seed=seed,
+        status="playing",
+        message="",
+        mouse_ai=mouse_ai,
+    )
+
+
+def _place_agents(
+    rng: random.Random, geo: Geometry, node: list[int], sizes: list[int], n_cats: int, n_mice: int
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Distinct cells for the cats and mice in the largest free component.
+    Each mouse keeps a free neighbor, so it starts with a valid move.
+    """
+    label = max(range(len(sizes)), key=sizes.__getitem__)
+    if sizes[label] < n_cats + 2 * n_mice:
+        raise ValueError(f"No free area fits {n_cats} cats and {n_mice} mice")
+    pool = list(compress(range(geo.size), map(label.__eq__, node)))
+    neighbors = geo.neighbors
+    taken: set[int] = set()
+
+    def exit_of(j: int) -> int | None:
+        for _, k in neighbors[j]:
+            if node[k] == label and k not in taken:
+                return k
+        return None
+
+    cats = []
+    for _ in range(n_cats):
+        j = _draw_cell(rng, pool, lambda j: j not in taken)
+        taken.add(j)
+        cats.append(j)
+    mice = []
+    for _ in range(n_mice):
+        j = _draw_cell(rng, pool, lambda j: j not in taken and exit_of(j) is not None)
+        taken.add(j)
+        taken.add(exit_of(j))
+        mice.append(j)
+    return tuple(cats), tuple(mice)
+
+
+def _draw_cell(rng: random.Random, pool: list[int], ok) -> int:
+    """Uniform cell of pool passing ok: a few random tries, then the first in pool order."""
+    for _ in range(32):
+        j = pool[rng.randrange(len(pool))]
+        if ok(j):
+            return j
+    for j in pool:
+        if ok(j):
+            return j
+    raise ValueError("No room left to place every cat and mouse")
+
+
+def _label_bits(geo: Geometry, node: list[int], sizes: list[int], label: int) -> int:
+    """Bitboard of the cells labeled `label` (see Geometry.label), packing whichever of the
+    component and the rest of the board has fewer cells.
+    """
+    cells = range(geo.size)
+    if 2 * sizes[label] <= geo.size:
+        return geo.bits_of_indices(compress(cells, map(label.__eq__, node)))
+    return geo.full & ~geo.bits_of_indices(compress(cells, map(label.__ne__, node)))
+
+
+def _adjacent(a: int, b: int, cols: int) -> bool:
+    """True if cell indices a and b are 4-neighbors on a board `cols` wide."""
+    d = abs(a - b)
+    return d == cols or (d == 1 and a // cols == b // cols)
 
 
 # Chance each turn that some obstacles move; max number moved per reshuffle
@@ -103,39 +193,80 @@ RESHUFFLE_MAX = 3
 
 def maybe_reshuffle_obstacles(state: GameState) -> GameState:
     """With RESHUFFLE_PROB chance, move 1 to RESHUFFLE_MAX obstacles to random empty cells.
-    Keeps cat and mouse positions clear. Returns new state (or unchanged if no reshuffle).
+    Keeps cat and mouse positions clear and connected. Returns new state (or unchanged if no
+    reshuffle); randomness comes from (state.seed, state.turn).
     """
     if state.status != "playing":
         return state
-    if random.random() >= RESHUFFLE_PROB:
+    rng = TurnRng(state.seed, state.turn)
+    if rng.random() >= RESHUFFLE_PROB:
         return state
-    obstacles = set(state.grid.obstacles)
-    if not obstacles:
+    return reshuffle_obstacles(state, rng)
+
+
+def reshuffle_obstacles(state: GameState, rng: TurnRng) -> GameState:
+    """The reshuffle itself, drawing from rng (maybe_reshuffle_obstacles passes its stream
+    right after the probability draw). Returns state unchanged if the reshuffle is dropped.
+    """
+    grid = state.grid
+    geo = grid.geometry
+    bits = grid.bits
+    n_obstacles = bits.bit_count()
+    if not n_obstacles:
         return state
-    n = min(random.randint(1, RESHUFFLE_MAX), len(obstacles))
-    to_remove = random.sample(list(obstacles), n)
-    new_obstacles = obstacles - set(to_remove)
-    # Empty = not occupied by new obstacles, cat, or mouse (includes freed cells)
-    empty = [
-        Position(r, c)
-        for r in range(ROWS)
-        for c in range(COLS)
-        if Position(r, c) not in new_obstacles
-        and Position(r, c) != state.cat.position
-        and Position(r, c) != state.mouse.position
-    ]
-    if len(empty) < n:
-        n = len(empty)
+    n = min(rng.randint(1, RESHUFFLE_MAX), n_obstacles)
+    # Pick distinct obstacles to lift by drawing cells until one is an obstacle
+    removed = 0
+    for _ in range(n):
+        while True:
+            bit = 1 << rng.below(geo.size)
+            if bits & bit and not removed & bit:
+                break
+        removed |= bit
+    new_bits = bits & ~removed
+    # Empty = not occupied by new obstacles, cat, or mouse (includes freed cells). Several
+    # agents are looked up in the occupancy index rather than packed into the bitboard
+    if state.occupancy is not None:
+        agents = state.occupancy.cells
+        occupied = new_bits
+    else:
+        agents = {}
+        occupied = new_bits | geo.bit(state.cat.position) | geo.bit(state.mouse.position)
+    n = min(n, geo.size - occupied.bit_count() - len(agents))
     if n == 0:
         return state
-    new_positions = random.sample(empty, n)
-    new_obstacles = new_obstacles | set(new_positions)
-    new_grid = Grid(new_obstacles)
-    return GameState(
+    added = 0
+    for _ in range(n):
+        while True:
+            j = rng.below(geo.size)
+            bit = 1 << j
+            if not (occupied | added) & bit and j not in agents:
+                break
+        added |= bit
+    new_grid = grid.with_obstacles(new_bits | added)
+    if not _cats_reach_mice(new_grid, state):
+        return state
+    reshuffled = GameState(
         grid=new_grid,
         cat=state.cat,
         mouse=state.mouse,
         seed=state.seed,
         status=state.status,
         message=state.message,
+        turn=state.turn,
+        mouse_ai=state.mouse_ai,
+        occupancy=state.occupancy,
     )
+    reshuffled.inherit_key(state)
+    return reshuffled
+
+
+def _cats_reach_mice(grid: Grid, state: GameState) -> bool:
+    """True if every mouse of state shares a free component of grid with a cat."""
+    conn = grid.connectivity
+    occupancy = state.occupancy
+    if occupancy is None:
+        geo = grid.geometry
+        return conn.connected(geo.index(state.cat.position), geo.index(state.mouse.position))
+    roots = {conn.component(j) for j in occupancy.cats}
+    return all(conn.component(j) in roots for j in occupancy.mice)
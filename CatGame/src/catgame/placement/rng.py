@@ -0,0 +1,36 @@
+"""Counter-based RNG for in-game randomness: every draw is a pure function of (seed, turn)."""
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def mix64(z: int) -> int:
+    """SplitMix64 finalizer: a bijective 64-bit scramble."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+class TurnRng:
+    """Independent SplitMix64 stream for one (seed, turn) pair."""
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed: int, turn: int) -> None:
+        self.state = mix64(mix64(seed & MASK64) ^ (turn & MASK64))
+
+    def next64(self) -> int:
+        self.state = (self.state + GOLDEN_GAMMA) & MASK64
+        return mix64(self.state)
+
+    def random(self) -> float:
+        """Float in [0, 1) with 53 random bits."""
+        return (self.next64() >> 11) * (1.0 / (1 << 53))
+
+    def below(self, n: int) -> int:
+        """Integer in [0, n)."""
+        return self.next64() % n
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b], inclusive like random.randint."""
+        return a + self.below(b - a + 1)
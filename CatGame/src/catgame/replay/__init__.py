@@ -0,0 +1 @@
+# Replays: compact binary game records with keyframes, recording and bulk reading
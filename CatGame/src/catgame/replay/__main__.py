@@ -0,0 +1,85 @@
+"""Replay entrypoint:
+python -m catgame.replay stats FILE... | verify FILE... | show FILE --game N [--turn T].
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+from catgame.cli.render import render_grid
+from catgame.replay.log import iter_replays, load_replays
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize, check and inspect replay files")
+    sub = parser.add_subparsers(dest="command", required=True)
+    stats = sub.add_parser(
+        "stats", help="Game counts and move statistics, from record headers only"
+    )
+    stats.add_argument("files", nargs="+", metavar="FILE")
+    verify = sub.add_parser(
+        "verify", help="Replay every game and check its keyframes and final state"
+    )
+    verify.add_argument("files", nargs="+", metavar="FILE")
+    show = sub.add_parser("show", help="Print one game's state after a given number of moves")
+    show.add_argument("file", metavar="FILE")
+    show.add_argument(
+        "--game", type=int, default=0, metavar="N", help="Record position in the file (0-based)"
+    )
+    show.add_argument(
+        "--turn", type=int, default=None, metavar="T", help="Moves to apply (default: all)"
+    )
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        games = 0
+        outcomes: Counter[str] = Counter()
+        boards: Counter[str] = Counter()
+        turns: list[int] = []
+        size = 0
+        for replay in iter_replays(args.files):
+            games += 1
+            outcomes[replay.status] += 1
+            board = f"{replay.rows}x{replay.cols} {replay.cats}c{replay.mice}m {replay.mouse_ai}"
+            boards[board] += 1
+            turns.append(replay.turns)
+            size += replay.size
+        print(f"games\t{games}")
+        if not games:
+            sys.exit(0)
+        turns.sort()
+        print(f"bytes\t{size} ({size / games:.1f} per game)")
+        for status, count in sorted(outcomes.items()):
+            print(f"{status}\t{count}")
+        print(f"moves\tmean {sum(turns) / games:.1f}  p50 {turns[games // 2]}  max {turns[-1]}")
+        for board, count in boards.most_common():
+            print(f"board\t{board}\t{count}")
+        sys.exit(0)
+
+    if args.command == "verify":
+        bad = 0
+        checked = 0
+        for replay in iter_replays(args.files):
+            if not replay.verify():
+                print(f"mismatch: game {checked} (seed {replay.seed})", file=sys.stderr)
+                bad += 1
+            checked += 1
+        print(f"{checked} games checked, {bad} mismatched", file=sys.stderr)
+        sys.exit(1 if bad else 0)
+
+    replays = load_replays(args.file)
+    if not 0 <= args.game < len(replays):
+        parser.error(f"no game {args.game} in {args.file} ({len(replays)} recorded)")
+    replay = replays[args.game]
+    turn = replay.turns if args.turn is None else args.turn
+    if not 0 <= turn <= replay.turns:
+        parser.error(f"--turn must be 0..{replay.turns}")
+    state = replay.seek(turn)
+    print(f"Seed {replay.seed}, move {turn} of {replay.turns}")
+    print(render_grid(state))
+    print(f"Status: {state.status}")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""Replay records: a game as its settings plus one 2-bit code per move, with keyframes.
+Games are deterministic, so the seed and the successful moves replay the whole game.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from catgame.game.moves import DIRECTION_DELTA
+from catgame.game.turn import WIN_ALL_MESSAGE, WIN_MESSAGE, apply_move
+from catgame.models import Cat, GameState, Grid, Mouse
+from catgame.models.occupancy import Occupancy
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.placement.placement import create_game
+
+# Record (little-endian; a file is records back to back): _HEADER, moves four per byte,
+# one u32 offset per keyframe, then keyframes (_KEYFRAME, obstacle bitboard, agent cells as u32)
+MAGIC = b"CATRPL1\0"
+_HEADER = struct.Struct("<8sIqIIIIBBHIIQ")
+_KEYFRAME = struct.Struct("<QIII")
+_OFFSET = struct.Struct("<I")
+_SNAPSHOT = struct.Struct("<BqIIIIBBIII")
+SNAPSHOT_VERSION = 1
+
+DIRECTIONS = tuple(DIRECTION_DELTA)
+_CODE = {name: code for code, name in enumerate(DIRECTIONS)}
+STATUSES = ("playing", "won")
+DEFAULT_INTERVAL = 64
+
+# Byte -> its four 2-bit codes, as bytes (low bits first)
+_UNPACK = tuple(bytes((b >> shift) & 3 for shift in (0, 2, 4, 6)) for b in range(256))
+
+
+def _u32_bytes(values: Iterable[int]) -> bytes:
+    data = array("I", values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _u32_values(buf, offset: int, count: int) -> list[int]:
+    data = array("I")
+    data.frombytes(buf[offset:offset + 4 * count])
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tolist()
+
+
+class Recorder:
+    """Collects one game for a replay record: start it on a fresh create_game state, call
+    record() after every successful apply_move, then to_bytes() (or append_to a file).
+    """
+
+    def __init__(self, start: GameState, interval: int = DEFAULT_INTERVAL) -> None:
+        if start.turn != 0:
+            raise ValueError("A recording starts at turn 0")
+        if not 1 <= interval <= 0xFFFF:
+            raise ValueError("Keyframe interval must be 1..65535")
+        geo = start.grid.geometry
+        occupancy = start.occupancy
+        self.seed = start.seed
+        self.rows, self.cols = geo.rows, geo.cols
+        self.cats = len(occupancy.cats) if occupancy is not None else 1
+        self.mice = len(occupancy.mice) if occupancy is not None else 1
+        self.mouse_ai = start.mouse_ai
+        self.interval = interval
+        self.state = start
+        self._moves = bytearray()
+        self._count = 0
+        self._keyframes: list[bytes] = []
+
+    @property
+    def turns(self) -> int:
+        return self._count
+
+    def record(self, direction: str, state: GameState) -> None:
+        """Append a successful move and the state it led to."""
+        code = _CODE[direction]
+        shift = 2 * (self._count & 3)
+        if not shift:
+            self._moves.append(code)
+        else:
+            self._moves[-1] |= code << shift
+        self._count += 1
+        self.state = state
+        if self._count % self.interval == 0 and state.status == "playing":
+            self._keyframes.append(_keyframe_bytes(state))
+
+    def to_bytes(self) -> bytes:
+        offset = _HEADER.size + len(self._moves) + _OFFSET.size * len(self._keyframes)
+        offsets = []
+        for blob in self._keyframes:
+            offsets.append(offset)
+            offset += len(blob)
+        header = _HEADER.pack(
+            MAGIC, offset, self.seed, self.rows, self.cols, self.cats, self.mice,
+            MOUSE_AI_MODES.index(self.mouse_ai), STATUSES.index(self.state.status), self.interval,
+            self._count, len(self._keyframes), self.state.key,
+        )
+        return b"".join((header, self._moves, _u32_bytes(offsets), *self._keyframes))
+
+    def append_to(self, path: Path) -> None:
+        """Append this game as one record to the replay file at path (created if missing)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as f:
+            f.write(self.to_bytes())
+
+
+def _decode_keyframe(
+    buf, at: int, rows: int, cols: int
+) -> tuple[int, int, list[int], list[int], int]:
+    """State key, obstacle bits, cat cells, mouse cells and mice caught of the keyframe at `at`."""
+    key, n_cats, n_mice, caught = _KEYFRAME.unpack_from(buf, at)
+    at += _KEYFRAME.size
+    n_bytes = (rows * cols + 7) // 8
+    bits = int.from_bytes(buf[at:at + n_bytes], "little")
+    at += n_bytes
+    cats = _u32_values(buf, at, n_cats)
+    return key, bits, cats, _u32_values(buf, at + 4 * n_cats, n_mice), caught
+
+
+def snapshot(state: GameState) -> bytes:
+    """One state as bytes (see restore)."""
+    geo = state.grid.geometry
+    occupancy = state.occupancy
+    header = _SNAPSHOT.pack(
+        SNAPSHOT_VERSION, state.seed, geo.rows, geo.cols,
+        len(occupancy.cats) if occupancy is not None else 1,
+        len(occupancy.mice) + occupancy.caught if occupancy is not None else 1,
+        MOUSE_AI_MODES.index(state.mouse_ai), STATUSES.index(state.status), state.turn,
+        geo.index(state.cat.position), geo.index(state.mouse.position),
+    )
+    return header + _keyframe_bytes(state)
+
+
+def restore(data) -> GameState:
+    """The state snapshot() stored, key included (so it is not recomputed)."""
+    fields = _SNAPSHOT.unpack_from(data)
+    version, seed, rows, cols, cats, mice, ai, status, turn, cat, mouse = fields
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unknown snapshot version {version}")
+    key, bits, cat_cells, mouse_cells, caught = _decode_keyframe(data, _SNAPSHOT.size, rows, cols)
+    grid = Grid.from_bits(bits, rows=rows, cols=cols)
+    positions = grid.geometry.positions
+    occupancy = None
+    if cats > 1 or mice > 1:
+        occupancy = Occupancy(grid.geometry, tuple(cat_cells), tuple(mouse_cells), caught)
+    won = STATUSES[status] == "won"
+    state = GameState(
+        grid=grid,
+        cat=Cat(positions[cat]),
+        mouse=Mouse(positions[mouse]),
+        seed=seed,
+        status=STATUSES[status],
+        message=(WIN_ALL_MESSAGE if caught > 1 else WIN_MESSAGE) if won else "",
+        turn=turn,
+        mouse_ai=MOUSE_AI_MODES[ai],
+        occupancy=occupancy,
+    )
+    state._key = key
+    return state
+
+
+def _keyframe_bytes(state: GameState) -> bytes:
+    geo = state.grid.geometry
+    occupancy = state.occupancy
+    if occupancy is not None:
+        cats, mice, caught = occupancy.cats, occupancy.mice, occupancy.caught
+    else:
+        cats, mice, caught = (geo.index(state.cat.position),), (geo.index(state.mouse.position),), 0
+    return b"".join((
+        _KEYFRAME.pack(state.key, len(cats), len(mice), caught),
+        state.grid.bits.to_bytes((geo.size + 7) // 8, "little"),
+        _u32_bytes(cats),
+        _u32_bytes(mice),
+    ))
+
+
+class Replay:
+    """One replay record, read in place from `buf` at `offset` (bytes or an mmap). Header
+    fields are attributes; moves and keyframes are decoded only when asked for.
+    """
+
+    __slots__ = (
+        "buf", "offset", "size", "seed", "rows", "cols", "cats", "mice", "mouse_ai", "status",
+        "interval", "turns", "keyframes", "key", "_start",
+    )
+
+    def __init__(self, buf, offset: int = 0) -> None:
+        (magic, size, seed, rows, cols, cats, mice, ai, status, interval, turns, keyframes, key) = (
+            _HEADER.unpack_from(buf, offset)
+        )
+        if magic != MAGIC:
+            raise ValueError(f"Not a replay record at byte {offset}")
+        self.buf = buf
+        self.offset = offset
+        self.size = size
+        self.seed = seed
+        self.rows, self.cols = rows, cols
+        self.cats, self.mice = cats, mice
+        self.mouse_ai = MOUSE_AI_MODES[ai]
+        self.status = STATUSES[status]
+        self.interval = interval
+        self.turns = turns
+        self.keyframes = keyframes
+        self.key = key
+        self._start: GameState | None = None
+
+    def codes(self) -> bytes:
+        """Move codes (DIRECTIONS indexes), one byte per move."""
+        start = self.offset + _HEADER.size
+        packed = self.buf[start:start + (self.turns + 3) // 4]
+        return b"".join(map(_UNPACK.__getitem__, packed))[: self.turns]
+
+    def directions(self) -> list[str]:
+        return [DIRECTIONS[code] for code in self.codes()]
+
+    def start(self) -> GameState:
+        """The game at turn 0 (created once per Replay)."""
+        if self._start is None:
+            self._start = create_game(
+                self.seed, self.mouse_ai, self.rows, self.cols, self.cats, self.mice
+            )
+        return self._start
+
+    def _keyframe_offset(self, k: int) -> int:
+        if not 0 <= k < self.keyframes:
+            raise IndexError(k)
+        table = self.offset + _HEADER.size + (self.turns + 3) // 4
+        return self.offset + _OFFSET.unpack_from(self.buf, table + _OFFSET.size * k)[0]
+
+    def keyframe(self, k: int) -> GameState:
+        """State after (k + 1) * interval moves, rebuilt from keyframe k."""
+        _, bits, cats, mice, caught = _decode_keyframe(
+            self.buf, self._keyframe_offset(k), self.rows, self.cols
+        )
+        grid = Grid.from_bits(bits, rows=self.rows, cols=self.cols)
+        positions = grid.geometry.positions
+        occupancy = None
+        if self.cats > 1 or self.mice > 1:
+            occupancy = Occupancy(grid.geometry, tuple(cats), tuple(mice), caught)
+        return GameState(
+            grid=grid,
+            cat=Cat(positions[cats[0]]),
+            mouse=Mouse(positions[mice[0]]),
+            seed=self.seed,
+            status="playing",
+            turn=(k + 1) * self.interval,
+            mouse_ai=self.mouse_ai,
+            occupancy=occupancy,
+        )
+
+    def seek(self, turn: int) -> GameState:
+        """State after `turn` moves: the nearest keyframe at or before it, then at most
+        interval - 1 moves applied.
+        """
+        if not 0 <= turn <= self.turns:
+            raise ValueError(f"Turn {turn} is outside this replay (0..{self.turns})")
+        k = min(turn // self.interval, self.keyframes)
+        state = self.keyframe(k - 1) if k else self.start()
+        codes = self.codes()
+        for t in range(state.turn, turn):
+            state = apply_move(state, DIRECTIONS[codes[t]]).state
+        return state
+
+    def states(self) -> Iterator[GameState]:
+        """Every state from turn 0 to the end, in order."""
+        state = self.start()
+        yield state
+        for code in self.codes():
+            state = apply_move(state, DIRECTIONS[code]).state
+            yield state
+
+    def verify(self) -> bool:
+        """Replay every move from turn 0 and check each keyframe and the final state key."""
+        expected = {
+            (k + 1) * self.interval: _KEYFRAME.unpack_from(self.buf, self._keyframe_offset(k))[0]
+            for k in range(self.keyframes)
+        }
+        state = None
+        for state in self.states():
+            if state.turn in expected and state.key != expected[state.turn]:
+                return False
+        return state.key == self.key and state.status == self.status
+
+
+def read_replays(buf) -> Iterator[Replay]:
+    """Records in buf, in order (stops at a torn or foreign tail)."""
+    offset = 0
+    end = len(buf)
+    while offset + _HEADER.size <= end:
+        if buf[offset:offset + len(MAGIC)] != MAGIC:
+            return
+        replay = Replay(buf, offset)
+        if replay.size < _HEADER.size or offset + replay.size > end:
+            return
+        yield replay
+        offset += replay.size
+
+
+def iter_replays(paths: Iterable[Path]) -> Iterator[Replay]:
+    """Every record of every file in paths, read through mmap (only headers are parsed)."""
+    for path in paths:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        yield from read_replays(buf)
+
+
+def load_replays(path: Path) -> list[Replay]:
+    """All records of one file."""
+    return list(iter_replays([path]))
+
+
+class ReplayWriter:
+    """Records a session's games to one file: start() each new game, move() after each
+    successful apply_move, close() at the end (games without moves are skipped).
+    """
+
+    def __init__(self, path: Path, interval: int = DEFAULT_INTERVAL) -> None:
+        self.path = Path(path)
+        self.interval = interval
+        self._recorder: Recorder | None = None
+
+    def start(self, state: GameState) -> None:
+        self.flush()
+        self._recorder = Recorder(state, self.interval)
+
+    def move(self, direction: str, state: GameState) -> None:
+        if self._recorder is None:
+            return
+        self._recorder.record(direction, state)
+        if state.status == "won":
+            self.flush()
+
+    def flush(self) -> None:
+        if self._recorder is not None and self._recorder.turns:
+            self._recorder.append_to(self.path)
+        self._recorder = None
+
+    def close(self) -> None:
+        self.flush()
@@ -0,0 +1 @@
+# Game server: many concurrent sessions over TCP and Unix sockets, one asyncio loop
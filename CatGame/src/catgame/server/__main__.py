@@ -0,0 +1,113 @@
+"""Server entrypoint:
+python -m catgame.server serve [--port N] [--unix PATH] [--store FILE] | load --sessions N.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from catgame.cli.stream import JSON_MODES
+from catgame.models import COLS, ROWS
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.server.app import DEFAULT_IDLE_TIMEOUT, GameServer, serve
+from catgame.server.loadgen import run_load
+from catgame.server.store import DEFAULT_CAPACITY, DEFAULT_CHECKPOINT_INTERVAL, TieredStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Host many concurrent games, or load-test a host")
+    sub = parser.add_subparsers(dest="command", required=True)
+    commands = (("serve", "Run the game server"), ("load", "Play many sessions against a server"))
+    for name, text in commands:
+        p = sub.add_parser(name, help=text)
+        p.add_argument("--host", default="127.0.0.1", help="TCP host (default 127.0.0.1)")
+        p.add_argument("--port", type=int, default=None, metavar="N", help="TCP port")
+        p.add_argument("--unix", default=None, metavar="PATH", help="Unix socket path")
+    serve_p = sub.choices["serve"]
+    serve_p.add_argument(
+        "--json", choices=JSON_MODES, default="full", help="Reply lines: full states or deltas"
+    )
+    serve_p.add_argument(
+        "--compact", action="store_true", help="Cells as row*cols+col indices, no spaces"
+    )
+    serve_p.add_argument(
+        "--mouse-ai", choices=MOUSE_AI_MODES, default="manhattan", help="Mouse distance measure"
+    )
+    serve_p.add_argument(
+        "--rows", type=int, default=ROWS, metavar="N", help=f"Board height (default {ROWS})"
+    )
+    serve_p.add_argument(
+        "--cols", type=int, default=COLS, metavar="N", help=f"Board width (default {COLS})"
+    )
+    serve_p.add_argument(
+        "--cats", type=int, default=1, metavar="N", help="Cats per game (default 1)"
+    )
+    serve_p.add_argument(
+        "--mice", type=int, default=1, metavar="N", help="Mice per game (default 1)"
+    )
+    serve_p.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, metavar="SECS",
+        help=f"Disconnect sessions silent this long (default {DEFAULT_IDLE_TIMEOUT:.0f})",
+    )
+    serve_p.add_argument(
+        "--store", default=None, metavar="FILE",
+        help="SQLite file that keeps sessions across restarts",
+    )
+    serve_p.add_argument(
+        "--cache", type=int, default=DEFAULT_CAPACITY, metavar="N",
+        help=f"Sessions kept in memory (default {DEFAULT_CAPACITY})",
+    )
+    serve_p.add_argument(
+        "--checkpoint", type=float, default=DEFAULT_CHECKPOINT_INTERVAL, metavar="SECS",
+        help=(
+            "Write changed sessions to --store this often"
+            f" (default {DEFAULT_CHECKPOINT_INTERVAL:.0f})"
+        ),
+    )
+    load = sub.choices["load"]
+    load.add_argument(
+        "--sessions", type=int, default=10_000, metavar="N",
+        help="Concurrent sessions (default 10000)",
+    )
+    load.add_argument(
+        "--moves", type=int, default=20, metavar="N", help="Moves per session (default 20)"
+    )
+    load.add_argument(
+        "--think", type=float, default=1.0, metavar="SECS",
+        help="Mean pause before each move (default 1)",
+    )
+    load.add_argument(
+        "--ramp", type=float, default=1.0, metavar="SECS",
+        help="Spread session starts over this long (default 1)",
+    )
+    args = parser.parse_args()
+    if args.port is None and args.unix is None:
+        parser.error("give --port, --unix, or both")
+
+    if args.command == "serve":
+        store = None
+        if args.store:
+            store = TieredStore(args.store, capacity=args.cache, interval=args.checkpoint)
+            print(f"{store.warm()} sessions restored from {args.store}", file=sys.stderr)
+        server = GameServer(
+            mouse_ai=args.mouse_ai, rows=args.rows, cols=args.cols, cats=args.cats, mice=args.mice,
+            json_mode=args.json, compact=args.compact, idle_timeout=args.idle_timeout, store=store,
+        )
+        try:
+            asyncio.run(serve(server, args.host, args.port, args.unix))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if store is not None:
+                store.close()
+        sys.exit(0)
+
+    report = asyncio.run(
+        run_load(args.sessions, args.moves, args.think, args.ramp, args.host, args.port, args.unix)
+    )
+    print(report.summary())
+    sys.exit(1 if report.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Asyncio game server: a Session per connection, on TCP and/or a Unix socket.
+Replies are drained before the next line is read; idle or non-reading clients are dropped.
+"""
+
+import asyncio
+from contextlib import suppress
+
+from catgame.models import COLS, ROWS
+from catgame.server.session import Session
+from catgame.server.store import MemoryStore, TieredStore
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_WRITE_LIMIT = 64 * 1024
+DEFAULT_MAX_LINE = 1024
+DEFAULT_BACKLOG = 4096
+
+
+class GameServer:
+    """Settings shared by every session, and the connection handler. `sessions` counts the
+    open connections, `served` every connection so far.
+    """
+
+    def __init__(
+        self,
+        mouse_ai: str = "manhattan",
+        rows: int = ROWS,
+        cols: int = COLS,
+        cats: int = 1,
+        mice: int = 1,
+        json_mode: str = "full",
+        compact: bool = False,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        write_limit: int = DEFAULT_WRITE_LIMIT,
+        max_line: int = DEFAULT_MAX_LINE,
+        store: MemoryStore | TieredStore | None = None,
+    ) -> None:
+        self.options = {
+            "mouse_ai": mouse_ai, "rows": rows, "cols": cols, "cats": cats, "mice": mice,
+            "json_mode": json_mode, "compact": compact, "store": store,
+        }
+        self.idle_timeout = idle_timeout
+        self.write_limit = write_limit
+        self.max_line = max_line
+        self.sessions = 0
+        self.served = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.transport.set_write_buffer_limits(high=self.write_limit)
+        out: list[str] = []
+        self.sessions += 1
+        self.served += 1
+        try:
+            session = Session(out.append, **self.options)
+            while True:
+                if out:
+                    writer.write(("\n".join(out) + "\n").encode())
+                    out.clear()
+                    await asyncio.wait_for(writer.drain(), self.idle_timeout)
+                try:
+                    async with asyncio.timeout(self.idle_timeout):
+                        raw = await reader.readline()
+                except TimeoutError:
+                    session.stream.error("Idle timeout")
+                    break
+                except ValueError:  # Line over max_line (the reader's limit)
+                    session.stream.error("Line too long")
+                    break
+                if not raw or not session.handle(raw.decode(errors="replace")):
+                    break
+            if out:
+                writer.write(("\n".join(out) + "\n").encode())
+                await asyncio.wait_for(writer.drain(), self.idle_timeout)
+        except TimeoutError:  # Replies unread for idle_timeout: drop them with the connection
+            writer.transport.abort()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(
+        self, host: str | None = None, port: int | None = None, path: str | None = None
+    ) -> list[asyncio.AbstractServer]:
+        """Listen on host:port and/or the Unix socket at path; returns the listening servers."""
+        servers = []
+        if port is not None:
+            servers.append(await asyncio.start_server(
+                self.handle, host, port, limit=self.max_line, backlog=DEFAULT_BACKLOG,
+            ))
+        if path is not None:
+            servers.append(await asyncio.start_unix_server(
+                self.handle, path, limit=self.max_line, backlog=DEFAULT_BACKLOG,
+            ))
+        if not servers:
+            raise ValueError("Give a port, a Unix socket path, or both")
+        return servers
+
+
+async def serve(
+    server: GameServer, host: str | None = None, port: int | None = None, path: str | None = None
+) -> None:
+    """Run until cancelled."""
+    servers = await server.start(host, port, path)
+    try:
+        await asyncio.gather(*(s.serve_forever() for s in servers))
+    finally:
+        for s in servers:
+            s.close()
@@ -0,0 +1,106 @@
+"""Load generator: many concurrent client sessions against a running game server.
+Turn latency is the time from sending a move to reading its reply.
+"""
+
+import asyncio
+import random
+import resource
+import time
+from dataclasses import dataclass
+
+DIRECTIONS = (b"up\n", b"down\n", b"left\n", b"right\n")
+DEFAULT_CONNECT_BATCH = 256
+
+
+@dataclass
+class LoadReport:
+    sessions: int
+    turns: int
+    errors: int
+    seconds: float
+    latencies: list[float]
+
+    def quantile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self) -> str:
+        rate = self.turns / self.seconds if self.seconds else 0.0
+        return (
+            f"{self.sessions} sessions, {self.turns} turns in {self.seconds:.2f} s ({rate:.0f}/s), "
+            f"{self.errors} errors; latency p50 {self.quantile(0.5) * 1e3:.2f} ms, "
+            f"p99 {self.quantile(0.99) * 1e3:.2f} ms, max {self.quantile(1.0) * 1e3:.2f} ms"
+        )
+
+
+def _raise_fd_limit(needed: int) -> None:
+    """Lift the soft open-file limit towards `needed` (up to the hard limit)."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < needed:
+        target = needed if hard == resource.RLIM_INFINITY else min(needed, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+async def _connect(host: str | None, port: int | None, path: str | None):
+    if path is not None:
+        return await asyncio.open_unix_connection(path)
+    return await asyncio.open_connection(host, port)
+
+
+async def _play(
+    reader, writer, delay: float, seed: int, moves: int, think: float, report: LoadReport
+) -> None:
+    rng = random.Random(seed)
+    latencies = report.latencies
+    await asyncio.sleep(delay)
+    for _ in range(moves):
+        if think:
+            await asyncio.sleep(rng.uniform(0, 2 * think))
+        sent = time.perf_counter()
+        writer.write(rng.choice(DIRECTIONS))
+        line = await reader.readline()
+        latencies.append(time.perf_counter() - sent)
+        if not line:
+            report.errors += 1
+            return
+        report.turns += 1
+        if b'"won"' in line:
+            writer.write(f"new {seed}\n".encode())
+            await reader.readline()
+        elif line.startswith(b'{"error"') and b"Invalid move" not in line:
+            report.errors += 1
+    writer.write(b"quit\n")
+    await writer.drain()
+
+
+async def run_load(
+    sessions: int,
+    moves: int,
+    think: float = 0.0,
+    ramp: float = 1.0,
+    host: str | None = "127.0.0.1",
+    port: int | None = None,
+    path: str | None = None,
+    connect_batch: int = DEFAULT_CONNECT_BATCH,
+) -> LoadReport:
+    """Connect `sessions` clients, play them concurrently, and report turn latencies."""
+    _raise_fd_limit(sessions + 64)
+    report = LoadReport(sessions=0, turns=0, errors=0, seconds=0.0, latencies=[])
+    conns = []
+    for lo in range(0, sessions, connect_batch):
+        batch = range(lo, min(sessions, lo + connect_batch))
+        conns.extend(await asyncio.gather(*(_connect(host, port, path) for _ in batch)))
+    # Drain each greeting (the session's first keyframe) before the clock starts
+    await asyncio.gather(*(reader.readline() for reader, _ in conns))
+    report.sessions = len(conns)
+    began = time.perf_counter()
+    await asyncio.gather(*(
+        _play(reader, writer, ramp * seed / len(conns), seed, moves, think, report)
+        for seed, (reader, writer) in enumerate(conns)
+    ))
+    report.seconds = time.perf_counter() - began
+    for _, writer in conns:
+        writer.close()
+    return report
@@ -0,0 +1,103 @@
+"""One client's game: the CLI's line commands in, JSON lines (cli.stream) out.
+Adds `new SEED`, and with a store `session` / `resume ID`; rejected lines get an error object.
+"""
+
+import random
+import secrets
+from typing import Callable
+
+from catgame.cli.stream import JsonStream
+from catgame.game.moves import key_to_direction
+from catgame.game.turn import INVALID_MESSAGE, apply_move
+from catgame.models import COLS, ROWS, GameState
+from catgame.placement.placement import SEED_MAX, SEED_MIN, create_game
+from catgame.server.store import MemoryStore, TieredStore
+
+
+class Session:
+    """A game and its JSON stream; handle() runs one command line and writes the reply
+    lines to sink. Starts on `seed` (random if None) and prints its keyframe.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[str], None],
+        seed: int | None = None,
+        mouse_ai: str = "manhattan",
+        rows: int = ROWS,
+        cols: int = COLS,
+        cats: int = 1,
+        mice: int = 1,
+        json_mode: str = "full",
+        compact: bool = False,
+        store: MemoryStore | TieredStore | None = None,
+    ) -> None:
+        self.mouse_ai = mouse_ai
+        self.rows, self.cols = rows, cols
+        self.cats, self.mice = cats, mice
+        self.stream = JsonStream(json_mode, compact, sink)
+        self.store = store
+        self.session_id = secrets.token_hex(8)
+        self.state: GameState = self._new(seed)
+
+    def _new(self, seed: int | None) -> GameState:
+        if seed is None:
+            seed = random.randint(0, 2**31 - 1)
+        state = create_game(seed, self.mouse_ai, self.rows, self.cols, self.cats, self.mice)
+        self.stream.keyframe(state)
+        self._save(state)
+        return state
+
+    def _save(self, state: GameState) -> None:
+        if self.store is not None:
+            self.store.put(self.session_id, state)
+
+    def handle(self, line: str) -> bool:
+        """Run one command; False once the client asked to quit."""
+        cmd = line.strip().lower()
+        word, _, arg = cmd.partition(" ")
+        if cmd in ("quit", "exit"):
+            if self.store is not None:
+                self.store.delete(self.session_id)
+            return False
+        if cmd == "session":
+            self.stream.notice({"session": self.session_id})
+            return True
+        if word == "resume":
+            state = self.store.get(arg) if self.store is not None and arg else None
+            if state is None:
+                self.stream.error(f"No such session: {arg}")
+                return True
+            if self.state.turn == 0:
+                self.store.delete(self.session_id)  # The unplayed game this connection opened with
+            self.session_id, self.state = arg, state
+            self.stream.keyframe(state)
+            return True
+        if word in ("new", "restart"):
+            seed = None
+            if arg:
+                try:
+                    seed = int(arg)
+                except ValueError:
+                    pass
+                # Seeds are stored as int64 (see create_game)
+                if seed is None or not SEED_MIN <= seed <= SEED_MAX:
+                    self.stream.error(f"Bad seed: {arg}")
+                    return True
+            self.state = self._new(seed)
+            return True
+        if cmd == "state":
+            self.stream.keyframe(self.state)
+            return True
+        direction = key_to_direction(cmd)
+        if direction is None or self.state.status == "won":
+            self.stream.error(INVALID_MESSAGE)
+            return True
+        result = apply_move(self.state, direction)
+        if result.success:
+            self.state = result.state
+            self.stream.update(self.state)
+            self._save(self.state)
+        else:
+            self.stream.error(result.message or INVALID_MESSAGE)
+        return True
@@ -0,0 +1,212 @@
+"""Session stores: where the server keeps each session's GameState, by session id.
+A store has get(id) -> GameState | None, put(id, state), delete(id) and close().
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from catgame.log import get_logger
+from catgame.models import GameState
+from catgame.replay.log import restore, snapshot
+
+logger = get_logger(__name__)
+DEFAULT_CAPACITY = 100_000
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sessions"
+    " (id TEXT PRIMARY KEY, state BLOB NOT NULL, updated REAL NOT NULL)"
+)
+
+
+class MemoryStore:
+    """Least-recently-used states, at most `capacity` (None: unbounded). put() returns the
+    (id, state) it evicted, if any.
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        self.capacity = capacity
+        self._states: OrderedDict[str, GameState] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, session_id: str) -> GameState | None:
+        state = self._states.get(session_id)
+        if state is not None:
+            self._states.move_to_end(session_id)
+        return state
+
+    def put(self, session_id: str, state: GameState) -> tuple[str, GameState] | None:
+        states = self._states
+        states[session_id] = state
+        states.move_to_end(session_id)
+        if self.capacity is not None and len(states) > self.capacity:
+            return states.popitem(last=False)
+        return None
+
+    def delete(self, session_id: str) -> None:
+        self._states.pop(session_id, None)
+
+    def close(self) -> None:
+        self._states.clear()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(_SCHEMA)
+    return db
+
+
+class TieredStore:
+    """MemoryStore of up to `capacity` states over a SQLite file, checkpointed behind every
+    `interval` seconds. An error in the checkpoint thread is re-raised by checkpoint() or close().
+    """
+
+    def __init__(
+        self, path: Path, capacity: int | None = DEFAULT_CAPACITY,
+        interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.interval = interval
+        self.memory = MemoryStore(capacity)
+        self._reader = _connect(self.path)
+        self._writer_db = _connect(self.path)
+        # id -> state to write, or None to delete; _inflight is the batch being written
+        self._pending: dict[str, GameState | None] = {}
+        self._inflight: dict[str, GameState | None] = {}
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._writer, name="session-checkpoint", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def get(self, session_id: str) -> GameState | None:
+        state = self.memory.get(session_id)
+        if state is not None:
+            return state
+        with self._cond:
+            for batch in (self._pending, self._inflight):
+                if session_id in batch:
+                    return batch[session_id]
+        row = self._reader.execute(
+            "SELECT state FROM sessions WHERE id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        state = restore(row[0])
+        self.memory.put(session_id, state)
+        return state
+
+    def put(self, session_id: str, state: GameState) -> None:
+        self.memory.put(session_id, state)
+        with self._cond:
+            self._pending[session_id] = state
+
+    def delete(self, session_id: str) -> None:
+        self.memory.delete(session_id)
+        with self._cond:
+            self._pending[session_id] = None
+
+    def warm(self, limit: int | None = None) -> int:
+        """Load the most recently checkpointed sessions into memory (up to the memory capacity
+        or `limit`); returns how many were loaded.
+        """
+        caps = [n for n in (limit, self.memory.capacity) if n is not None]
+        query = "SELECT id, state FROM sessions ORDER BY updated DESC"
+        params: tuple = ()
+        if caps:
+            query += " LIMIT ?"
+            params = (min(caps),)
+        rows = self._reader.execute(query, params).fetchall()
+        # Oldest first, so the most recent end up most recently used
+        for session_id, blob in reversed(rows):
+            self.memory.put(session_id, restore(blob))
+        return len(rows)
+
+    def __len__(self) -> int:
+        """Sessions in the database (checkpointed ones only)."""
+        return self._reader.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def checkpoint(self) -> int:
+        """Write every change so far now; returns how many sessions were written or deleted."""
+        with self._cond:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return self._write_pending()
+
+    def _write_pending(self) -> int:
+        with self._write_lock:
+            with self._cond:
+                self._inflight, self._pending = self._pending, {}
+                batch = self._inflight
+            try:
+                if batch:
+                    now = time.time()
+                    rows = []
+                    for sid, state in batch.items():
+                        if state is None:
+                            continue
+                        # One state that cannot be encoded must not hold back the rest
+                        try:
+                            rows.append((sid, snapshot(state), now))
+                        except Exception as e:
+                            logger.warning("Not checkpointing session %s: %s", sid, e)
+                    gone = [(sid,) for sid, state in batch.items() if state is None]
+                    db = self._writer_db
+                    db.execute("BEGIN")
+                    try:
+                        db.executemany("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)", rows)
+                        db.executemany("DELETE FROM sessions WHERE id = ?", gone)
+                        db.execute("COMMIT")
+                    except BaseException:
+                        db.execute("ROLLBACK")
+                        raise
+            except BaseException:
+                # Put the batch back (behind anything newer) for the next attempt
+                with self._cond:
+                    self._pending = {**batch, **self._pending}
+                    self._inflight = {}
+                raise
+            with self._cond:
+                self._inflight = {}
+            return len(batch)
+
+    def _writer(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed, self.interval)
+                closed = self._closed
+            if closed:
+                return
+            try:
+                self._write_pending()
+            except Exception as e:  # surfaced by the next checkpoint() or close()
+                with self._cond:
+                    self._error = e
+
+    def close(self) -> None:
+        """Stop the checkpoint thread, write what is left, close the database."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+        try:
+            self.checkpoint()
+        finally:
+            self._reader.close()
+            self._writer_db.close()
+            self.memory.close()
@@ -0,0 +1 @@
+# Headless batch simulation: play games to completion without rendering
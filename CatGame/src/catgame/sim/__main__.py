@@ -0,0 +1,76 @@
+"""Simulation entrypoint: python -m catgame.sim --seeds START:STOP --policy bfs [--workers N]."""
+
+import argparse
+import sys
+from collections import Counter
+
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.sim.policies import POLICIES
+from catgame.sim.runner import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_TURNS,
+    seed_range,
+    simulate,
+    write_results,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Headless Cat Chase Mouse simulation (no rendering)"
+    )
+    parser.add_argument(
+        "--seeds", type=seed_range, required=True, metavar="START:STOP",
+        help="Half-open seed range to play",
+    )
+    parser.add_argument(
+        "--policy", choices=sorted(POLICIES), default="bfs", help="Cat policy (default: bfs)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, metavar="N",
+        help="Worker processes (default: CPU count; 1 = in-process)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, metavar="N",
+        help="Seeds per work unit",
+    )
+    parser.add_argument(
+        "--max-turns", type=int, default=DEFAULT_MAX_TURNS, metavar="N",
+        help="Give up on a game after N moves",
+    )
+    parser.add_argument(
+        "--mouse-ai", choices=MOUSE_AI_MODES, default="manhattan",
+        help="Mouse distance measure (default: manhattan)",
+    )
+    parser.add_argument(
+        "--format", choices=("jsonl", "csv"), default="jsonl",
+        help="Output format (default: jsonl)",
+    )
+    parser.add_argument(
+        "--output", "-o", default="-", metavar="FILE", help="Output file (default: stdout)"
+    )
+    args = parser.parse_args()
+
+    start, stop = args.seeds
+    outcomes: Counter[str] = Counter()
+
+    def tally(results):
+        for r in results:
+            outcomes[r.outcome] += 1
+            yield r
+
+    results = tally(simulate(
+        start, stop, args.policy, args.workers, args.chunk_size, args.max_turns, args.mouse_ai
+    ))
+    if args.output == "-":
+        write_results(results, sys.stdout, args.format)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_results(results, out, args.format)
+    summary = ", ".join(f"{k}={v}" for k, v in sorted(outcomes.items()))
+    print(f"{sum(outcomes.values())} games ({summary})", file=sys.stderr)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
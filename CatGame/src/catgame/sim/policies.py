@@ -0,0 +1,81 @@
+"""Cat policies for headless simulation: random, greedy (Manhattan), BFS chaser (shortest path)
+and solver (lookahead).
+"""
+
+import random
+from typing import Callable
+
+from catgame.game.moves import DIRECTION_DELTA
+from catgame.models import GameState, Position
+from catgame.solver import solve
+
+Policy = Callable[[GameState, random.Random], str | None]
+
+
+def _cat_options(state: GameState) -> list[tuple[str, Position]]:
+    """(direction, target) for every valid cat move, in DIRECTION_DELTA order."""
+    grid = state.grid
+    geo = grid.geometry
+    cat = state.cat.position
+    out: list[tuple[str, Position]] = []
+    for name, (dr, dc) in DIRECTION_DELTA.items():
+        r, c = cat.row + dr, cat.col + dc
+        if 0 <= r < geo.rows and 0 <= c < geo.cols:
+            target = geo.positions[r * geo.cols + c]
+            if not grid.is_blocked(target):
+                out.append((name, target))
+    return out
+
+
+def random_policy(state: GameState, rng: random.Random) -> str | None:
+    """Uniformly random valid move."""
+    options = _cat_options(state)
+    return rng.choice(options)[0] if options else None
+
+
+def greedy_policy(state: GameState, rng: random.Random) -> str | None:
+    """Move that minimizes Manhattan distance to the mouse (ties: row then col)."""
+    options = _cat_options(state)
+    if not options:
+        return None
+    mouse = state.mouse.position
+    return min(options, key=lambda o: (o[1].manhattan_distance(mouse), o[1].row, o[1].col))[0]
+
+
+def bfs_policy(state: GameState, rng: random.Random) -> str | None:
+    """Step along a shortest obstacle-free path to the mouse; greedy if the mouse is unreachable."""
+    options = _cat_options(state)
+    if not options:
+        return None
+    geo = state.grid.geometry
+    free = geo.full & ~state.grid.bits
+    # Grow BFS layers out from the mouse until one touches a cat move
+    reach = geo.bit(state.mouse.position)
+    while True:
+        for name, target in options:
+            if reach & geo.bit(target):
+                return name
+        grown = geo.dilate(reach) & free
+        if grown == reach:
+            return greedy_policy(state, rng)
+        reach = grown
+
+
+# Plies of lookahead for the solver policy: fixed depth, not a time budget, so results do not
+# depend on machine speed
+SOLVER_POLICY_DEPTH = 2
+
+
+def solver_policy(state: GameState, rng: random.Random) -> str | None:
+    """Expectimax lookahead (catgame.solver) to SOLVER_POLICY_DEPTH; plays a proven win when
+    one is in range, otherwise closes in along the shortest path.
+    """
+    return solve(state, time_budget=None, max_depth=SOLVER_POLICY_DEPTH, mode="expectimax").move
+
+
+POLICIES: dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "bfs": bfs_policy,
+    "solver": solver_policy,
+}
@@ -0,0 +1,143 @@
+"""Play seeded games to completion with a cat policy; fan seed chunks out over a process pool."""
+
+import argparse
+import csv
+import json
+import os
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from typing import IO, Iterable, Iterator
+
+from catgame.game.turn import apply_move
+from catgame.mouse_ai.ai import MOUSE_AI_MODES
+from catgame.placement.placement import SEED_MAX, SEED_MIN, create_game
+from catgame.sim.policies import POLICIES
+
+DEFAULT_MAX_TURNS = 10_000
+DEFAULT_CHUNK_SIZE = 256
+
+
+def seed_range(text: str) -> tuple[int, int]:
+    """argparse type for a half-open START:STOP seed range within SEED_MIN..SEED_MAX."""
+    try:
+        start_s, stop_s = text.split(":", 1)
+        start, stop = int(start_s), int(stop_s)
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected START:STOP, e.g. 0:100000") from None
+    if stop < start:
+        raise argparse.ArgumentTypeError("STOP must be >= START")
+    if start < SEED_MIN or stop > SEED_MAX + 1:
+        raise argparse.ArgumentTypeError(f"seeds must be in {SEED_MIN}..{SEED_MAX}")
+    return start, stop
+
+
+@dataclass
+class GameResult:
+    """Outcome of one simulated game.
+    outcome: "catch" (cat landed on mouse), "trap" (mouse had no move),
+    "stuck" (cat had no valid move) or "timeout" (max_turns reached).
+    """
+
+    seed: int
+    policy: str
+    outcome: str
+    moves: int
+    reshuffles: int
+
+
+def play_game(
+    seed: int, policy: str, max_turns: int = DEFAULT_MAX_TURNS, mouse_ai: str = "manhattan"
+) -> GameResult:
+    """Play create_game(seed, mouse_ai) with the named policy until won, stuck, or max_turns
+    moves.
+    """
+    choose = POLICIES[policy]
+    # Policy randomness is its own stream so it never perturbs the game's draws
+    policy_rng = random.Random(f"{policy}:{seed}")
+    state = create_game(seed, mouse_ai)
+    moves = 0
+    reshuffles = 0
+    outcome = "timeout"
+    while moves < max_turns:
+        direction = choose(state, policy_rng)
+        if direction is None:
+            outcome = "stuck"
+            break
+        result = apply_move(state, direction)
+        if not result.success:
+            outcome = "stuck"
+            break
+        moves += 1
+        if result.state.grid is not state.grid:
+            reshuffles += 1
+        state = result.state
+        if state.status == "won":
+            outcome = "catch" if state.cat.position == state.mouse.position else "trap"
+            break
+    return GameResult(seed=seed, policy=policy, outcome=outcome, moves=moves, reshuffles=reshuffles)
+
+
+def _run_chunk(task: tuple[int, int, str, int, str]) -> list[GameResult]:
+    start, stop, policy, max_turns, mouse_ai = task
+    return [play_game(seed, policy, max_turns, mouse_ai) for seed in range(start, stop)]
+
+
+def simulate(
+    start: int,
+    stop: int,
+    policy: str,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    mouse_ai: str = "manhattan",
+) -> Iterator[GameResult]:
+    """Yield one GameResult per seed in [start, stop), in seed order.
+    workers=1 runs in-process; otherwise chunks of chunk_size seeds go to a process pool
+    with a bounded number in flight. Results do not depend on the worker count.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy!r} (choose from {', '.join(POLICIES)})")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if mouse_ai not in MOUSE_AI_MODES:
+        raise ValueError(
+            f"Unknown mouse AI: {mouse_ai!r} (choose from {', '.join(MOUSE_AI_MODES)})"
+        )
+    tasks = (
+        (s, min(s + chunk_size, stop), policy, max_turns, mouse_ai)
+        for s in range(start, stop, chunk_size)
+    )
+    if workers == 1:
+        for task in tasks:
+            yield from _run_chunk(task)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight: deque = deque()
+        limit = 4 * workers
+        for task in tasks:
+            in_flight.append(pool.submit(_run_chunk, task))
+            if len(in_flight) >= limit:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def write_results(results: Iterable[GameResult], out: IO[str], fmt: str = "jsonl") -> int:
+    """Stream results to out as JSONL or CSV (with header). Returns number written."""
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=[f.name for f in fields(GameResult)])
+        writer.writeheader()
+        for r in results:
+            writer.writerow(asdict(r))
+            count += 1
+    elif fmt == "jsonl":
+        for r in results:
+            out.write(json.dumps(asdict(r)) + "\n")
+            count += 1
+    else:
+        raise ValueError(f"Unknown format: {fmt!r}")
+    return count
@@ -0,0 +1,12 @@
+"""Cat solver: minimum moves to force a win (par), by iterative-deepening expectimax."""
+
+from catgame.solver.search import (
+    SOLVER_MODES,
+    Solver,
+    SolveResult,
+    TranspositionTable,
+    lower_bound,
+    solve,
+)
+
+__all__ = ["SOLVER_MODES", "SolveResult", "Solver", "TranspositionTable", "lower_bound", "solve"]
@@ -0,0 +1,240 @@
+"""Cat solver: fewest cat moves to force a win against the deterministic mouse.
+Iterative deepening with a transposition table; reshuffles are either the drawn one ("exact")
+or a chance node ("expectimax").
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+from catgame.game.moves import DIRECTION_DELTA
+from catgame.game.turn import move_pieces
+from catgame.models import GameState
+from catgame.mouse_ai.distance import distance_field
+from catgame.placement.placement import RESHUFFLE_PROB, reshuffle_obstacles
+from catgame.placement.rng import TurnRng, mix64
+
+SOLVER_MODES = ("exact", "expectimax")
+DEFAULT_TABLE_SIZE = 1 << 16
+# Nodes between clock checks
+_CHECK_EVERY = 256
+
+INF = math.inf
+
+
+class _Timeout(Exception):
+    pass
+
+
+@dataclass(slots=True)
+class SolveResult:
+    """Outcome of solve(): best first move (None if none), moves to win (a lower bound
+    unless proven), deepest completed iteration and positions searched.
+    """
+
+    move: str | None
+    value: float
+    proven: bool
+    depth: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def par(self) -> int | None:
+        """Proven moves-to-win as an int (exact mode), else None."""
+        if self.proven and self.value != INF and self.value == int(self.value):
+            return int(self.value)
+        return None
+
+
+class TranspositionTable:
+    """Fixed number of slots indexed by (state.key, turn); one entry per slot.
+    Stale generations are replaced first, then shallower and unproven entries.
+    """
+
+    __slots__ = ("mask", "slots", "generation", "hits", "stores")
+
+    def __init__(self, size: int = DEFAULT_TABLE_SIZE) -> None:
+        if size < 1 or size & (size - 1):
+            raise ValueError("Table size must be a power of two")
+        self.mask = size - 1
+        # (key, turn, depth, value, proven, move, generation)
+        self.slots: list[tuple | None] = [None] * size
+        self.generation = 0
+        self.hits = 0
+        self.stores = 0
+
+    def _index(self, key: int, turn: int) -> int:
+        return (key ^ mix64(turn)) & self.mask
+
+    def get(self, key: int, turn: int) -> tuple | None:
+        entry = self.slots[self._index(key, turn)]
+        if entry is not None and entry[0] == key and entry[1] == turn:
+            self.hits += 1
+            return entry
+        return None
+
+    def put(
+        self, key: int, turn: int, depth: int, value: float, proven: bool, move: str | None
+    ) -> None:
+        i = self._index(key, turn)
+        old = self.slots[i]
+        if old is not None and old[6] == self.generation:
+            same = old[0] == key and old[1] == turn
+            if old[4] and not proven:
+                return
+            if not same and not proven and old[2] > depth:
+                return
+        self.slots[i] = (key, turn, depth, value, proven, move, self.generation)
+        self.stores += 1
+
+    def __len__(self) -> int:
+        return sum(1 for e in self.slots if e is not None)
+
+
+def lower_bound(state: GameState) -> int:
+    """Admissible moves-to-win: each turn changes the Manhattan distance by at most 2."""
+    if state.status == "won":
+        return 0
+    cat, mouse = state.cat.position, state.mouse.position
+    return max(1, (abs(cat.row - mouse.row) + abs(cat.col - mouse.col) + 1) // 2)
+
+
+class Solver:
+    """One search: settings, the transposition table, and counters. See solve()."""
+
+    def __init__(self, mode: str = "exact", table: TranspositionTable | None = None) -> None:
+        if mode not in SOLVER_MODES:
+            raise ValueError(
+                f"Unknown solver mode: {mode!r} (choose from {', '.join(SOLVER_MODES)})"
+            )
+        self.mode = mode
+        self.table = table if table is not None else TranspositionTable()
+        self.nodes = 0
+        self.deadline: float | None = None
+        self.max_nodes = INF
+
+    def _outcomes(self, state: GameState) -> list[tuple[float, GameState]]:
+        """Chance outcomes (probability, state) after the mouse has replied to a cat move."""
+        if state.status != "playing":
+            return [(1.0, state)]
+        rng = TurnRng(state.seed, state.turn)
+        fires = rng.random() < RESHUFFLE_PROB
+        if self.mode == "exact":
+            return [(1.0, reshuffle_obstacles(state, rng) if fires else state)]
+        reshuffled = reshuffle_obstacles(state, rng)
+        if reshuffled is state:
+            return [(1.0, state)]
+        return [(1.0 - RESHUFFLE_PROB, state), (RESHUFFLE_PROB, reshuffled)]
+
+    def _children(self, state: GameState) -> list[tuple[tuple, str, GameState, int]]:
+        """(order key, direction, state before the reshuffle, estimate) for every valid cat
+        move, best first.
+        """
+        out = []
+        for direction in DIRECTION_DELTA:
+            result = move_pieces(state, direction)
+            if not result.success:
+                continue
+            moved = result.state
+            estimate = 1 + lower_bound(moved)
+            if moved.status == "won":
+                path = 0
+            else:
+                geo = moved.grid.geometry
+                field = distance_field(moved.grid, geo.index(moved.mouse.position))
+                path = field.distance(geo.index(moved.cat.position))
+                if path is None:
+                    path = geo.size
+            out.append(((estimate, path), direction, moved, estimate))
+        out.sort(key=lambda child: child[0])
+        return out
+
+    def search(self, state: GameState, depth: int) -> tuple[float, bool, str | None]:
+        """(value, proven, best move) of state with `depth` cat moves left to look at."""
+        self.nodes += 1
+        if self.nodes % _CHECK_EVERY == 0 and (
+            self.nodes > self.max_nodes
+            or self.deadline is not None and time.perf_counter() > self.deadline
+        ):
+            raise _Timeout
+        if state.status == "won":
+            return 0, True, None
+        if depth == 0:
+            return lower_bound(state), False, None
+        key, turn = state.key, state.turn
+        entry = self.table.get(key, turn)
+        tt_move = None
+        if entry is not None:
+            if entry[4] or entry[2] >= depth:
+                return entry[3], entry[4], entry[5]
+            tt_move = entry[5]
+        children = self._children(state)
+        if not children:
+            # The cat is walled in: it can never win from here
+            self.table.put(key, turn, depth, INF, True, None)
+            return INF, True, None
+        if tt_move is not None:
+            children.sort(key=lambda child: child[1] != tt_move)
+        best, best_proven, best_move = INF, False, None
+        for _, direction, moved, estimate in children:
+            # Cannot beat the best so far (or only tie an already proven value)
+            if estimate > best or (estimate == best and best_proven):
+                continue
+            if depth == 1 and moved.status != "won":
+                # Every outcome is a leaf scored by the same bound
+                value, proven = estimate, False
+            else:
+                value, proven = 1, True
+                for p, child in self._outcomes(moved):
+                    v, pr, _ = self.search(child, depth - 1)
+                    value += p * v
+                    proven = proven and pr
+            if value < best or (value == best and proven and not best_proven):
+                best, best_proven, best_move = value, proven, direction
+        if best_move is None:
+            # Every move is a dead end (all children unwinnable)
+            best_move = children[0][1]
+            best_proven = True
+        self.table.put(key, turn, depth, best, best_proven, best_move)
+        return best, best_proven, best_move
+
+
+def solve(
+    state: GameState,
+    time_budget: float | None = 1.0,
+    max_depth: int = 64,
+    mode: str = "exact",
+    table: TranspositionTable | None = None,
+    max_nodes: int | None = None,
+) -> SolveResult:
+    """Best cat move and moves-to-win for state, deepening until the value is proven or
+    max_depth, time_budget seconds or about max_nodes positions is reached (None: no limit).
+    """
+    solver = Solver(mode, table)
+    start = time.perf_counter()
+    result = SolveResult(
+        move=None, value=lower_bound(state), proven=state.status == "won",
+        depth=0, nodes=0, elapsed=0.0,
+    )
+    if state.status != "playing":
+        return result
+    _ = state.key  # compute the Zobrist key before timing starts
+    for depth in range(1, max_depth + 1):
+        solver.table.generation += 1
+        try:
+            value, proven, move = solver.search(state, depth)
+        except _Timeout:
+            break
+        result.move, result.value, result.proven, result.depth = move, value, proven, depth
+        if proven:
+            break
+        if max_nodes is not None:
+            solver.max_nodes = max_nodes
+        if time_budget is not None:
+            solver.deadline = start + time_budget
+            if time.perf_counter() > solver.deadline:
+                break
+    result.nodes = solver.nodes
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -1,17 +1,21 @@
 """Contract tests: initial state shows grid with cat, mouse, obstacles; after move, updated positions."""
 
+import json
 import os
 import subprocess
 import sys
+import tempfile
 import unittest
 
 
-def _run_cli(seed: int, stdin_text: str) -> tuple[str, str, int]:
+def _run_cli(
+    seed: int, stdin_text: str, *args: str, env: dict[str, str] | None = None
+) -> tuple[str, str, int]:
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     src = os.path.join(repo_root, "src")
-    env = {**os.environ, "PYTHONPATH": src}
+    env = {**os.environ, **(env or {}), "PYTHONPATH": src}
     proc = subprocess.run(
-        [sys.executable, "-m", "catgame.cli", "--seed", str(seed)],
+        [sys.executable, "-m", "catgame.cli", "--seed", str(seed), *args],
         input=stdin_text,
         capture_output=True,
         text=True,
@@ -39,6 +43,84 @@ def test_after_move_stdout_shows_updated_positions() -> None:
     assert stdout.count("Status:") >= 2
 
 
+def test_board_size_options() -> None:
+    stdout, _, code = _run_cli(10, "state\nquit\n", "--rows", "8", "--cols", "12")
+    assert code == 0
+    lines = [
+        line for line in stdout.split("\n")
+        if len(line) == 12 and ("C" in line or "\N{full block}" in line or "#" in line)
+    ]
+    assert len(lines) >= 8
+    stdout, _, code = _run_cli(10, "quit\n", "--rows", "8", "--cols", "12", "--json")
+    assert code == 0 and json.loads(stdout.splitlines()[0])["grid_size"] == [8, 12]
+    stdout, _, code = _run_cli(10, "quit\n", "--json")
+    assert json.loads(stdout.splitlines()[0])["grid_size"] == [20, 30]
+
+
+def test_cats_and_mice_options() -> None:
+    agents = ("--rows", "8", "--cols", "12", "--cats", "2", "--mice", "3")
+    stdout, _, code = _run_cli(4, "quit\n", *agents, "--json")
+    assert code == 0
+    obj = json.loads(stdout.splitlines()[0])
+    assert len(obj["cats"]) == 2 and len(obj["mice"]) == 3
+    assert obj["cat"] == obj["cats"][0] and obj["mouse"] == obj["mice"][0]
+    stdout, _, code = _run_cli(4, "state\nquit\n", *agents)
+    grid = [line for line in stdout.split("\n") if len(line) == 12][-8:]
+    assert sum(line.count("C") for line in grid) == 2
+    assert sum(line.count("M") for line in grid) == 3
+    # Single-agent games keep their JSON shape
+    stdout, _, _ = _run_cli(4, "quit\n", "--json")
+    assert "cats" not in json.loads(stdout.splitlines()[0])
+
+
+def test_record_then_replay() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "games.rpl")
+        played, _, code = _run_cli(20, "up\ndown\nleft\nright\nquit\n", "--json", "--record", path)
+        assert code == 0
+        states = [json.loads(line) for line in played.splitlines()]
+        moves = len(states) - 1
+        stdout, _, code = _run_cli(0, "", "--json", "--replay", path)
+        assert code == 0 and [json.loads(line) for line in stdout.splitlines()] == states
+        stdout, _, code = _run_cli(0, "", "--json", "--replay", path, "--seek", "1")
+        assert code == 0
+        assert [json.loads(line) for line in stdout.splitlines()] == [states[min(1, moves)]]
+        stdout, _, code = _run_cli(0, "", "--replay", path)
+        assert code == 0 and stdout.startswith(f"Seed 20: {moves} moves, playing")
+        _, stderr, code = _run_cli(0, "", "--replay", path, "--game", "5")
+        assert code == 1 and "No game 5" in stderr
+
+
+def test_json_delta_stream() -> None:
+    stdout, _, code = _run_cli(3, "up\nleft\nstate\nright\nquit\n", "--json=delta")
+    assert code == 0
+    lines = [json.loads(line) for line in stdout.splitlines()]
+    assert [line["type"] for line in lines] == ["keyframe", "delta", "delta", "keyframe", "delta"]
+    assert [line["seq"] for line in lines] == [0, 1, 2, 3, 4]
+    assert lines[1]["cat"] != lines[0]["cat"] and "obstacles" not in lines[1]
+    # The resync keyframe carries the state the deltas led to
+    assert lines[3]["cat"] == lines[2].get("cat", lines[1].get("cat"))
+    assert lines[3]["turn"] == lines[2]["turn"]
+    stdout, _, code = _run_cli(3, "quit\n", "--json", "--compact", "--rows", "8", "--cols", "12")
+    obj = json.loads(stdout)
+    assert code == 0 and isinstance(obj["cat"], int)
+    assert obj["obstacles"] == sorted(obj["obstacles"])
+
+
+def test_json_mode_skips_other_modes_imports() -> None:
+    _, stderr, code = _run_cli(4, "up\nquit\n", "--json", env={"PYTHONPROFILEIMPORTTIME": "1"})
+    names = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert code == 0 and "catgame.cli.stream" in names
+    assert not names & {
+        "curses", "termios", "tty", "pygame",
+        "catgame.cli.curses_ui", "catgame.gui.pygame_ui", "catgame.par.index", "catgame.replay.log",
+    }
+
+
 class TestCLIDisplay(unittest.TestCase):
     def test_initial_shows_grid(self) -> None:
         test_initial_state_shows_grid_cat_mouse_obstacles()
@@ -46,6 +128,21 @@ class TestCLIDisplay(unittest.TestCase):
     def test_after_move_updated(self) -> None:
         test_after_move_stdout_shows_updated_positions()
 
+    def test_board_size(self) -> None:
+        test_board_size_options()
+
+    def test_cats_and_mice(self) -> None:
+        test_cats_and_mice_options()
+
+    def test_record_replay(self) -> None:
+        test_record_then_replay()
+
+    def test_json_delta(self) -> None:
+        test_json_delta_stream()
+
+    def test_json_imports(self) -> None:
+        test_json_mode_skips_other_modes_imports()
+
 
 if __name__ == "__main__":
     unittest.main()
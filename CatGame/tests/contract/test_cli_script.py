@@ -0,0 +1,74 @@
+"""Contract tests: --script plays a whole command file and prints the final state, every Nth
+state or events.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from tests.contract.test_cli_display import _run_cli
+
+MOVES = "up\nleft\nxx\n\nstate\nright\ndown\nup\nup\nleft\n"
+
+
+def test_script_prints_final_state_of_line_mode() -> None:
+    line_out, _, code = _run_cli(3, MOVES + "quit\n", "--json")
+    assert code == 0
+    stdout, stderr, code = _run_cli(3, MOVES + "quit\nup\n", "--json", "--script", "-")
+    assert code == 0 and stderr == ""
+    assert stdout.splitlines() == line_out.splitlines()[-1:]
+    # Text output: the final grid and status only
+    stdout, _, code = _run_cli(3, MOVES, "--script", "-", "--rows", "6", "--cols", "9")
+    lines = stdout.splitlines()
+    assert code == 0 and len(lines) == 7 and lines[-1].startswith("Status: ")
+
+
+def test_script_every_nth_state() -> None:
+    # Line mode prints the first state and one per successful move (no `state` line here)
+    line_out, _, _ = _run_cli(3, MOVES.replace("state\n", ""), "--json")
+    states = [json.loads(line) for line in line_out.splitlines()]
+    turns = list(range(0, len(states), 2))
+    if turns[-1] != len(states) - 1:
+        turns.append(len(states) - 1)
+    expected = [states[turn] for turn in turns]
+    stdout, _, code = _run_cli(3, MOVES, "--json", "--script", "-", "--every", "2")
+    assert code == 0 and [json.loads(line) for line in stdout.splitlines()] == expected
+    stdout, _, code = _run_cli(3, MOVES, "--json=delta", "--script", "-", "--every", "2")
+    lines = [json.loads(line) for line in stdout.splitlines()]
+    assert [line["type"] for line in lines] == ["keyframe"] + ["delta"] * (len(expected) - 1)
+    assert [line["seq"] for line in lines] == list(range(len(expected)))
+    assert [line["turn"] for line in lines] == turns
+
+
+def test_script_events_and_file_input() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "moves.txt")
+        with open(path, "w") as f:
+            f.write(MOVES)
+        stdout, _, code = _run_cli(3, "", "--json", "--script", path, "--events")
+        assert code == 0
+        events = [json.loads(line) for line in stdout.splitlines()]
+        assert events[0] == {"event": "invalid", "line": 3, "message": "Invalid move"}
+        assert all(event["event"] in ("invalid", "won") for event in events)
+        stdout, _, code = _run_cli(3, "", "--script", path, "--events")
+        assert code == 0 and stdout.splitlines()[0] == "3: Invalid move"
+        _, stderr, code = _run_cli(3, "", "--script", os.path.join(tmp, "missing.txt"))
+        assert code == 1 and "Cannot read script file" in stderr
+    _, _, code = _run_cli(3, "", "--every", "2")
+    assert code == 2
+
+
+class TestCLIScript(unittest.TestCase):
+    def test_final_state(self) -> None:
+        test_script_prints_final_state_of_line_mode()
+
+    def test_every(self) -> None:
+        test_script_every_nth_state()
+
+    def test_events(self) -> None:
+        test_script_events_and_file_input()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Integration: leaderboard cache invalidation, write-behind batching, atomic multi-process
+writes.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from catgame import leaderboard as lb
+from catgame.leaderboard import LEADERBOARD_SIZE, Leaderboard
+
+
+def test_cached_view_rereads_only_on_change(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lb.json"
+        path.write_text(json.dumps([{"name": "BBBB", "moves": 9}, {"name": "AAAA", "moves": 4}]))
+        reads = []
+        real_read = lb._read_entries
+        monkeypatch.setattr(lb, "_read_entries", lambda p: reads.append(p) or real_read(p))
+        board = Leaderboard(path)
+        assert board.top10() == [("AAAA", 4), ("BBBB", 9)]
+        for _ in range(50):
+            board.top10()
+        assert len(reads) == 1
+        # Another writer (atomic replace => new inode) invalidates the cache
+        other = Leaderboard(path)
+        other.add_score("cccc", 1)
+        other.close()
+        before = len(reads)
+        assert board.top10()[0] == ("CCCC", 1)
+        board.top10()
+        assert len(reads) == before + 1
+
+
+def test_write_behind_batches_and_is_visible_immediately(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sub" / "lb.json"
+        merges = []
+        real_merge = lb._merge_into
+        monkeypatch.setattr(
+            lb, "_merge_into", lambda p, s: merges.append(list(s)) or real_merge(p, s)
+        )
+        board = Leaderboard(path)
+        for moves in (30, 10, 20):
+            board.add_score("ab", moves)
+        assert board.top10() == [("AB", 10), ("AB", 20), ("AB", 30)]
+        assert board.flush(timeout=5)
+        assert len(merges) == 1 and len(merges[0]) == 3
+        assert json.loads(path.read_text()) == [{"name": "AB", "moves": m} for m in (10, 20, 30)]
+        assert [p.name for p in path.parent.iterdir() if p.suffix == ".tmp"] == []
+        board.close()
+
+
+def test_failed_write_keeps_scores_for_retry(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lb.json"
+        failures = [OSError("disk full")]
+        real_merge = lb._merge_into
+
+        def merge(p, scores):
+            if failures:
+                raise failures.pop()
+            return real_merge(p, scores)
+
+        monkeypatch.setattr(lb, "_merge_into", merge)
+        board = Leaderboard(path)
+        board.add_score("abcd", 12)
+        with pytest.raises(OSError):
+            board.flush(timeout=5)
+        assert board.top10() == [("ABCD", 12)]
+        assert board.flush(timeout=5)
+        assert json.loads(path.read_text()) == [{"name": "ABCD", "moves": 12}]
+        board.close()
+
+
+def test_trims_to_size_and_module_api(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        monkeypatch.setenv("XDG_DATA_HOME", tmp)
+        assert lb.get_top10() == []
+        assert not (Path(tmp) / "catgame").exists()  # reads never create the directory
+        for moves in range(LEADERBOARD_SIZE + 5, 0, -1):
+            lb.add_score("", moves)
+        top = lb.get_top10()
+        assert top == [("????", m) for m in range(1, LEADERBOARD_SIZE + 1)]
+        assert len(lb.load_leaderboard()) == LEADERBOARD_SIZE
+
+
+def test_concurrent_processes_lose_no_scores() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lb.json"
+        src = str(Path(__file__).resolve().parents[2] / "src")
+        env = {**os.environ, "PYTHONPATH": src}
+        code = (
+            "import sys\n"
+            "from catgame.leaderboard import Leaderboard\n"
+            "b = Leaderboard(sys.argv[1]); k = int(sys.argv[2])\n"
+            "for i in range(3):\n"
+            "    b.add_score('P%d' % k, k * 3 + i)\n"
+            "    b.flush()\n"
+            "b.close()\n"
+        )
+        procs = [
+            subprocess.Popen([sys.executable, "-c", code, str(path), str(k)], env=env)
+            for k in range(4)
+        ]
+        assert all(p.wait(timeout=60) == 0 for p in procs)
+        assert [m for _, m in Leaderboard(path).top10()] == list(range(LEADERBOARD_SIZE))
+
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.monkeypatch = pytest.MonkeyPatch()
+
+    def tearDown(self) -> None:
+        self.monkeypatch.undo()
+
+    def test_cache(self) -> None:
+        test_cached_view_rereads_only_on_change(self.monkeypatch)
+
+    def test_write_behind(self) -> None:
+        test_write_behind_batches_and_is_visible_immediately(self.monkeypatch)
+
+    def test_retry(self) -> None:
+        test_failed_write_keeps_scores_for_retry(self.monkeypatch)
+
+    def test_module_api(self) -> None:
+        test_trims_to_size_and_module_api(self.monkeypatch)
+
+    def test_concurrent(self) -> None:
+        test_concurrent_processes_lose_no_scores()
+
+
+if __name__ == "__main__":
+    unittest.main()
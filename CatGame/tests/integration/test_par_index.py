@@ -0,0 +1,119 @@
+"""Integration: par index file format (append, extend, lookup, crash trimming) and the par
+build job.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from catgame.par import index as par_index
+from catgame.par.index import (
+    MAGIC,
+    UNSOLVED,
+    Par,
+    ParIndex,
+    append_range,
+    decode,
+    encode,
+    par_suffix,
+)
+from catgame.par.job import build_index, compute_par
+from catgame.placement.placement import create_game
+
+
+def test_encode_decode() -> None:
+    assert decode(encode(37, True)) == Par(37, True)
+    assert decode(encode(41, False)) == Par(41, False)
+    assert encode(None, False) == UNSOLVED and decode(UNSOLVED) is None
+    assert Par(41, False).label() == "par <=41"
+
+
+def test_append_extend_and_lookup() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "par.idx"
+        assert ParIndex(path).get(0) is None and ParIndex(path).ranges() == []
+        append_range(path, 10, [encode(5, True), encode(9, False)])
+        # Contiguous: extends the segment in place (one header, no gap)
+        append_range(path, 12, [UNSOLVED, encode(3, True)])
+        size = path.stat().st_size
+        assert size == len(MAGIC) + 16 + 2 * 4
+        append_range(path, 100, [encode(7, True)])
+        index = ParIndex(path)
+        assert index.ranges() == [(10, 14), (100, 101)]
+        assert index.get(10) == Par(5, True) and index.get(11) == Par(9, False)
+        assert 12 in index and index.get(12) is None
+        assert index.get(13) == Par(3, True) and index.get(100) == Par(7, True)
+        assert 9 not in index and 14 not in index and 101 not in index
+        assert index.missing(0, 200) == [(0, 10), (14, 100), (101, 200)]
+        assert index.missing(10, 14) == []
+        index.close()
+        with pytest.raises(ValueError):
+            append_range(path, 13, [encode(1, True)])
+
+
+def test_interrupted_append_is_trimmed() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "par.idx"
+        append_range(path, 0, [encode(4, True)])
+        good = path.stat().st_size
+        # A writer died after its values but before the header count that covers them
+        with open(path, "ab") as f:
+            f.write(b"\x05\x00" * 3)
+        assert ParIndex(path).ranges() == [(0, 1)]
+        append_range(path, 1, [encode(6, True)])
+        assert path.stat().st_size == good + 2
+        assert ParIndex(path).get(1) == Par(6, True)
+
+
+def test_build_index_fills_only_missing_seeds(monkeypatch) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "par.idx"
+        kwargs = dict(workers=1, chunk_size=2, nodes=600, depth=1, max_turns=40)
+        assert build_index(path, 0, 3, **kwargs) == 3
+        assert build_index(path, 0, 5, **kwargs) == 2
+        index = ParIndex(path)
+        assert index.ranges() == [(0, 5)]
+        for seed in range(5):
+            moves, exact = compute_par(seed, nodes=600, depth=1, max_turns=40)
+            assert index.raw(seed) == encode(moves, exact)
+        # The default index lives next to the leaderboard
+        monkeypatch.setenv("XDG_DATA_HOME", tmp)
+        (Path(tmp) / "catgame").mkdir()
+        path.rename(Path(tmp) / "catgame" / "par.idx")
+        par_index.default_index.cache_clear()
+        try:
+            par = index.get(0)
+            assert par_suffix(create_game(0)) == (f" ({par.label()})" if par else "")
+            assert par_suffix(create_game(10**6)) == ""
+            # Par is only known for the board and mouse the job plays
+            assert par_suffix(create_game(0, "bfs")) == ""
+            assert par_suffix(create_game(0, rows=10, cols=10)) == ""
+            assert par_suffix(create_game(0, cats=2, mice=3)) == ""
+        finally:
+            par_index.default_index.cache_clear()
+
+
+class TestParIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.monkeypatch = pytest.MonkeyPatch()
+
+    def tearDown(self) -> None:
+        self.monkeypatch.undo()
+
+    def test_encoding(self) -> None:
+        test_encode_decode()
+
+    def test_append(self) -> None:
+        test_append_extend_and_lookup()
+
+    def test_trim(self) -> None:
+        test_interrupted_append_is_trimmed()
+
+    def test_build(self) -> None:
+        test_build_index_fills_only_missing_seeds(self.monkeypatch)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Integration tests for replay records: round trip, keyframe seeking, appended files, bulk
+reading.
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from catgame.game.turn import apply_move
+from catgame.placement.placement import SEED_MAX, SEED_MIN, create_game
+from catgame.replay.log import (
+    MAGIC,
+    Recorder,
+    Replay,
+    ReplayWriter,
+    iter_replays,
+    load_replays,
+    read_replays,
+)
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _play(seed: int, moves: int, interval: int, **options) -> tuple[bytes, list]:
+    """Random game recorded with `interval`; returns the record and every state by turn."""
+    state = create_game(seed, **options)
+    recorder = Recorder(state, interval)
+    states = [state]
+    rng = random.Random(seed)
+    for _ in range(moves):
+        direction = rng.choice(DIRECTIONS)
+        result = apply_move(state, direction)
+        if not result.success:
+            continue
+        state = result.state
+        recorder.record(direction, state)
+        states.append(state)
+        if state.status == "won":
+            break
+    return recorder.to_bytes(), states
+
+
+def _same(a, b) -> bool:
+    if (a.turn, a.status, a.cat, a.mouse, a.grid.bits, a.key) != (
+        b.turn, b.status, b.cat, b.mouse, b.grid.bits, b.key
+    ):
+        return False
+    if b.occupancy is None:
+        return a.occupancy is None
+    return (a.occupancy.cats, a.occupancy.mice, a.occupancy.caught) == (
+        b.occupancy.cats, b.occupancy.mice, b.occupancy.caught
+    )
+
+
+def test_round_trip_and_seek() -> None:
+    for options in ({}, {"mouse_ai": "bfs"}, {"rows": 12, "cols": 16, "cats": 3, "mice": 4}):
+        for seed in range(3):
+            data, states = _play(seed, 250, 8, **options)
+            replay = Replay(data)
+            assert (replay.seed, replay.turns, replay.size) == (seed, len(states) - 1, len(data))
+            assert replay.status == states[-1].status and replay.key == states[-1].key
+            assert replay.keyframes == sum(
+                1 for s in states[1:] if s.turn % 8 == 0 and s.status == "playing"
+            )
+            assert replay.verify()
+            for turn in sorted({0, 1, 7, 8, 9, replay.turns // 2, replay.turns}):
+                assert _same(replay.seek(turn), states[turn])
+            assert all(_same(a, b) for a, b in zip(replay.states(), states, strict=True))
+            with pytest.raises(ValueError):
+                replay.seek(replay.turns + 1)
+
+
+def test_moves_take_two_bits() -> None:
+    data, states = _play(4, 400, 1000)
+    replay = Replay(data)
+    assert replay.keyframes == 0
+    assert len(data) == len(Recorder(states[0]).to_bytes()) + (replay.turns + 3) // 4
+    assert replay.directions() == [
+        next(d for d in DIRECTIONS if apply_move(a, d).state.key == b.key)
+        for a, b in zip(states, states[1:])
+    ]
+
+
+def test_files_append_and_tolerate_torn_tail() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "games.rpl"
+        writer = ReplayWriter(path, interval=4)
+        for seed in range(3):
+            state = create_game(seed)
+            writer.start(state)
+            for direction in DIRECTIONS * 3:
+                result = apply_move(state, direction)
+                if result.success:
+                    state = result.state
+                    writer.move(direction, state)
+        writer.start(create_game(9))  # no moves: not written
+        writer.close()
+        replays = load_replays(path)
+        assert [r.seed for r in replays] == [0, 1, 2] and all(r.verify() for r in replays)
+        data = path.read_bytes()
+        assert len(list(read_replays(data[:-1]))) == 2
+        assert len(list(read_replays(data + MAGIC))) == 3
+        assert len(list(read_replays(b"junk" + data))) == 0
+        (Path(tmp) / "empty.rpl").write_bytes(b"")
+        paths = [path, Path(tmp) / "empty.rpl", path]
+        assert [r.seed for r in iter_replays(paths)] == [0, 1, 2, 0, 1, 2]
+    with pytest.raises(ValueError):
+        Recorder(state)
+
+
+def test_every_valid_seed_fits_the_header() -> None:
+    for seed in (SEED_MAX, SEED_MIN, -5):
+        data, states = _play(seed, 50, 8)
+        assert Replay(data).seed == seed
+        assert _same(Replay(data).seek(Replay(data).turns), states[-1])
+    for seed in (SEED_MAX + 1, SEED_MIN - 1):
+        with pytest.raises(ValueError):
+            create_game(seed)
+
+
+class TestReplay(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        test_round_trip_and_seek()
+
+    def test_two_bits(self) -> None:
+        test_moves_take_two_bits()
+
+    def test_files(self) -> None:
+        test_files_append_and_tolerate_torn_tail()
+
+    def test_seed_range(self) -> None:
+        test_every_valid_seed_fits_the_header()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Integration tests for the game server: sessions over TCP and Unix sockets, errors, idle
+timeouts, load generator.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from catgame.placement.placement import create_game
+from catgame.server.app import GameServer
+from catgame.server.loadgen import run_load
+from catgame.server.session import Session
+
+
+async def _exchange(reader, writer, command: str) -> dict:
+    writer.write(command.encode() + b"\n")
+    return json.loads(await reader.readline())
+
+
+async def _drain(server: GameServer) -> None:
+    while server.sessions:
+        await asyncio.sleep(0.01)
+
+
+def test_session_commands() -> None:
+    lines: list[str] = []
+    session = Session(lines.append, seed=7, json_mode="delta")
+    state = create_game(7)
+    first = json.loads(lines.pop())
+    assert first["type"] == "keyframe" and first["seed"] == 7
+    assert first["cat"] == [state.cat.position.row, state.cat.position.col]
+    assert session.handle("jump")
+    assert json.loads(lines.pop()) == {"error": True, "message": "Invalid move"}
+    assert session.handle("new 12") and json.loads(lines.pop())["seed"] == 12
+    assert session.handle("new x") and json.loads(lines.pop())["error"]
+    assert session.handle("state") and json.loads(lines.pop())["seq"] == 2
+    assert not session.handle("quit") and not lines
+
+
+def test_tcp_and_unix_sessions() -> None:
+    async def run() -> None:
+        server = GameServer(json_mode="delta", compact=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "game.sock")
+            tcp, unix = await server.start("127.0.0.1", 0, path)
+            port = tcp.sockets[0].getsockname()[1]
+            clients = [await asyncio.open_connection("127.0.0.1", port) for _ in range(3)]
+            clients.append(await asyncio.open_unix_connection(path))
+            for reader, _ in clients:
+                assert json.loads(await reader.readline())["type"] == "keyframe"
+            assert server.sessions == 4
+            # Independent games: each session plays its own seed
+            for k, (reader, writer) in enumerate(clients):
+                obj = await _exchange(reader, writer, f"new {k}")
+                state = create_game(k)
+                assert obj["seed"] == k
+                assert obj["cat"] == state.grid.geometry.index(state.cat.position)
+                replies = [
+                    await _exchange(reader, writer, d) for d in ("up", "left", "down", "right")
+                ]
+                assert all(r.get("type") == "delta" or r.get("error") for r in replies)
+                writer.write(b"quit\n")
+                assert await reader.readline() == b""
+                writer.close()
+            await _drain(server)
+            assert server.served == 4
+            tcp.close()
+            unix.close()
+
+    asyncio.run(run())
+
+
+def test_idle_timeout_and_long_lines() -> None:
+    async def run() -> None:
+        server = GameServer(idle_timeout=0.2, max_line=64)
+        (tcp,) = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        assert json.loads(await reader.readline()) == {"error": True, "message": "Idle timeout"}
+        assert await reader.readline() == b""
+        writer.close()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        writer.write(b"x" * 200 + b"\n")
+        assert json.loads(await reader.readline())["message"] == "Line too long"
+        writer.close()
+        await _drain(server)
+        tcp.close()
+
+    asyncio.run(run())
+
+
+def test_client_that_stops_reading_is_dropped() -> None:
+    async def run() -> None:
+        server = GameServer(idle_timeout=0.2, write_limit=1024)
+        (tcp,) = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # Far more replies than the socket buffers hold, none of them read
+        writer.write(b"state\n" * 50_000)
+        async with asyncio.timeout(10):
+            await _drain(server)
+        assert server.served == 1
+        writer.close()
+        tcp.close()
+
+    asyncio.run(run())
+
+
+def test_load_generator() -> None:
+    async def run() -> None:
+        server = GameServer(json_mode="delta")
+        (tcp,) = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        report = await run_load(40, 15, think=0.0, ramp=0.05, port=port)
+        assert (report.sessions, report.turns, report.errors) == (40, 600, 0)
+        assert len(report.latencies) == 600 and 0 < report.quantile(0.5) <= report.quantile(0.99)
+        assert "p99" in report.summary()
+        await _drain(server)
+        tcp.close()
+
+    asyncio.run(run())
+
+
+class TestServer(unittest.TestCase):
+    def test_session(self) -> None:
+        test_session_commands()
+
+    def test_sockets(self) -> None:
+        test_tcp_and_unix_sessions()
+
+    def test_timeouts(self) -> None:
+        test_idle_timeout_and_long_lines()
+        test_client_that_stops_reading_is_dropped()
+
+    def test_load(self) -> None:
+        test_load_generator()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Integration: headless simulation plays seeded games; results identical for any worker count."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from catgame.sim.runner import play_game, simulate, write_results
+
+
+def test_play_game_outcome_and_counts() -> None:
+    for policy, max_turns in (("random", 300), ("greedy", 300), ("bfs", 300), ("solver", 40)):
+        r = play_game(5, policy, max_turns=max_turns)
+        assert r.outcome in ("catch", "trap", "stuck", "timeout")
+        assert 0 <= r.reshuffles <= r.moves <= max_turns
+        assert r.outcome != "timeout" or r.moves == max_turns
+
+
+def test_same_results_regardless_of_workers() -> None:
+    serial = list(simulate(0, 12, "random", workers=1, chunk_size=5, max_turns=150))
+    pooled = list(simulate(0, 12, "random", workers=3, chunk_size=2, max_turns=150))
+    assert [r.seed for r in serial] == list(range(12))
+    assert serial == pooled
+
+
+def test_write_results_jsonl_and_csv() -> None:
+    results = list(simulate(0, 3, "greedy", workers=1, max_turns=50))
+    out = io.StringIO()
+    assert write_results(results, out, "jsonl") == 3
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [row["seed"] for row in rows] == [0, 1, 2]
+    out = io.StringIO()
+    write_results(results, out, "csv")
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "seed,policy,outcome,moves,reshuffles"
+    assert len(lines) == 4
+
+
+def test_cli_entrypoint_streams_jsonl() -> None:
+    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    env = {**os.environ, "PYTHONPATH": os.path.join(repo_root, "src")}
+    proc = subprocess.run(
+        [sys.executable, "-m", "catgame.sim", "--seeds", "3:6", "--policy", "bfs",
+         "--workers", "1", "--max-turns", "100"],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        cwd=repo_root,
+        env=env,
+    )
+    assert proc.returncode == 0
+    assert [json.loads(line)["seed"] for line in proc.stdout.splitlines()] == [3, 4, 5]
+    assert "3 games" in proc.stderr
+    bad = subprocess.run(
+        [sys.executable, "-m", "catgame.sim", f"--seeds=-1:{2**63 + 1}"],
+        capture_output=True, text=True, timeout=30, cwd=repo_root, env=env,
+    )
+    assert bad.returncode == 2 and "usage:" in bad.stderr
+
+
+class TestSim(unittest.TestCase):
+    def test_play_game(self) -> None:
+        test_play_game_outcome_and_counts()
+
+    def test_worker_count_independent(self) -> None:
+        test_same_results_regardless_of_workers()
+
+    def test_write_results(self) -> None:
+        test_write_results_jsonl_and_csv()
+
+    def test_cli(self) -> None:
+        test_cli_entrypoint_streams_jsonl()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""Integration tests for session stores: snapshots, LRU, write-behind SQLite tier, resuming
+after a restart.
+"""
+
+import json
+import random
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import pytest
+
+from catgame.game.turn import apply_move
+from catgame.models import GameState
+from catgame.placement.placement import create_game
+from catgame.replay.log import restore, snapshot
+from catgame.server.session import Session
+from catgame.server.store import MemoryStore, TieredStore
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _played(seed: int, moves: int, **options):
+    state = create_game(seed, **options)
+    rng = random.Random(seed)
+    for _ in range(moves):
+        result = apply_move(state, rng.choice(DIRECTIONS))
+        state = result.state
+        if state.status == "won":
+            break
+    return state
+
+
+def _same(a, b) -> bool:
+    def fields(s) -> tuple:
+        occupancy = s.occupancy
+        agents = None if occupancy is None else (occupancy.cats, occupancy.mice, occupancy.caught)
+        return (
+            s.grid.bits, s.cat, s.mouse, s.seed, s.status, s.message, s.turn, s.mouse_ai, s.key,
+            agents,
+        )
+
+    return fields(a) == fields(b)
+
+
+def test_snapshot_round_trip() -> None:
+    for options in ({}, {"mouse_ai": "bfs"}, {"rows": 8, "cols": 9, "cats": 2, "mice": 3}):
+        for seed in range(10):
+            state = _played(seed, 400, **options)
+            data = snapshot(state)
+            back = restore(data)
+            assert _same(back, state)
+            back._key = None
+            assert back.key == state.key
+            for direction in DIRECTIONS:
+                a, b = apply_move(state, direction), apply_move(restore(data), direction)
+                assert a.success == b.success and _same(a.state, b.state)
+    assert len(snapshot(create_game(1))) < 160
+    with pytest.raises(ValueError):
+        restore(b"\x09" + snapshot(create_game(1))[1:])
+
+
+def test_memory_store_is_lru() -> None:
+    store = MemoryStore(capacity=2)
+    a, b, c = (create_game(s) for s in range(3))
+    assert store.put("a", a) is None and store.put("b", b) is None
+    assert store.get("a") is a
+    assert store.put("c", c) == ("b", b)
+    assert store.get("b") is None and len(store) == 2
+    store.delete("a")
+    assert store.get("a") is None
+
+
+def test_tiered_store_writes_behind_and_restores() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sessions.db"
+        store = TieredStore(path, capacity=3, interval=3600)
+        states = {f"s{k}": _played(k, 30 + k) for k in range(8)}
+        for sid, state in states.items():
+            store.put(sid, state)
+        # Evicted but unwritten sessions are still served from the pending batch
+        assert len(store.memory) == 3 and len(store) == 0
+        assert all(store.get(sid) is state for sid, state in states.items())
+        assert store.checkpoint() == 8 and len(store) == 8
+        store.delete("s0")
+        store.close()
+
+        store = TieredStore(path, capacity=5, interval=0.05)
+        assert store.get("s0") is None
+        assert all(_same(store.get(sid), states[sid]) for sid in list(states)[1:])
+        store.close()
+
+        store = TieredStore(path, capacity=5)
+        assert store.warm() == 5 and len(store.memory) == 5
+        store.put("new", create_game(99))
+        store.close()
+        # The background thread checkpoints on its own
+        store = TieredStore(path, interval=0.05)
+        store.put("late", create_game(5))
+        deadline = time.monotonic() + 5
+        while len(store) < 9 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert len(store) == 9
+        store.close()
+
+
+def test_sessions_resume_after_restart() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sessions.db"
+        store = TieredStore(path)
+        lines: list[str] = []
+        session = Session(lines.append, seed=4, store=store)
+        for direction in ("up", "left", "left", "down"):
+            session.handle(direction)
+        session.handle("session")
+        sid = json.loads(lines[-1])["session"]
+        played = session.state
+        store.close()
+
+        store = TieredStore(path)
+        lines.clear()
+        other = Session(lines.append, seed=8, store=store)
+        assert other.handle("resume nope") and json.loads(lines[-1])["error"]
+        other.handle(f"resume {sid}")
+        obj = json.loads(lines[-1])
+        assert obj["seed"] == 4 and obj["cat"] == [played.cat.position.row, played.cat.position.col]
+        assert other.session_id == sid and _same(other.state, played)
+        # The unplayed game the connection opened with is dropped; quit drops the resumed one
+        other.handle("quit")
+        store.checkpoint()
+        assert len(store) == 0
+        store.close()
+
+
+def test_bad_seed_cannot_stop_checkpoints() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TieredStore(Path(tmp) / "sessions.db")
+        lines: list[str] = []
+        session = Session(lines.append, seed=4, store=store)
+        for arg in ("99999999999999999999", "-99999999999999999999", "x"):
+            assert session.handle(f"new {arg}") and json.loads(lines[-1])["error"]
+        assert session.state.seed == 4
+        # A state that cannot be encoded is dropped; the rest of the batch is written
+        good = create_game(5)
+        bad = GameState(good.grid, good.cat, good.mouse, seed=2**64, status="playing")
+        store.put("bad", bad)
+        store.put("good", good)
+        assert store.checkpoint() == 3 and len(store) == 2
+        assert store.checkpoint() == 0
+        store.close()
+
+
+class TestStore(unittest.TestCase):
+    def test_snapshot(self) -> None:
+        test_snapshot_round_trip()
+
+    def test_memory(self) -> None:
+        test_memory_store_is_lru()
+
+    def test_tiered(self) -> None:
+        test_tiered_store_writes_behind_and_restores()
+
+    def test_resume(self) -> None:
+        test_sessions_resume_after_restart()
+
+    def test_bad_seed(self) -> None:
+        test_bad_seed_cannot_stop_checkpoints()
+
+
+if __name__ == "__main__":
+    unittest.main()
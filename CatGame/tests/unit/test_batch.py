@@ -0,0 +1,141 @@
+"""Unit tests for vectorized batch stepping: lockstep results match scalar apply_move exactly."""
+
+import random
+import unittest
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from catgame.game.batch import (  # noqa: E402
+    DIRECTIONS,
+    BatchGameState,
+    _joined,
+    _no_split,
+    batch_apply_moves,
+)
+from catgame.game.turn import apply_move  # noqa: E402
+from catgame.models import Cat, GameState, Grid, Mouse, Position  # noqa: E402
+from catgame.models.bitboard import geometry  # noqa: E402
+from catgame.models.connectivity import Connectivity  # noqa: E402
+from catgame.placement.placement import create_game  # noqa: E402
+
+
+def _assert_same(batch: BatchGameState, states: list) -> None:
+    for i, s in enumerate(states):
+        b = batch.to_state(i)
+        assert b.cat.position == s.cat.position
+        assert b.mouse.position == s.mouse.position
+        assert b.grid.bits == s.grid.bits
+        assert b.status == s.status
+        assert b.message == s.message
+        assert b.turn == s.turn
+        assert b.seed == s.seed
+
+
+def test_round_trip_from_states() -> None:
+    states = [create_game(seed) for seed in (0, 1, 2, -1, -(2**63))]
+    _assert_same(BatchGameState.from_states(states), states)
+    # Games the arrays cannot hold are refused rather than truncated
+    for other in (create_game(0, "bfs"), create_game(0, cats=2, mice=3)):
+        with pytest.raises(ValueError):
+            BatchGameState.from_states([states[0], other])
+
+
+def test_batch_matches_scalar_apply_move() -> None:
+    rng = random.Random(4)
+    states = [create_game(seed) for seed in range(-20, 20)]
+    # A forced catch (cat just left of mouse) and a forced trap (mouse cornered) on the first move
+    states[0] = GameState(Grid(set()), Cat(Position(5, 5)), Mouse(Position(5, 6)), 0, "playing")
+    states[1] = GameState(
+        Grid({Position(1, 0)}), Cat(Position(0, 2)), Mouse(Position(0, 0)), 1, "playing"
+    )
+    batch = BatchGameState.from_states(states)
+    for step in range(150):
+        codes = [rng.randrange(4) for _ in states]
+        if step == 0:
+            codes[0], codes[1] = DIRECTIONS.index("right"), DIRECTIONS.index("left")
+        result = batch_apply_moves(batch, np.array(codes))
+        scalar = [apply_move(s, DIRECTIONS[c]) for s, c in zip(states, codes)]
+        assert result.success.tolist() == [r.success for r in scalar]
+        states = [r.state for r in scalar]
+        batch = result.state
+        _assert_same(batch, states)
+    assert states[0].status == "won" and states[0].cat.position == states[0].mouse.position
+    assert states[1].status == "won" and states[1].mouse.position == Position(0, 0)
+
+
+def test_batch_accepts_direction_names_and_rejects_unknown() -> None:
+    states = [create_game(1), create_game(2)]
+    batch = BatchGameState.from_states(states)
+    result = batch_apply_moves(batch, ["up", "sideways"])
+    assert result.success[0] == apply_move(states[0], "up").success
+    assert not result.success[1]
+    _assert_same(BatchGameState(
+        result.state.obstacles[1:], result.state.cat[1:], result.state.mouse[1:],
+        result.state.seed[1:], result.state.turn[1:], result.state.status[1:],
+    ), [states[1]])
+
+
+def test_batch_drops_disconnecting_reshuffles_like_scalar() -> None:
+    from tests.unit.test_reshuffle_rng import walled_state
+
+    states = [walled_state(turn) for turn in range(3000)]
+    batch = BatchGameState.from_states(states)
+    codes = np.full(len(states), DIRECTIONS.index("up"))
+    result = batch_apply_moves(batch, codes)
+    _assert_same(result.state, [apply_move(s, "up").state for s in states])
+
+
+def test_reshuffle_connectivity_checks_match_scalar() -> None:
+    # Packed (<= 64 columns) and per-cell flood fills, and the no-split shortcut, against
+    # the scalar Connectivity on random layouts with up to three new obstacles
+    rng = np.random.default_rng(3)
+    for rows, cols in ((20, 30), (4, 70), (3, 3)):
+        m, size = 300, rows * cols
+        games = np.arange(m)
+        blocked = rng.random((m, size)) < 0.25
+        before = blocked.copy()
+        added = np.where(rng.random((m, 3)) < 0.8, rng.integers(0, size, (m, 3)), -1)
+        for j in range(3):
+            hit = added[:, j] >= 0
+            blocked[games[hit], added[hit, j]] = True
+        start, goal = rng.integers(0, size, m), rng.integers(0, size, m)
+        blocked[games, start] = blocked[games, goal] = False
+        before[games, start] = before[games, goal] = False
+        geo = geometry(rows, cols)
+
+        def connected(layout: "np.ndarray") -> list[bool]:
+            bits = [int.from_bytes(np.packbits(row, bitorder="little"), "little") for row in layout]
+            return [
+                Connectivity.from_bits(geo, b).connected(int(s), int(g))
+                for b, s, g in zip(bits, start, goal)
+            ]
+
+        after_joined = connected(blocked)
+        assert _joined(~blocked, start, goal, rows, cols).tolist() == after_joined
+        safe = _no_split(blocked, added, rows, cols)
+        for was, now, ok in zip(connected(before), after_joined, safe):
+            assert now or not (ok and was)
+
+
+class TestBatch(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        test_round_trip_from_states()
+
+    def test_matches_scalar(self) -> None:
+        test_batch_matches_scalar_apply_move()
+
+    def test_direction_names(self) -> None:
+        test_batch_accepts_direction_names_and_rejects_unknown()
+
+
+    def test_disconnecting_reshuffles(self) -> None:
+        test_batch_drops_disconnecting_reshuffles_like_scalar()
+
+    def test_connectivity_checks(self) -> None:
+        test_reshuffle_connectivity_checks_match_scalar()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Unit tests for the bitboard-backed Grid: bit packing, neighbor masks, flood fill."""
+
+import unittest
+
+from catgame.game.moves import get_valid_moves
+from catgame.models import COLS, ROWS, Cat, GameState, Grid, Mouse, Position
+from catgame.models.bitboard import geometry
+from catgame.placement.placement import create_game
+
+
+def test_grid_bits_match_obstacles() -> None:
+    obstacles = {Position(0, 0), Position(5, 7), Position(ROWS - 1, COLS - 1)}
+    grid = Grid(obstacles)
+    assert grid.bits == (1 << 0) | (1 << (5 * COLS + 7)) | (1 << (ROWS * COLS - 1))
+    assert Grid.from_bits(grid.bits).obstacles == grid.obstacles
+    for p in obstacles:
+        assert grid.is_blocked(p)
+    assert not grid.is_blocked(Position(1, 1))
+
+
+def test_in_bounds_uses_rows_for_row() -> None:
+    grid = Grid(set())
+    assert grid.in_bounds(Position(ROWS - 1, COLS - 1))
+
+
+def test_valid_moves_match_reference() -> None:
+    state = create_game(3)
+    for p in state.grid.geometry.positions:
+        if state.grid.is_blocked(p) or p == state.cat.position:
+            continue
+        probe = GameState(state.grid, state.cat, Mouse(p), state.seed, "playing")
+        expected = []
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = p.row + dr, p.col + dc
+            if 0 <= r < ROWS and 0 <= c < COLS:
+                n = Position(r, c)
+                if n not in state.grid.obstacles and n != state.cat.position:
+                    expected.append(n)
+        assert get_valid_moves(probe, "mouse") == expected
+
+
+def test_dilate_does_not_wrap_rows() -> None:
+    geo = geometry()
+    right_edge = geo.bit(Position(3, COLS - 1))
+    grown = geo.positions_of(geo.dilate(right_edge))
+    assert Position(4, 0) not in grown
+    assert set(grown) == {
+        Position(3, COLS - 1), Position(2, COLS - 1), Position(4, COLS - 1), Position(3, COLS - 2)
+    }
+
+
+def test_path_exists_walled_off() -> None:
+    geo = geometry()
+    wall = geo.bits_of(Position(r, 10) for r in range(ROWS))
+    assert not geo.connected(0, 20, wall)
+    gap = wall & ~geo.bit(Position(ROWS - 1, 10))
+    assert geo.connected(0, 20, gap)
+    state = GameState(
+        Grid.from_bits(wall), Cat(Position(0, 0)), Mouse(Position(0, 20)), 0, "playing"
+    )
+    assert state.grid.obstacles == frozenset(Position(r, 10) for r in range(ROWS))
+
+
+class TestBitboard(unittest.TestCase):
+    def test_grid_bits(self) -> None:
+        test_grid_bits_match_obstacles()
+
+    def test_in_bounds(self) -> None:
+        test_in_bounds_uses_rows_for_row()
+
+    def test_valid_moves(self) -> None:
+        test_valid_moves_match_reference()
+
+    def test_dilate(self) -> None:
+        test_dilate_does_not_wrap_rows()
+
+    def test_path_exists(self) -> None:
+        test_path_exists_walled_off()
+
+
+if __name__ == "__main__":
+    unittest.main()
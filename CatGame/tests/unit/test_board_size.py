@@ -0,0 +1,124 @@
+"""Unit tests for per-game board sizes: generation guarantees, bounds, lazy tables and
+labeling on large boards.
+"""
+
+import random
+import unittest
+
+import pytest
+
+from catgame.cli.render import dirty_cells, render_grid
+from catgame.game.moves import get_valid_moves
+from catgame.game.turn import apply_move
+from catgame.models import Cat, GameState, Grid, Mouse, Position
+from catgame.models.bitboard import TABLE_MAX_CELLS, LazyTable, geometry, set_bits
+from catgame.placement.placement import _choose_bit, create_game
+
+SIZES = [(1, 5), (7, 11), (45, 3), (80, 90)]
+
+
+def test_create_game_on_other_sizes() -> None:
+    for rows, cols in SIZES:
+        for seed in range(15):
+            state = create_game(seed, rows=rows, cols=cols)
+            geo = state.grid.geometry
+            assert (geo.rows, geo.cols) == (rows, cols) == (state.grid.height, state.grid.width)
+            assert state.grid.in_bounds(state.cat.position)
+            assert state.grid.in_bounds(state.mouse.position)
+            assert get_valid_moves(state, "cat") and get_valid_moves(state, "mouse")
+            cat, mouse = geo.index(state.cat.position), geo.index(state.mouse.position)
+            assert state.grid.connectivity.connected(cat, mouse)
+            again = create_game(seed, rows=rows, cols=cols)
+            assert (again.grid.bits, again.cat, again.mouse) == (
+                state.grid.bits, state.cat, state.mouse,
+            )
+    with pytest.raises(ValueError):
+        create_game(0, rows=1, cols=2)
+
+
+def test_turns_respect_board_edges() -> None:
+    # 3 x 8 board, no obstacles: the cat on the right edge cannot move right
+    grid = Grid(set(), rows=3, cols=8)
+    state = GameState(grid, Cat(Position(1, 7)), Mouse(Position(1, 0)), seed=0, status="playing")
+    assert not apply_move(state, "right").success
+    moved = apply_move(state, "left")
+    assert moved.success and moved.state.cat.position == Position(1, 6)
+    assert moved.state.grid.geometry is grid.geometry
+    lines = render_grid(state).split("\n")
+    assert len(lines) == 3 and all(len(line) == 8 for line in lines)
+    assert lines[1][7] == "C" and lines[1][0] == "M"
+    assert dirty_cells(None, state) == list(range(24))
+    # Bounds are rows against height and cols against width
+    tall = Grid(set(), rows=30, cols=20)
+    assert tall.in_bounds(Position(25, 5)) and not tall.in_bounds(Position(5, 25))
+
+
+def test_lazy_tables_match_eager_ones() -> None:
+    geo = geometry(70, 70)
+    assert geo.size > TABLE_MAX_CELLS and isinstance(geo.neighbors, LazyTable)
+    small = geometry(7, 9)
+    for j in [0, 69, 70, 2415, geo.size - 1]:
+        r, c = divmod(j, 70)
+        expected = [
+            (r + dr) * 70 + c + dc
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= r + dr < 70 and 0 <= c + dc < 70
+        ]
+        assert [n for _, n in geo.neighbors[j]] == expected
+        assert geo.neighbor_mask[j] == sum(1 << n for n in expected)
+        assert geo.positions[j] == Position(r, c) and geo.positions[j] is geo.positions[j]
+    assert small.neighbor_mask[10] == sum(bit for bit, _ in small.neighbors[10])
+    rng = random.Random(3)
+    bits = rng.getrandbits(geo.size)
+    assert set_bits(bits) == [j for j in range(geo.size) if bits >> j & 1]
+    assert geo.bits_of_indices(set_bits(bits)) == bits
+
+
+def test_label_matches_components() -> None:
+    rng = random.Random(9)
+    for rows, cols in [(1, 1), (1, 9), (9, 1), (6, 13), (20, 30), (40, 70)]:
+        geo = geometry(rows, cols)
+        for density in (0.1, 0.4, 0.7):
+            free = geo.bits_of_indices(j for j in range(geo.size) if rng.random() > density)
+            node, sizes = geo.label(free)
+            comps = geo.components(free)
+            assert sizes == [comp.bit_count() for comp in comps]
+            for k, comp in enumerate(comps):
+                assert all(node[j] == k for j in set_bits(comp))
+            assert all(node[j] == -1 for j in set_bits(geo.full & ~free))
+
+
+def test_large_board_plays() -> None:
+    state = create_game(1, rows=300, cols=300)
+    assert state.grid.geometry.size == 90_000
+    rng = random.Random(1)
+    for _ in range(30):
+        result = apply_move(state, rng.choice(["up", "down", "left", "right"]))
+        if result.success:
+            state = result.state
+    geo = state.grid.geometry
+    if state.status == "playing":
+        cat, mouse = geo.index(state.cat.position), geo.index(state.mouse.position)
+        assert state.grid.connectivity.connected(cat, mouse)
+    assert _choose_bit(random.Random(0), 1 << (geo.size - 1)) == geo.size - 1
+
+
+class TestBoardSize(unittest.TestCase):
+    def test_create_game(self) -> None:
+        test_create_game_on_other_sizes()
+
+    def test_edges(self) -> None:
+        test_turns_respect_board_edges()
+
+    def test_lazy_tables(self) -> None:
+        test_lazy_tables_match_eager_ones()
+
+    def test_label(self) -> None:
+        test_label_matches_components()
+
+    def test_large_board(self) -> None:
+        test_large_board_plays()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Unit tests for the incremental connectivity index: agrees with a fresh flood fill after every
+change.
+"""
+
+import random
+import unittest
+
+from catgame.models import COLS, Grid, Position
+from catgame.models.bitboard import geometry
+from catgame.models.connectivity import Connectivity
+
+
+def _check(conn: Connectivity, blocked: int, rng: random.Random) -> None:
+    geo = conn.geometry
+    free = geo.full & ~blocked
+    assert conn.free == free
+    for comp in geo.components(free):
+        j = (comp & -comp).bit_length() - 1
+        assert conn.component_size(j) == comp.bit_count()
+    for _ in range(40):
+        a, b = rng.randrange(geo.size), rng.randrange(geo.size)
+        expected = bool((free >> a) & (free >> b) & 1) and geo.connected(a, b, blocked)
+        assert conn.connected(a, b) == expected
+
+
+def test_random_block_and_unblock_match_flood() -> None:
+    geo = geometry()
+    rng = random.Random(5)
+    blocked = 0
+    for j in rng.sample(range(geo.size), 150):
+        blocked |= 1 << j
+    conn = Connectivity.from_bits(geo, blocked)
+    for _ in range(600):
+        j = rng.randrange(geo.size)
+        if (blocked >> j) & 1:
+            conn.unblock(j)
+        else:
+            conn.block(j)
+        blocked ^= 1 << j
+        _check(conn, blocked, rng)
+
+
+def test_block_splits_corridor() -> None:
+    geo = geometry()
+    # Row 0 is a corridor: everything in row 1 is blocked
+    blocked = sum(1 << (COLS + c) for c in range(COLS))
+    conn = Connectivity.from_bits(geo, blocked)
+    assert conn.connected(0, COLS - 1)
+    conn.block(10)
+    assert not conn.connected(0, COLS - 1)
+    assert conn.component_size(0) == 10 and conn.component_size(COLS - 1) == COLS - 11
+    conn.unblock(10)
+    assert conn.connected(0, COLS - 1)
+
+
+def test_with_blocked_leaves_source_untouched() -> None:
+    grid = Grid({Position(0, 1), Position(1, 0)})
+    before = grid.connectivity
+    assert not before.connected(0, 5)
+    opened = grid.with_obstacles(grid.bits & ~(1 << 1))
+    assert opened.connectivity.connected(0, 5)
+    assert not grid.connectivity.connected(0, 5) and grid.connectivity is before
+    closed = opened.with_obstacles(opened.bits | (1 << 1) | (1 << (2 * COLS)))
+    rng = random.Random(1)
+    _check(closed.connectivity, closed.bits, rng)
+
+
+class TestConnectivity(unittest.TestCase):
+    def test_random(self) -> None:
+        test_random_block_and_unblock_match_flood()
+
+    def test_split(self) -> None:
+        test_block_splits_corridor()
+
+    def test_copy(self) -> None:
+        test_with_blocked_leaves_source_untouched()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit tests for the Gym-style environment: in-place observations, rewards, vector stepping
+and workers.
+"""
+
+import random
+import unittest
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from catgame.env import DIRECTIONS, CatEnv, VectorEnv  # noqa: E402
+from catgame.game.turn import apply_move  # noqa: E402
+from catgame.models.bitboard import set_bits  # noqa: E402
+from catgame.placement.placement import create_game  # noqa: E402
+from catgame.sim.policies import bfs_policy  # noqa: E402
+
+
+def _expected_obs(state) -> "np.ndarray":
+    geo = state.grid.geometry
+    obs = np.zeros((3, geo.size), dtype=np.uint8)
+    obs[0, set_bits(state.grid.bits)] = 1
+    if state.occupancy is not None:
+        obs[1, list(state.occupancy.cats)] = 1
+        obs[2, list(state.occupancy.mice)] = 1
+    else:
+        obs[1, geo.index(state.cat.position)] = 1
+        obs[2, geo.index(state.mouse.position)] = 1
+    return obs.reshape(3, geo.rows, geo.cols)
+
+
+def test_env_follows_apply_move() -> None:
+    for options in ({}, {"mouse_ai": "bfs"}, {"rows": 12, "cols": 15, "cats": 3, "mice": 4}):
+        env = CatEnv(**options)
+        for seed in range(3):
+            obs, info = env.reset(seed)
+            state = create_game(seed, **options)
+            assert info["seed"] == seed and np.array_equal(obs, _expected_obs(state))
+            rng = random.Random(seed)
+            caught = 0
+            for _ in range(400):
+                action = rng.randrange(4)
+                result = apply_move(state, DIRECTIONS[action])
+                out, reward, terminated, truncated, info = env.step(action)
+                assert out is obs and info["invalid"] == (not result.success) and not truncated
+                state = result.state
+                assert np.array_equal(obs, _expected_obs(state))
+                assert env.state.key == state.key
+                if state.occupancy is not None:
+                    now = state.occupancy.caught
+                else:
+                    now = int(state.status == "won")
+                assert reward == now - caught
+                caught = now
+                if terminated:
+                    assert state.status == "won"
+                    break
+
+
+def test_win_truncation_and_errors() -> None:
+    env = CatEnv()
+    env.reset(2)
+    rng = random.Random("bfs:2")  # as sim.runner.play_game: bfs catches on seed 2 in 36 moves
+    total = 0.0
+    while True:
+        _, reward, terminated, truncated, _ = env.step(bfs_policy(env.state, rng))
+        total += reward
+        if terminated or truncated:
+            break
+    assert terminated and total == 1.0
+    with pytest.raises(RuntimeError):
+        env.step(0)
+    short = CatEnv(max_turns=3)
+    short.reset(1)
+    flags = [short.step("left")[3] for _ in range(3)]
+    assert flags == [False, False, True]
+    with pytest.raises(ValueError):
+        CatEnv(obs=np.zeros((3, 5, 5), dtype=np.uint8))
+
+
+def _run(vec: VectorEnv, steps: int) -> list:
+    rng = np.random.default_rng(3)
+    out = [vec.reset(50).copy()]
+    for _ in range(steps):
+        actions = rng.integers(0, 4, vec.n, dtype=np.int8)
+        obs, rewards, terminated, truncated, info = vec.step(actions)
+        flags = (terminated.copy(), truncated.copy(), info["invalid"].copy())
+        out.append((obs.copy(), rewards.copy(), *flags))
+    return out
+
+
+def test_vector_env_matches_single_envs_and_workers() -> None:
+    n, steps = 6, 120
+    with VectorEnv(n, rows=10, cols=12, max_turns=40) as vec:
+        local = _run(vec, steps)
+    # Each slot autoresets onto seed + i + k * n
+    rng = np.random.default_rng(3)
+    actions = [rng.integers(0, 4, n, dtype=np.int8) for _ in range(steps)]
+    for i in range(n):
+        env = CatEnv(rows=10, cols=12, max_turns=40)
+        seed = 50 + i
+        env.reset(seed)
+        for t, action in enumerate(actions):
+            obs, reward, terminated, truncated, _ = env.step(int(action[i]))
+            _, rewards, terms, truncs, _ = local[t + 1]
+            assert (reward, terminated, truncated) == (rewards[i], terms[i], truncs[i])
+            if terminated or truncated:
+                seed += n
+                obs, _ = env.reset(seed)
+            assert np.array_equal(obs, local[t + 1][0][i])
+    assert any(step[3].any() for step in local[1:])
+    with VectorEnv(n, rows=10, cols=12, max_turns=40, workers=3) as vec:
+        assert vec.workers == 3
+        shared = _run(vec, steps)
+    assert np.array_equal(shared[0], local[0])
+    for a, b in zip(shared[1:], local[1:], strict=True):
+        assert all(np.array_equal(x, y) for x, y in zip(a, b, strict=True))
+
+
+class TestEnv(unittest.TestCase):
+    def test_env(self) -> None:
+        test_env_follows_apply_move()
+
+    def test_win(self) -> None:
+        test_win_truncation_and_errors()
+
+    def test_vector(self) -> None:
+        test_vector_env_matches_single_envs_and_workers()
+
+
+if __name__ == "__main__":
+    unittest.main()
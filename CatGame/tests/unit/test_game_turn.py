@@ -1,5 +1,6 @@
 """Unit tests for apply_move: valid move, invalid move (obstacle/off-grid)."""
 
+import logging
 import unittest
 
 from catgame.game.turn import apply_move
@@ -40,6 +41,23 @@ def test_apply_move_invalid_direction_unchanged() -> None:
     assert "Invalid" in result.message or result.message
 
 
+def test_turn_logs_reach_logging_once_configured() -> None:
+    records: list[logging.LogRecord] = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger("catgame.game.turn")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        apply_move(create_game(seed=100), "up")
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+    # Attributed to the line in turn.py that logged, not to the lazy logger
+    assert records and records[0].name == "catgame.game.turn"
+    assert records[0].pathname.endswith("turn.py")
+
+
 class TestApplyMove(unittest.TestCase):
     def test_valid_updates_cat_and_mouse(self) -> None:
         test_apply_move_valid_updates_cat_and_mouse()
@@ -50,6 +68,9 @@ class TestApplyMove(unittest.TestCase):
     def test_invalid_obstacle_unchanged(self) -> None:
         test_apply_move_invalid_obstacle_unchanged_state()
 
+    def test_logging(self) -> None:
+        test_turn_logs_reach_logging_once_configured()
+
 
 if __name__ == "__main__":
     unittest.main()
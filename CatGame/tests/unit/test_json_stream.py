@@ -0,0 +1,106 @@
+"""Unit tests for the --json line stream: ordered full states, deltas that rebuild them,
+compact cells.
+"""
+
+import io
+import json
+import random
+import unittest
+from contextlib import redirect_stdout
+
+import pytest
+
+from catgame.cli.stream import JsonStream
+from catgame.game.turn import apply_move
+from catgame.placement.placement import create_game
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _lines(stream: JsonStream, calls) -> list[dict]:
+    out = io.StringIO()
+    with redirect_stdout(out):
+        for method, state in calls:
+            getattr(stream, method)(state)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def _game(seed: int, moves: int, **options) -> list:
+    state = create_game(seed, **options)
+    states = [state]
+    rng = random.Random(seed)
+    for _ in range(moves):
+        result = apply_move(state, rng.choice(DIRECTIONS))
+        if result.success:
+            state = result.state
+            states.append(state)
+            if state.status == "won":
+                break
+    return states
+
+
+def _apply(view: dict, line: dict) -> dict:
+    """A client's view after one line: keyframes replace it, deltas patch it."""
+    if line["type"] == "keyframe":
+        view = {k: v for k, v in line.items() if k not in ("type", "seq")}
+        view["obstacles"] = {tuple(c) if isinstance(c, list) else c for c in view["obstacles"]}
+        return view
+    view = dict(view, turn=line["turn"], message=line.get("message", ""))
+    for key in ("cat", "mouse", "cats", "mice", "status"):
+        if key in line:
+            view[key] = line[key]
+    add = {tuple(c) if isinstance(c, list) else c for c in line.get("add", [])}
+    remove = {tuple(c) if isinstance(c, list) else c for c in line.get("remove", [])}
+    assert not add & view["obstacles"] and remove <= view["obstacles"]
+    view["obstacles"] = (view["obstacles"] - remove) | add
+    return view
+
+
+def test_deltas_rebuild_every_state() -> None:
+    for options in ({}, {"rows": 10, "cols": 12, "cats": 2, "mice": 3}):
+        for compact in (False, True):
+            for seed in range(4):
+                states = _game(seed, 300, **options)
+                full = _lines(JsonStream("delta", compact), [("keyframe", s) for s in states])
+                events = [("keyframe", states[0])] + [("update", s) for s in states[1:]]
+                lines = _lines(JsonStream("delta", compact), events)
+                assert [line["seq"] for line in lines] == list(range(len(states)))
+                assert all(line["type"] == "delta" for line in lines[1:])
+                view = None
+                for line, expected in zip(lines, full, strict=True):
+                    view = _apply(view, line)
+                    assert view == _apply(None, expected)
+                # On the default board deltas are much smaller than full states
+                if not options:
+                    size = sum(map(len, map(json.dumps, lines)))
+                    assert size < sum(map(len, map(json.dumps, full))) / 5
+
+
+def test_full_mode_is_ordered_and_stable() -> None:
+    state = create_game(11)
+    plain, again = _lines(JsonStream(), [("keyframe", state), ("update", state)])
+    assert plain == again and "type" not in plain and "seq" not in plain
+    assert plain["obstacles"] == sorted(plain["obstacles"])
+    assert len(plain["obstacles"]) == state.grid.bits.bit_count()
+    (compact,) = _lines(JsonStream(compact=True), [("keyframe", state)])
+    cols = state.grid.width
+    assert compact["obstacles"] == [r * cols + c for r, c in plain["obstacles"]]
+    assert compact["cat"] == state.cat.position.row * cols + state.cat.position.col
+    out = io.StringIO()
+    with redirect_stdout(out):
+        JsonStream(compact=True).keyframe(state)
+    assert " " not in out.getvalue()
+    with pytest.raises(ValueError):
+        JsonStream("diff")
+
+
+class TestJsonStream(unittest.TestCase):
+    def test_deltas(self) -> None:
+        test_deltas_rebuild_every_state()
+
+    def test_full(self) -> None:
+        test_full_mode_is_ordered_and_stable()
+
+
+if __name__ == "__main__":
+    unittest.main()
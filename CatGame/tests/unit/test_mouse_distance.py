@@ -0,0 +1,175 @@
+"""Unit tests for the obstacle-aware mouse: distance fields, their cache and repair, and the bfs
+mode.
+"""
+
+import random
+import unittest
+
+import pytest
+
+from catgame.game.turn import apply_move
+from catgame.models import COLS, ROWS, Cat, GameState, Grid, Mouse, Position
+from catgame.models.bitboard import geometry
+from catgame.mouse_ai.ai import choose_mouse_move
+from catgame.mouse_ai.distance import DistanceCache, DistanceField
+from catgame.placement.placement import create_game
+
+
+def _bfs(free: int, source: int) -> dict[int, int]:
+    """Reference BFS over the free cells: {cell: distance} for every reachable cell."""
+    geo = geometry()
+    free |= 1 << source
+    dist = {source: 0}
+    frontier = [source]
+    while frontier:
+        nxt = []
+        for j in frontier:
+            for bit, nj in geo.neighbors[j]:
+                if free & bit and nj not in dist:
+                    dist[nj] = dist[j] + 1
+                    nxt.append(nj)
+        frontier = nxt
+    return dist
+
+
+def _check(field: DistanceField, free: int) -> None:
+    expected = _bfs(free, field.source)
+    for j in range(field.geometry.size):
+        assert field.distance(j) == expected.get(j), j
+
+
+def test_field_matches_bfs() -> None:
+    geo = geometry()
+    rng = random.Random(3)
+    for _ in range(5):
+        blocked = sum(1 << j for j in rng.sample(range(geo.size), 120))
+        source = rng.choice([j for j in range(geo.size) if not (blocked >> j) & 1])
+        _check(DistanceField(geo, geo.full & ~blocked, source), geo.full & ~blocked)
+
+
+def test_repair_matches_fresh_field() -> None:
+    geo = geometry()
+    rng = random.Random(11)
+    blocked = sum(1 << j for j in rng.sample(range(geo.size), 100))
+    source = next(j for j in range(geo.size) if not (blocked >> j) & 1)
+    field = DistanceField(geo, geo.full & ~blocked, source)
+    for step in range(200):
+        # Queries grow the field part way before the layout changes, as in play
+        field.distance(rng.randrange(geo.size))
+        for _ in range(rng.randint(1, 3)):
+            j = rng.randrange(geo.size)
+            if j != source:
+                blocked ^= 1 << j
+        field = field.repaired(geo.full & ~blocked)
+        if step % 20 == 0:
+            _check(field, geo.full & ~blocked)
+    _check(field, geo.full & ~blocked)
+
+
+def test_repair_reopens_exhausted_field() -> None:
+    # Cell 0 opens next to the last layer of an exhausted field: it must still be grown into
+    geo = geometry(5, 2)
+    field = DistanceField(geo, geo.full & ~0b1010011010, 2)
+    for j in range(geo.size):
+        field.distance(j)
+    assert field.done
+    free = geo.full & ~0b1010011000
+    assert field.repaired(free).distance(1) == DistanceField(geo, free, 2).distance(1) == 2
+
+
+def test_repair_matches_fresh_field_small_boards() -> None:
+    rng = random.Random(5)
+    for _ in range(300):
+        geo = geometry(rng.randint(2, 6), rng.randint(2, 6))
+        old = rng.getrandbits(geo.size)
+        new = old ^ sum(1 << j for j in rng.sample(range(geo.size), rng.randint(1, 3)))
+        source = rng.randrange(geo.size)
+        field = DistanceField(geo, geo.full & ~old, source)
+        for _ in range(rng.randint(0, geo.size)):
+            field.distance(rng.randrange(geo.size))
+        repaired = field.repaired(geo.full & ~new)
+        fresh = DistanceField(geo, geo.full & ~new, source)
+        for j in range(geo.size):
+            assert repaired.distance(j) == fresh.distance(j), (old, new, source, j)
+
+
+def test_cache_hits_repairs_and_evicts() -> None:
+    cache = DistanceCache(maxsize=2)
+    grid = Grid({Position(0, 1)})
+    field = cache.field(grid, 0)
+    assert cache.field(Grid.from_bits(grid.bits), 0) is field and cache.hits == 1
+    moved = grid.with_obstacles(grid.bits ^ (1 << 1) ^ (1 << COLS))
+    assert moved.zobrist == Grid.from_bits(moved.bits).zobrist
+    repaired = cache.field(moved, 0)
+    assert cache.repairs == 1 and repaired.distance(1) == 1
+    _check(repaired, moved.geometry.full & ~moved.bits)
+    cache.field(grid, 5)
+    cache.field(grid, 6)
+    assert len(cache._fields) == 2
+    assert cache.field(grid, 0) is not field
+
+
+def test_cache_cell_budget_evicts_and_forgets_bases() -> None:
+    grid = Grid(set())
+    geo = grid.geometry
+    cache = DistanceCache(max_cells=10 * geo.size)
+    far = cache.field(grid, 0)
+    assert far.distance(geo.size - 1) == ROWS + COLS - 2
+    # The grown field is charged on the next call, which pushes it out of the budget
+    cache.field(grid, 1)
+    assert list(cache._fields) == [(grid.zobrist, 1)] and cache._cells == geo.size
+    assert 0 not in cache._latest and cache.field(grid, 0) is not far
+
+
+def test_bfs_mouse_measures_paths_around_walls() -> None:
+    # Row 1 is a wall with a single gap at the far right: the cat, just below the mouse,
+    # must walk all the way round. Manhattan flees right (toward the gap and the cat's
+    # path); bfs sees that (0, 0) is the far end of the detour.
+    wall = {Position(1, c) for c in range(COLS - 1)}
+    grid = Grid(wall)
+    cat = Cat(Position(2, 0))
+    mouse = Mouse(Position(0, 1))
+    manhattan = GameState(grid, cat, mouse, seed=0, status="playing")
+    bfs = GameState(grid, cat, mouse, seed=0, status="playing", mouse_ai="bfs")
+    assert choose_mouse_move(manhattan) == Position(0, 2)
+    assert choose_mouse_move(bfs) == Position(0, 0)
+
+
+def test_bfs_mode_is_threaded_through_turns() -> None:
+    state = create_game(4, mouse_ai="bfs")
+    assert state.mouse_ai == "bfs"
+    for direction in ["up", "left", "down", "right"] * 10:
+        result = apply_move(state, direction)
+        if result.success:
+            state = result.state
+        assert state.mouse_ai == "bfs"
+    with pytest.raises(ValueError):
+        create_game(4, mouse_ai="nope")
+
+
+class TestMouseDistance(unittest.TestCase):
+    def test_budget(self) -> None:
+        test_cache_cell_budget_evicts_and_forgets_bases()
+
+    def test_field(self) -> None:
+        test_field_matches_bfs()
+
+    def test_repair(self) -> None:
+        test_repair_matches_fresh_field()
+
+    def test_repair_exhausted(self) -> None:
+        test_repair_reopens_exhausted_field()
+        test_repair_matches_fresh_field_small_boards()
+
+    def test_cache(self) -> None:
+        test_cache_hits_repairs_and_evicts()
+
+    def test_walls(self) -> None:
+        test_bfs_mouse_measures_paths_around_walls()
+
+    def test_threading(self) -> None:
+        test_bfs_mode_is_threaded_through_turns()
+
+
+if __name__ == "__main__":
+    unittest.main()
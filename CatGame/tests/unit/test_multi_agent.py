@@ -0,0 +1,191 @@
+"""Unit tests for games with several cats and mice: occupancy index, placement, turns, rendering."""
+
+import random
+import unittest
+
+import pytest
+
+from catgame.cli.render import agent_cells, dirty_cells, render_grid
+from catgame.game.moves import get_valid_moves
+from catgame.game.turn import WIN_ALL_MESSAGE, WIN_MESSAGE, apply_move
+from catgame.models import Cat, GameState, Grid, Mouse, Position
+from catgame.models.bitboard import geometry
+from catgame.models.occupancy import CAT, MOUSE, Occupancy
+from catgame.placement.placement import create_game
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def _state(
+    rows: int, cols: int, cats: tuple[int, ...], mice: tuple[int, ...], obstacles=()
+) -> GameState:
+    grid = Grid({Position(*divmod(j, cols)) for j in obstacles}, rows=rows, cols=cols)
+    positions = grid.geometry.positions
+    return GameState(
+        grid, Cat(positions[cats[0]]), Mouse(positions[mice[0]]), seed=0, status="playing",
+        occupancy=Occupancy(grid.geometry, cats, mice),
+    )
+
+
+def test_nearest_cat_matches_scan() -> None:
+    rng = random.Random(5)
+    for rows, cols, n_cats in [(1, 40, 3), (30, 30, 1), (50, 70, 40), (64, 64, 400)]:
+        geo = geometry(rows, cols)
+        cats = tuple(rng.sample(range(geo.size), n_cats))
+        occupancy = Occupancy(geo, cats, ())
+        for _ in range(60):
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            near = occupancy.cats_near(row, col, 1)
+            for dr, dc in ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)):
+                r, c = row + dr, col + dc
+                scan = min(abs(j // cols - r) + abs(j % cols - c) for j in cats)
+                assert min(abs(cr - r) + abs(cc - c) for cr, cc in near) == scan
+            nearest = min(abs(j // cols - row) + abs(j % cols - col) for j in cats)
+            assert occupancy.nearest_cat(row, col) == nearest
+    with pytest.raises(ValueError):
+        Occupancy(geometry(3, 3), (1, 1), ())
+    with pytest.raises(ValueError):
+        Occupancy(geometry(3, 3), (1,), (1,))
+
+
+def test_create_game_places_every_agent() -> None:
+    for seed in range(10):
+        state = create_game(seed, rows=30, cols=40, cats=5, mice=20)
+        occupancy = state.occupancy
+        geo = state.grid.geometry
+        conn = state.grid.connectivity
+        assert len(occupancy.cats) == 5 and len(occupancy.mice) == 20 and len(occupancy.cells) == 25
+        assert state.cat.position == geo.positions[occupancy.cats[0]]
+        assert state.mouse.position == geo.positions[occupancy.mice[0]]
+        assert len({conn.component(j) for j in occupancy.cells}) == 1
+        assert conn.component(occupancy.cats[0]) >= 0
+        for j in occupancy.mice:
+            assert any(
+                not state.grid.bits & bit and n not in occupancy.cells
+                for bit, n in geo.neighbors[j]
+            )
+        again = create_game(seed, rows=30, cols=40, cats=5, mice=20)
+        assert (again.occupancy.cats, again.occupancy.mice) == (occupancy.cats, occupancy.mice)
+    assert create_game(3).occupancy is None
+    with pytest.raises(ValueError):
+        create_game(0, rows=3, cols=3, cats=4, mice=4)
+    with pytest.raises(ValueError):
+        create_game(0, cats=0)
+
+
+def test_one_of_each_replays_classic_game() -> None:
+    for mode in ("manhattan", "bfs"):
+        for seed in range(8):
+            classic = create_game(seed, mode)
+            geo = classic.grid.geometry
+            occupancy = Occupancy(
+                geo, (geo.index(classic.cat.position),), (geo.index(classic.mouse.position),)
+            )
+            indexed = GameState(
+                classic.grid, classic.cat, classic.mouse, seed, "playing",
+                mouse_ai=mode, occupancy=occupancy,
+            )
+            assert indexed.key == classic.key
+            rng = random.Random(seed)
+            for _ in range(80):
+                direction = rng.choice(DIRECTIONS)
+                a, b = apply_move(classic, direction), apply_move(indexed, direction)
+                assert a.success == b.success
+                classic, indexed = a.state, b.state
+                assert (
+                    classic.cat, classic.mouse, classic.status, classic.grid.bits, classic.key
+                ) == (indexed.cat, indexed.mouse, indexed.status, indexed.grid.bits, indexed.key)
+                if classic.status == "won":
+                    break
+
+
+def test_cats_move_together_and_catch() -> None:
+    # 1 x 8 board: cats on 0 and 1 move right as a line; the mouse flees to the wall and is boxed in
+    state = _state(1, 8, (0, 1), (5,))
+    result = apply_move(state, "right")
+    assert result.success
+    assert result.state.occupancy.cats == (1, 2) and result.state.occupancy.mice == (6,)
+    # Blocked by the left edge: no cat can step
+    assert not apply_move(state, "left").success
+    state = result.state
+    for _ in range(3):
+        state = apply_move(state, "right").state
+    assert state.status == "playing" and state.occupancy.mice == (7,)
+    state = apply_move(state, "right").state
+    assert state.status == "won" and state.message == WIN_MESSAGE and state.occupancy.caught == 1
+    assert state.mouse.position == Position(0, 7)
+    # Two mice: the cat lands on one; the other's only way out is under the cat
+    state = _state(2, 3, (0,), (1, 5), obstacles=(2,))
+    result = apply_move(state, "right")
+    assert result.state.occupancy.caught == 1 and result.state.occupancy.mice == (4,)
+    won = apply_move(result.state, "down").state
+    assert won.status == "won" and won.message == WIN_ALL_MESSAGE and won.occupancy.caught == 2
+    # Mice move in agent order and see earlier moves: the one at 3 is boxed in by the one at 2,
+    # which then escapes into the cell the first one was caught on
+    state = _state(1, 4, (0,), (1, 3, 2))
+    state = apply_move(state, "right").state
+    assert (state.occupancy.cats, state.occupancy.mice, state.occupancy.caught) == ((1,), (3,), 2)
+    state = apply_move(state, "right").state
+    assert state.status == "won" and state.message == WIN_ALL_MESSAGE
+    assert state.occupancy.caught == 3
+
+
+def test_many_agents_keep_invariants() -> None:
+    state = create_game(2, rows=40, cols=50, cats=15, mice=60)
+    rng = random.Random(2)
+    for _ in range(150):
+        result = apply_move(state, rng.choice(DIRECTIONS))
+        if not result.success:
+            continue
+        prev, state = state, result.state
+        occupancy = state.occupancy
+        geo = state.grid.geometry
+        conn = state.grid.connectivity
+        assert len(occupancy.cats) == 15 and len(occupancy.mice) + occupancy.caught == 60
+        assert set(occupancy.cells) == set(occupancy.cats) | set(occupancy.mice)
+        assert all(not state.grid.bits >> j & 1 for j in occupancy.cells)
+        roots = {conn.component(j) for j in occupancy.cats}
+        assert all(conn.component(j) in roots for j in occupancy.mice)
+        assert state.key == GameState(
+            state.grid, state.cat, state.mouse, state.seed, state.status, occupancy=occupancy
+        ).key
+        # Repaint list covers every cell whose text changed
+        before, after = render_grid(prev).replace("\n", ""), render_grid(state).replace("\n", "")
+        assert [j for j in range(geo.size) if before[j] != after[j]] == [
+            j for j in dirty_cells(prev, state) if before[j] != after[j]
+        ]
+        if state.status == "won":
+            break
+
+
+def test_render_and_moves_see_every_agent() -> None:
+    state = _state(2, 4, (0, 3), (5, 6), obstacles=(4,))
+    assert render_grid(state).split("\n") == ["C\N{full block}\N{full block}C", "#MM\N{full block}"]
+    assert agent_cells(state) == {0: CAT, 3: CAT, 5: MOUSE, 6: MOUSE}
+    # The lead mouse (on 5) is hemmed in by the obstacle and the other mouse; the lead cat is free
+    assert get_valid_moves(state, "mouse") == [Position(0, 1)]
+    assert get_valid_moves(state, "cat") == [Position(0, 1)]
+
+
+class TestMultiAgent(unittest.TestCase):
+    def test_nearest(self) -> None:
+        test_nearest_cat_matches_scan()
+
+    def test_placement(self) -> None:
+        test_create_game_places_every_agent()
+
+    def test_classic(self) -> None:
+        test_one_of_each_replays_classic_game()
+
+    def test_turns(self) -> None:
+        test_cats_move_together_and_catch()
+
+    def test_invariants(self) -> None:
+        test_many_agents_keep_invariants()
+
+    def test_render(self) -> None:
+        test_render_and_moves_see_every_agent()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Unit tests for constructive placement: component labeling, bit selection, guarantees per seed."""
+
+import random
+import unittest
+
+from catgame.models import COLS, ROWS
+from catgame.models.bitboard import geometry
+from catgame.placement.placement import _nth_bit, create_game
+
+
+def test_components_partition_free_cells() -> None:
+    geo = geometry()
+    rng = random.Random(3)
+    for _ in range(20):
+        blocked = 0
+        for j in rng.sample(range(geo.size), 250):
+            blocked |= 1 << j
+        free = geo.full & ~blocked
+        comps = geo.components(free)
+        union = 0
+        for comp in comps:
+            assert not union & comp
+            union |= comp
+            low = comp & -comp
+            assert geo.flood(low, free) == comp
+        assert union == free
+
+
+def test_touching_excludes_isolated_cells() -> None:
+    geo = geometry()
+    a = 1 << (5 * COLS + 5)
+    b = 1 << (5 * COLS + 6)
+    far = 1 << (10 * COLS + 10)
+    assert geo.touching(a | b | far) & (a | b | far) == a | b
+    assert geo.touching(1 << (COLS - 1)) & 1 << COLS == 0  # no wrap from row end to next row
+
+
+def test_nth_bit_matches_sorted_indices() -> None:
+    rng = random.Random(9)
+    for _ in range(300):
+        bits = rng.getrandbits(ROWS * COLS) | 1
+        indices = [i for i in range(ROWS * COLS) if bits >> i & 1]
+        k = rng.randrange(len(indices))
+        assert _nth_bit(bits, k) == indices[k]
+
+
+def test_every_seed_is_playable_and_deterministic() -> None:
+    for seed in range(2000):
+        state = create_game(seed)
+        blocked, cat, mouse = state.grid.bits, state.cat.position, state.mouse.position
+        geo = state.grid.geometry
+        assert cat != mouse
+        assert not state.grid.is_blocked(cat) and not state.grid.is_blocked(mouse)
+        assert geo.neighbor_mask[geo.index(cat)] & ~(blocked | geo.bit(mouse))
+        assert geo.neighbor_mask[geo.index(mouse)] & ~(blocked | geo.bit(cat))
+        assert geo.connected(geo.index(cat), geo.index(mouse), blocked)
+        assert ROWS * COLS // 10 <= blocked.bit_count() <= ROWS * COLS // 5
+    again = create_game(1234)
+    assert (again.grid.bits, again.cat, again.mouse) == (
+        create_game(1234).grid.bits, create_game(1234).cat, create_game(1234).mouse,
+    )
+
+
+class TestPlacement(unittest.TestCase):
+    def test_components(self) -> None:
+        test_components_partition_free_cells()
+
+    def test_touching(self) -> None:
+        test_touching_excludes_isolated_cells()
+
+    def test_nth_bit(self) -> None:
+        test_nth_bit_matches_sorted_indices()
+
+    def test_playable(self) -> None:
+        test_every_seed_is_playable_and_deterministic()
+
+
+if __name__ == "__main__":
+    unittest.main()
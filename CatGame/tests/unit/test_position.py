@@ -0,0 +1,72 @@
+"""Unit tests for Position interning: canonical instances, hash/eq, adjacency table."""
+
+import unittest
+
+import pytest
+
+from catgame.models import COLS, ROWS, Grid, Position
+from catgame.models.bitboard import geometry
+from catgame.placement.placement import create_game
+
+
+def test_at_returns_canonical_instance() -> None:
+    p = Position.at(3, 4)
+    assert p is Position.at(3, 4)
+    assert p == Position(3, 4) and hash(p) == hash(Position(3, 4))
+    assert geometry().positions[3 * COLS + 4] is p
+    assert Position.at(ROWS - 1, COLS - 1) == Position(ROWS - 1, COLS - 1)
+
+
+def test_constructor_still_validates() -> None:
+    with pytest.raises(ValueError):
+        Position(-1, 0)
+    with pytest.raises(ValueError):
+        Position(0, -1)
+    # Upper bounds belong to the board: a cell past the default board is fine on a bigger one
+    with pytest.raises(ValueError):
+        Grid({Position(ROWS, 0)})
+    assert Grid({Position(ROWS, 0)}, rows=ROWS + 1).in_bounds(Position(ROWS, 0))
+
+
+def test_eq_and_hash_distinguish_cells() -> None:
+    assert Position(1, 2) != Position(2, 1)
+    assert Position(1, 2) != (1, 2)
+    cells = {Position(r, c) for r in range(ROWS) for c in range(COLS)}
+    assert len(cells) == ROWS * COLS
+    assert Position.at(5, 6) in cells
+
+
+def test_adjacent_matches_bounds() -> None:
+    assert Position.at(0, 0).adjacent() == (Position(1, 0), Position(0, 1))
+    assert Position.at(5, 5).adjacent() == (
+        Position(4, 5), Position(6, 5), Position(5, 4), Position(5, 6),
+    )
+    for p in Position.at(ROWS - 1, COLS - 1).adjacent():
+        assert p.manhattan_distance(Position(ROWS - 1, COLS - 1)) == 1
+
+
+def test_create_game_uses_interned_positions() -> None:
+    state = create_game(11)
+    for p in state.grid.obstacles:
+        assert p is Position.at(p.row, p.col)
+
+
+class TestPosition(unittest.TestCase):
+    def test_at(self) -> None:
+        test_at_returns_canonical_instance()
+
+    def test_validates(self) -> None:
+        test_constructor_still_validates()
+
+    def test_eq_hash(self) -> None:
+        test_eq_and_hash_distinguish_cells()
+
+    def test_adjacent(self) -> None:
+        test_adjacent_matches_bounds()
+
+    def test_create_game(self) -> None:
+        test_create_game_uses_interned_positions()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Unit tests for the event-driven pygame loop: blocking wait, draining, idle timeout, ranked
+games.
+"""
+
+import os
+import time
+import unittest
+
+import pytest
+
+
+def _pygame():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from catgame.gui import pygame_ui
+
+    pygame.display.init()
+    pygame.display.set_mode((64, 64))
+    pygame.event.clear()
+    return pygame, pygame_ui
+
+
+def test_wait_events_times_out_empty() -> None:
+    pygame, pygame_ui = _pygame()
+    start = time.perf_counter()
+    assert pygame_ui._wait_events(50) == []
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_wait_events_drains_queue() -> None:
+    pygame, pygame_ui = _pygame()
+    for key in (pygame.K_d, pygame.K_s, pygame.K_a):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=""))
+    events = pygame_ui._wait_events(1000)
+    keys = [e.key for e in events if e.type == pygame.KEYDOWN]
+    assert keys == [pygame.K_d, pygame.K_s, pygame.K_a]
+    assert pygame_ui._wait_events(10) == []
+
+
+def test_blocked_events_do_not_wake() -> None:
+    pygame, pygame_ui = _pygame()
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(pygame_ui._WAKE_EVENTS)
+    try:
+        pygame.event.post(
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0))
+        )
+        assert pygame_ui._wait_events(20) == []
+    finally:
+        pygame.event.set_allowed(None)
+
+
+def test_only_default_games_are_ranked() -> None:
+    _, pygame_ui = _pygame()
+    from catgame.models import COLS, ROWS
+
+    assert pygame_ui._ranked("manhattan", ROWS, COLS, 1, 1)
+    others = [("bfs", ROWS, COLS, 1, 1), ("manhattan", 5, 5, 1, 1), ("manhattan", ROWS, COLS, 3, 1)]
+    for settings in others:
+        assert not pygame_ui._ranked(*settings)
+
+
+class TestPygameEvents(unittest.TestCase):
+    def test_timeout(self) -> None:
+        test_wait_events_times_out_empty()
+
+    def test_drain(self) -> None:
+        test_wait_events_drains_queue()
+
+    def test_blocked(self) -> None:
+        test_blocked_events_do_not_wake()
+
+    def test_ranked(self) -> None:
+        test_only_default_games_are_ranked()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for incremental rendering: dirty cell diff, single-cell text, pygame sprites and
+dirty repaint.
+"""
+
+import os
+import random
+import unittest
+
+import pytest
+
+from catgame.cli.render import dirty_cells, render_cell, render_grid
+from catgame.game.turn import apply_move
+from catgame.models import COLS, ROWS
+from catgame.placement.placement import create_game
+
+
+def _states(seed: int, turns: int) -> list:
+    """A played game (random cat moves, including reshuffles), first state included."""
+    rng = random.Random(seed)
+    states = [create_game(seed)]
+    while len(states) <= turns and states[-1].status == "playing":
+        result = apply_move(states[-1], rng.choice(["up", "down", "left", "right"]))
+        if result.success:
+            states.append(result.state)
+    return states
+
+
+def _cells(state, use_emoji: bool = False) -> list[str]:
+    return [render_cell(state, i, use_emoji) for i in range(ROWS * COLS)]
+
+
+def test_render_cell_matches_render_grid() -> None:
+    for state in _states(4, 30):
+        for use_emoji in (False, True):
+            rows = ["".join(_cells(state, use_emoji)[r * COLS:(r + 1) * COLS]) for r in range(ROWS)]
+            assert "\n".join(rows) == render_grid(state, use_emoji)
+
+
+def test_dirty_cells_cover_every_change() -> None:
+    states = _states(9, 200)
+    assert dirty_cells(None, states[0]) == list(range(ROWS * COLS))
+    assert dirty_cells(states[0], states[0]) == []
+    for prev, state in zip(states, states[1:]):
+        dirty = dirty_cells(prev, state)
+        assert dirty == sorted(dirty)
+        before, after = _cells(prev), _cells(state)
+        changed = [i for i in range(ROWS * COLS) if before[i] != after[i]]
+        assert set(changed) <= set(dirty)
+        # Only cat, mouse and reshuffled obstacles: never a wholesale repaint
+        assert len(dirty) <= 4 + (prev.grid.bits ^ state.grid.bits).bit_count()
+
+
+def _pygame():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from catgame.gui import pygame_ui
+
+    return pygame, pygame_ui
+
+
+def _frame(pygame, pygame_ui, cell_size: int):
+    surface = pygame.Surface((COLS * cell_size + 1, ROWS * cell_size + 1))
+    surface.fill(pygame_ui.COLOR_EMPTY)
+    return surface
+
+
+def test_pygame_dirty_repaint_matches_full_redraw() -> None:
+    pygame, pygame_ui = _pygame()
+    states = _states(2, 80)
+    for cell_size in (pygame_ui.MIN_CELL_SIZE, pygame_ui.CELL_SIZE):
+        atlas = pygame_ui.sprite_atlas(cell_size)
+        incremental = _frame(pygame, pygame_ui, cell_size)
+        pygame_ui._draw_grid(incremental, states[0], atlas)
+        for prev, state in zip(states, states[1:]):
+            pygame_ui._draw_dirty(incremental, prev, state, atlas)
+            full = _frame(pygame, pygame_ui, cell_size)
+            pygame_ui._draw_grid(full, state, atlas)
+            assert pygame.image.tobytes(incremental, "RGB") == pygame.image.tobytes(full, "RGB")
+
+
+def test_sprite_atlas_matches_primitives_at_every_size() -> None:
+    pygame, pygame_ui = _pygame()
+    states = _states(6, 10)
+    for cell_size in (pygame_ui.MIN_CELL_SIZE, 20, pygame_ui.CELL_SIZE, 41):
+        atlas = pygame_ui.sprite_atlas(cell_size)
+        assert atlas.cell_size == cell_size
+        assert pygame_ui.sprite_atlas(cell_size) is atlas
+        for state in states:
+            cached = _frame(pygame, pygame_ui, cell_size)
+            pygame_ui._draw_grid(cached, state, atlas)
+            direct = _frame(pygame, pygame_ui, cell_size)
+            pygame_ui._draw_grid_uncached(direct, state, cell_size)
+            assert pygame.image.tobytes(cached, "RGB") == pygame.image.tobytes(direct, "RGB")
+
+
+def test_cell_size_follows_window() -> None:
+    _, pygame_ui = _pygame()
+    default = pygame_ui._cell_size_for(pygame_ui.WINDOW_WIDTH, pygame_ui.WINDOW_HEIGHT)
+    assert default == pygame_ui.CELL_SIZE
+    assert pygame_ui._cell_size_for(COLS * 40, ROWS * 40 + pygame_ui.STATUS_HEIGHT) == 40
+    assert pygame_ui._cell_size_for(10, 10) == pygame_ui.MIN_CELL_SIZE
+
+
+class TestRenderDiff(unittest.TestCase):
+    def test_render_cell(self) -> None:
+        test_render_cell_matches_render_grid()
+
+    def test_dirty_cells(self) -> None:
+        test_dirty_cells_cover_every_change()
+
+    def test_pygame_dirty_repaint(self) -> None:
+        test_pygame_dirty_repaint_matches_full_redraw()
+
+    def test_sprite_atlas(self) -> None:
+        test_sprite_atlas_matches_primitives_at_every_size()
+
+    def test_cell_size(self) -> None:
+        test_cell_size_follows_window()
+
+
+if __name__ == "__main__":
+    unittest.main()
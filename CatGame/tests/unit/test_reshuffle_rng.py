@@ -0,0 +1,127 @@
+"""Unit tests for seed-scoped randomness: reshuffle and apply_move are pure functions of state."""
+
+import random
+import unittest
+
+from catgame.game.turn import apply_move
+from catgame.models import COLS, ROWS, Cat, GameState, Grid, Mouse, Position
+from catgame.placement.placement import (
+    RESHUFFLE_MAX,
+    RESHUFFLE_PROB,
+    create_game,
+    maybe_reshuffle_obstacles,
+)
+from catgame.placement.rng import TurnRng
+from catgame.sim.policies import bfs_policy
+
+
+def _play(seed: int, turns: int) -> list[GameState]:
+    rng = random.Random(0)
+    state = create_game(seed)
+    states = [state]
+    for _ in range(turns):
+        direction = bfs_policy(state, rng)
+        if direction is None or state.status != "playing":
+            break
+        state = apply_move(state, direction).state
+        states.append(state)
+    return states
+
+
+def test_turn_rng_is_pure_function_of_seed_and_turn() -> None:
+    a = TurnRng(42, 7)
+    b = TurnRng(42, 7)
+    assert [a.next64() for _ in range(5)] == [b.next64() for _ in range(5)]
+    assert TurnRng(42, 8).next64() != TurnRng(42, 7).next64()
+    r = TurnRng(1, 1)
+    assert all(0.0 <= r.random() < 1.0 for _ in range(100))
+    assert all(1 <= r.randint(1, 3) <= 3 for _ in range(100))
+
+
+def test_games_replay_identically() -> None:
+    first = _play(11, 120)
+    random.seed(999)  # global RNG state must not matter
+    second = _play(11, 120)
+    assert len(first) == len(second)
+    for s1, s2 in zip(first, second):
+        assert s1.turn == s2.turn
+        assert s1.cat.position == s2.cat.position
+        assert s1.mouse.position == s2.mouse.position
+        assert s1.grid.bits == s2.grid.bits
+    assert [s.turn for s in first] == list(range(len(first)))
+
+
+def test_reshuffle_leaves_global_rng_untouched() -> None:
+    state = create_game(12)
+    before = random.getstate()
+    for turn in range(50):
+        probe = GameState(state.grid, state.cat, state.mouse, state.seed, "playing", turn=turn)
+        maybe_reshuffle_obstacles(probe)
+    assert random.getstate() == before
+
+
+def test_reshuffle_moves_obstacles_and_keeps_count() -> None:
+    state = create_game(13)
+    moved = 0
+    for turn in range(200):
+        probe = GameState(state.grid, state.cat, state.mouse, state.seed, "playing", turn=turn)
+        out = maybe_reshuffle_obstacles(probe)
+        if out is probe:
+            continue
+        moved += 1
+        assert out.grid.bits.bit_count() == state.grid.bits.bit_count()
+        assert 0 < (out.grid.bits & ~state.grid.bits).bit_count() <= RESHUFFLE_MAX
+        assert not out.grid.is_blocked(state.cat.position)
+        assert not out.grid.is_blocked(state.mouse.position)
+        assert out.turn == turn
+    assert 10 < moved < 80  # RESHUFFLE_PROB = 0.2 of 200 turns
+
+
+_WALL = {Position(r, 15) for r in range(ROWS) if r != 10}
+_FILLER = {Position(r, c) for r in range(ROWS) for c in (*range(5), *range(COLS - 5, COLS))}
+_WALLED_GRID = Grid(_WALL | _FILLER)
+
+
+def walled_state(turn: int) -> GameState:
+    """Cat and mouse on either side of a wall down column 15 with one gap at row 10.
+    Filler obstacles in the outer columns make most reshuffles lift something other than the wall.
+    """
+    return GameState(
+        _WALLED_GRID, Cat(Position(10, 12)), Mouse(Position(10, 20)), seed=7, status="playing",
+        turn=turn,
+    )
+
+
+def test_reshuffle_keeps_cat_and_mouse_connected() -> None:
+    dropped = 0
+    for turn in range(8000):
+        state = walled_state(turn)
+        after = maybe_reshuffle_obstacles(state)
+        assert after.grid.geometry.connected(10 * COLS + 12, 10 * COLS + 20, after.grid.bits)
+        assert after.grid.connectivity.connected(10 * COLS + 12, 10 * COLS + 20)
+        if after is state and TurnRng(state.seed, turn).random() < RESHUFFLE_PROB:
+            dropped += 1
+    # Some reshuffles plug the gap; those are dropped rather than applied
+    assert dropped > 0
+
+
+class TestReshuffleRng(unittest.TestCase):
+    def test_turn_rng(self) -> None:
+        test_turn_rng_is_pure_function_of_seed_and_turn()
+
+    def test_replay(self) -> None:
+        test_games_replay_identically()
+
+    def test_global_rng_untouched(self) -> None:
+        test_reshuffle_leaves_global_rng_untouched()
+
+    def test_reshuffle(self) -> None:
+        test_reshuffle_moves_obstacles_and_keeps_count()
+
+
+    def test_keeps_connected(self) -> None:
+        test_reshuffle_keeps_cat_and_mouse_connected()
+
+
+if __name__ == "__main__":
+    unittest.main()
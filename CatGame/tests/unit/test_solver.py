@@ -0,0 +1,128 @@
+"""Unit tests for the cat solver: proven values match brute force, table replacement, time
+and node budgets.
+"""
+
+import random
+import time
+import unittest
+
+import pytest
+
+from catgame.game.moves import DIRECTION_DELTA
+from catgame.game.turn import apply_move
+from catgame.models import Cat, GameState, Grid, Mouse, Position
+from catgame.placement.placement import create_game
+from catgame.solver import TranspositionTable, solve
+
+
+def _brute(state: GameState, depth: int) -> int | None:
+    """Fewest moves to win within depth by trying every line (the game is deterministic)."""
+    if state.status == "won":
+        return 0
+    if depth == 0:
+        return None
+    best = None
+    for direction in DIRECTION_DELTA:
+        result = apply_move(state, direction)
+        if result.success:
+            v = _brute(result.state, depth - 1)
+            if v is not None and (best is None or v + 1 < best):
+                best = v + 1
+    return best
+
+
+def _cornered(cat_col: int) -> GameState:
+    # Mouse in the top-left corner with the cell below it blocked: its only exit is right
+    grid = Grid({Position(1, 0)})
+    return GameState(
+        grid, Cat(Position(0, cat_col)), Mouse(Position(0, 0)), seed=0, status="playing"
+    )
+
+
+def test_cornered_mouse_par() -> None:
+    one = solve(_cornered(2), time_budget=None, max_depth=6)
+    assert one.proven and one.par == 1 and one.move == "left"
+    two = solve(_cornered(3), time_budget=None, max_depth=6)
+    assert two.proven and two.par == 2 and two.move == "left"
+    # Replaying the proven line wins in exactly par moves
+    state, moves = _cornered(3), 0
+    while state.status == "playing":
+        state = apply_move(state, solve(state, time_budget=None, max_depth=6).move).state
+        moves += 1
+    assert moves == 2
+    expected = solve(_cornered(2), time_budget=None, max_depth=6, mode="expectimax")
+    assert expected.proven and expected.value == 1
+
+
+def test_exact_mode_matches_brute_force() -> None:
+    rng = random.Random(7)
+    checked = 0
+    while checked < 40:
+        blocked = {Position(rng.randrange(20), rng.randrange(30)) for _ in range(200)}
+        cells = [
+            Position(r, c) for r in range(20) for c in range(30) if Position(r, c) not in blocked
+        ]
+        cat = rng.choice(cells)
+        near = [p for p in cells if 1 <= p.manhattan_distance(cat) <= 4]
+        if not near:
+            continue
+        state = GameState(
+            Grid(blocked), Cat(cat), Mouse(rng.choice(near)), seed=rng.randrange(1000),
+            status="playing",
+        )
+        expected = _brute(state, 4)
+        result = solve(state, time_budget=None, max_depth=4)
+        if expected is None:
+            assert not (result.proven and result.value <= 4)
+        else:
+            assert result.proven and result.par == expected
+        checked += 1
+
+
+def test_table_replacement() -> None:
+    table = TranspositionTable(4)
+    table.generation = 1
+    table.put(8, 0, depth=5, value=3, proven=False, move="up")
+    # Another position in the same slot, searched shallower: kept out
+    index = table._index(8, 0)
+    other = next(k for k in range(1000) if k != 8 and table._index(k, 0) == index)
+    table.put(other, 0, depth=2, value=4, proven=False, move="down")
+    assert table.get(8, 0)[3] == 3 and table.get(other, 0) is None
+    # Proven results always go in; an older generation is always replaced
+    table.put(other, 0, depth=1, value=4, proven=True, move="down")
+    assert table.get(other, 0)[4]
+    table.generation = 2
+    table.put(8, 0, depth=1, value=2, proven=False, move="left")
+    assert table.get(8, 0)[5] == "left"
+    with pytest.raises(ValueError):
+        TranspositionTable(3)
+
+
+def test_time_budget_is_respected() -> None:
+    state = create_game(3)
+    start = time.perf_counter()
+    result = solve(state, time_budget=0.05, max_depth=64)
+    assert time.perf_counter() - start < 1.0
+    assert result.move in DIRECTION_DELTA and result.depth >= 1 and not result.proven
+    # A node budget stops the search at the same point on every run
+    a, b = (solve(state, time_budget=None, max_nodes=2_000) for _ in range(2))
+    assert a.nodes < 2_000 + 256 and not a.proven
+    assert (a.move, a.value, a.depth, a.nodes) == (b.move, b.value, b.depth, b.nodes)
+
+
+class TestSolver(unittest.TestCase):
+    def test_cornered(self) -> None:
+        test_cornered_mouse_par()
+
+    def test_brute_force(self) -> None:
+        test_exact_mode_matches_brute_force()
+
+    def test_table(self) -> None:
+        test_table_replacement()
+
+    def test_budget(self) -> None:
+        test_time_budget_is_respected()
+
+
+if __name__ == "__main__":
+    unittest.main()
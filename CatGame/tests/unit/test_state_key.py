@@ -0,0 +1,70 @@
+"""Unit tests for Zobrist keys: incremental keys always equal keys computed from scratch."""
+
+import random
+import unittest
+
+from catgame.game.turn import apply_move
+from catgame.models import Cat, GameState, Grid, Mouse, Position
+from catgame.placement.placement import create_game
+
+
+def _fresh_key(state: GameState) -> int:
+    """Key of an equal state rebuilt from plain values (no inherited hashes)."""
+    rebuilt = GameState(
+        Grid.from_bits(state.grid.bits), Cat(state.cat.position), Mouse(state.mouse.position),
+        seed=state.seed, status=state.status,
+    )
+    return rebuilt.key
+
+
+def test_incremental_key_matches_fresh_key() -> None:
+    rng = random.Random(2)
+    reshuffles = 0
+    for seed in range(30):
+        state = create_game(seed)
+        state.key
+        for _ in range(300):
+            result = apply_move(state, rng.choice(("up", "down", "left", "right")))
+            if not result.success:
+                continue
+            if result.state.grid is not state.grid:
+                reshuffles += 1
+            state = result.state
+            # Carried over from the parent, not computed lazily
+            assert state._key is not None
+            assert state.key == _fresh_key(state)
+            if state.status == "won":
+                break
+    assert reshuffles > 50
+
+
+def test_key_distinguishes_positions_not_history() -> None:
+    grid = Grid({Position(3, 3)})
+    base = GameState(grid, Cat(Position(0, 0)), Mouse(Position(5, 5)), seed=1, status="playing")
+    # Seed, turn and message are history, not position
+    same = GameState(
+        Grid({Position(3, 3)}), Cat(Position(0, 0)), Mouse(Position(5, 5)), seed=9,
+        status="playing", turn=4,
+    )
+    assert base.key == same.key
+    swapped = GameState(grid, Cat(Position(5, 5)), Mouse(Position(0, 0)), seed=1, status="playing")
+    won = GameState(grid, Cat(Position(0, 0)), Mouse(Position(5, 5)), seed=1, status="won")
+    other_grid = GameState(
+        Grid({Position(3, 4)}), Cat(Position(0, 0)), Mouse(Position(5, 5)), seed=1,
+        status="playing",
+    )
+    keys = {base.key, swapped.key, won.key, other_grid.key}
+    assert len(keys) == 4
+    assert all(0 <= k < 1 << 64 for k in keys)
+
+
+class TestStateKey(unittest.TestCase):
+    def test_incremental(self) -> None:
+        test_incremental_key_matches_fresh_key()
+
+    def test_distinguishes(self) -> None:
+        test_key_distinguishes_positions_not_history()
+
+
+if __name__ == "__main__":
+    unittest.main()